@@ -23,6 +23,7 @@ from .charts import (
     PieChart,
     PolarAreaChart,
     RadarChart,
+    RenderPlan,
     SankeyChart,
     ScatterChart,
 )
@@ -31,7 +32,7 @@ from .charts.annotations import (
     LabelAnnotation,
     LineAnnotation,
 )
-from .data_loader import load_csv, load_data, load_json
+from .data_loader import load_columns, load_csv, load_data, load_json, stream_csv
 from .markdown import chart_to_data_url, chart_to_markdown, inline_svg
 from .themes import (
     ColorPalette,
@@ -81,6 +82,7 @@ __all__ = [
     "inline_svg",
     "InvalidDataError",
     "LineChart",
+    "load_columns",
     "load_csv",
     "load_data",
     "load_json",
@@ -90,10 +92,12 @@ __all__ = [
     "PolarAreaChart",
     "RadarChart",
     "RenderError",
+    "RenderPlan",
     "resolve_palette",
     "SankeyChart",
     "ScatterChart",
     "SeriesStyle",
+    "stream_csv",
     "Theme",
     "ColorPalette",
     "register_theme",
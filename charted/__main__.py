@@ -35,7 +35,9 @@ def main(args: Sequence[str] | None = None) -> None:
         ],
     )
     create_parser.add_argument("output", help="Output SVG file path")
-    create_parser.add_argument("--data", "-d", help="Data file (CSV or JSON)")
+    create_parser.add_argument(
+        "--data", "-d", help="Data file (CSV, JSON, .npy/.npz, Arrow or Parquet)"
+    )
     create_parser.add_argument("--config", "-c", help="Config file path")
     create_parser.add_argument(
         "--title", help="Chart title (overrides a title in the config file)"
@@ -88,6 +90,27 @@ def main(args: Sequence[str] | None = None) -> None:
         help="Override chart type inferred from filename",
     )
     batch_parser.add_argument("--config", "-c", help="Config file path")
+    batch_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count; 1 renders serially)",
+    )
+    batch_parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help=(
+            "Files handed to a worker per task; raise it for many tiny files "
+            "(default: about four tasks per worker)"
+        ),
+    )
+    batch_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render every file, ignoring the incremental-build manifest",
+    )
     batch_parser.set_defaults(func="batch")
 
     parsed_args = parser.parse_args(args)
@@ -14,6 +14,7 @@ from .line import LineChart
 from .pie import PieChart
 from .polar_area import PolarAreaChart
 from .radar import RadarChart
+from .render_plan import RenderPlan
 from .sankey import SankeyChart
 from .scatter import ScatterChart
 
@@ -32,6 +33,7 @@ __all__ = [
     "PieChart",
     "PolarAreaChart",
     "RadarChart",
+    "RenderPlan",
     "SankeyChart",
     "ScatterChart",
 ]
@@ -73,8 +73,12 @@ class ChartConfigMixin:
             "y_scale": self.y_scale,
         }
         if self.data_model:
-            cfg["x_data"] = self.data_model.x_data
-            cfg["y_data"] = self.data_model.y_data
+            from charted.utils.buffers import materialize
+
+            x_data = self.data_model.x_data
+            y_data = self.data_model.y_data
+            cfg["x_data"] = materialize(x_data) if x_data else x_data
+            cfg["y_data"] = materialize(y_data) if y_data else y_data
         if self.series_styles:
             cfg["series_styles"] = [
                 dataclasses.asdict(s) if dataclasses.is_dataclass(s) else s
@@ -7,8 +7,9 @@ the class bases, so they continue to operate on the same ``self``.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 
 from charted.utils.rendering import (
     generate_html_wrapper,
@@ -28,8 +29,8 @@ class ChartOutputMixin:
 
     Provides the public ``to_*`` / ``save`` methods and the notebook ``_repr_*``
     hooks. These rely on attributes supplied by the concrete chart class
-    (``svg``, ``html``, ``_title``, ``_tooltips``, ``_build_children``); they
-    are declared here only for type checking.
+    (``svg``, ``html``, ``iter_chunks``, ``_title``, ``_tooltips``,
+    ``_build_children``); they are declared here only for type checking.
     """
 
     if TYPE_CHECKING:
@@ -45,6 +46,8 @@ class ChartOutputMixin:
 
         def _build_children(self) -> None: ...
 
+        def iter_chunks(self) -> Iterator[str]: ...
+
     def _repr_svg_(self) -> str:
         """Return SVG string for Jupyter notebook display."""
         return self.svg
@@ -62,6 +65,14 @@ class ChartOutputMixin:
 
     def _embed_font_faces(self, svg: str) -> str:
         """Inline @font-face declarations for any bundled font the chart uses."""
+        style = self._font_face_style()
+        if not style:
+            return svg
+        idx = svg.find(">")
+        return svg if idx < 0 else svg[: idx + 1] + style + svg[idx + 1 :]
+
+    def _font_face_style(self) -> str | None:
+        """Build the ``<style>`` block of @font-face rules, or None if unused."""
         import base64
 
         theme = getattr(self, "theme", None)
@@ -86,10 +97,48 @@ class ChartOutputMixin:
                     f'format("truetype");}}'
                 )
         if not faces:
-            return svg
-        style = "<style>" + "".join(faces) + "</style>"
-        idx = svg.find(">")
-        return svg if idx < 0 else svg[: idx + 1] + style + svg[idx + 1 :]
+            return None
+        return "<style>" + "".join(faces) + "</style>"
+
+    def iter_svg_chunks(self, embed_fonts: bool = False) -> Iterator[str]:
+        """Yield the chart's SVG markup in document order.
+
+        Streaming counterpart of :meth:`to_svg`: joining the chunks gives the
+        same string, but no intermediate copy of the document is built.
+
+        Args:
+            embed_fonts: If True, inline an @font-face for each bundled font
+                the chart uses, directly after the opening ``<svg>`` tag.
+        """
+        chunks = self.iter_chunks()
+        style = self._font_face_style() if embed_fonts else None
+        if style is None:
+            yield from chunks
+            return
+        opening = next(chunks)
+        if opening.endswith("/>"):
+            # A childless root has no body to put the style in; fall back to
+            # the string splice so the output matches to_svg() exactly.
+            yield self._embed_font_faces(opening)
+            return
+        yield opening
+        yield style
+        yield from chunks
+
+    def write_svg(self, fp: IO[str] | IO[bytes], *, embed_fonts: bool = False) -> None:
+        """Stream the chart's SVG markup to an open text or binary file.
+
+        Writes the same markup as :meth:`to_svg` without materializing the
+        whole document, so very large charts (e.g. 100k-point scatters) are
+        written in bounded memory.
+
+        Args:
+            fp: Destination file object. Binary sinks receive UTF-8 bytes.
+            embed_fonts: If True, inline the chart's bundled font(s).
+        """
+        from charted.html.element import write_chunks
+
+        write_chunks(fp, self.iter_svg_chunks(embed_fonts=embed_fonts))
 
     def to_markdown(self, alt_text: str | None = None, width: str | None = None) -> str:
         """Generate markdown markup for the chart."""
@@ -231,12 +280,14 @@ class ChartOutputMixin:
         import os
 
         ext = os.path.splitext(path)[1].lower()
-        svg = self.to_svg(embed_fonts=embed_fonts)
 
         if ext == ".svg":
+            # Stream straight to disk so large charts never exist in memory
+            # as one string.
             with open(path, "w") as f:
-                f.write(svg)
+                self.write_svg(f, embed_fonts=embed_fonts)
         elif ext == ".png":
+            svg = self.to_svg(embed_fonts=embed_fonts)
             try:
                 import cairosvg
             except ImportError:
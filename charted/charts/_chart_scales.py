@@ -71,11 +71,12 @@ class ChartScaleMixin:
     def _normalize_time_data(x_data: Vector | Vector2D) -> Vector | Vector2D:
         """Convert date/datetime/ISO-string x-data into epoch seconds."""
         from charted.charts.scales import _to_epoch
+        from charted.utils.buffers import ROW_TYPES
 
         def conv(seq: Vector) -> Vector:
             return [_to_epoch(v) for v in seq]
 
-        if x_data and isinstance(x_data[0], list):
+        if x_data and isinstance(x_data[0], ROW_TYPES):
             return [conv(row) for row in x_data]
         return conv(cast("Vector", x_data))
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, cast
 
 from charted.html.element import G, Text
+from charted.utils.label_placement import LabelPlacer
 
 if TYPE_CHECKING:
     from charted.charts.axes import YAxis
@@ -263,7 +264,7 @@ class ChartValueLabelMixin:
 
         # Track placed label boxes (in plot coordinates) so value labels can be
         # auto-hidden when they would collide with an already-placed label.
-        placed_boxes: list[tuple[float, float, float, float]] = []
+        placer = LabelPlacer()
 
         from charted.utils.helpers import calculate_text_dimensions
 
@@ -346,15 +347,8 @@ class ChartValueLabelMixin:
                         x + tw / 2,
                         ty + font_size / 2,
                     )
-                    if any(
-                        box[0] < pb[2]
-                        and box[2] > pb[0]
-                        and box[1] < pb[3]
-                        and box[3] > pb[1]
-                        for pb in placed_boxes
-                    ):
+                    if not placer.place(box):
                         continue
-                    placed_boxes.append(box)
                 g.add_child(
                     Text(
                         text=str(label_text),
@@ -13,6 +13,7 @@ from charted.constants import DEFAULT_CHART_HEIGHT, DEFAULT_CHART_WIDTH
 from charted.html.element import G, Path
 from charted.themes.core import Theme
 from charted.utils.curves import VALID_CURVES, curve_path
+from charted.utils.downsample import downsample_chart_data, validate_downsample
 from charted.utils.types import (
     Labels,
     ReferenceLineDict,
@@ -107,6 +108,18 @@ class AreaChart(Chart):
         series_styles: Per-series style overrides.
         annotations: Optional list of annotation objects (LineAnnotation,
             BoxAnnotation, LabelAnnotation) drawn in the plot area.
+        downsample: Reduce each series before projection to about
+            ``downsample_threshold`` points: ``"lttb"``
+            (Largest-Triangle-Three-Buckets, preserves the trace's shape) or
+            ``"minmax"`` (per-bucket min/max envelope, keeps every spike).
+            Series already within the threshold are untouched. Defaults to
+            None (every point is drawn).
+        downsample_threshold: Target points per series when downsampling.
+            Defaults to ``width``, the whole chart's width in pixels. The
+            plot area is narrower (padding and axes take the rest), so the
+            default keeps somewhat more than one point per plot pixel.
+            Areas are drawn at evenly spaced positions, so a kept point may
+            shift by up to one bucket (about a pixel) along x.
 
     Example:
         >>> chart = AreaChart(
@@ -119,6 +132,7 @@ class AreaChart(Chart):
     pad_x_labels: bool = False
     curve: str = "linear"
     y_stacked: bool = True
+    _supports_update_data: bool = True
 
     def __init__(
         self,
@@ -146,11 +160,25 @@ class AreaChart(Chart):
         reference_lines: list[ReferenceLineDict] | None = None,
         colors: list[str] | None = None,
         domain_padding: float | None = None,
+        downsample: str | None = None,
+        downsample_threshold: int | None = None,
     ):
         if curve not in VALID_CURVES:
             raise ValueError(
                 f"Unknown curve {curve!r}. Valid options: {', '.join(VALID_CURVES)}"
             )
+        validate_downsample(downsample, downsample_threshold)
+        if downsample is not None:
+            # The kept points (and labels) depend on the values, so a
+            # downsampled chart cannot be updated in place.
+            self._supports_update_data = False
+            data, x_data, labels, _ = downsample_chart_data(
+                downsample,
+                downsample_threshold or int(width),
+                data,
+                x_data,
+                labels,
+            )
         self.fill_opacity = fill_opacity
         self.curve = curve
         # Set before super().__init__ so the base Chart anchors the y-domain to
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Protocol, TypedDict, cast
 
 from charted.constants import DEFAULT_PADDING
 from charted.html.element import Element, G, Path, Text
+from charted.utils.buffers import SeriesView, data_bounds
 from charted.utils.defaults import DEFAULT_FONT, DEFAULT_FONT_SIZE
 from charted.utils.exceptions import InvalidDataError
 from charted.utils.helpers import (
@@ -12,6 +14,7 @@ from charted.utils.helpers import (
     common_denominators,
     round_to_clean_number,
 )
+from charted.utils.label_placement import LabelPlacer, LabelRequest
 from charted.utils.transform import rotate, translate
 from charted.utils.types import (
     AxisDimension,
@@ -21,6 +24,7 @@ from charted.utils.types import (
     Vector2D,
 )
 from charted.utils.value_format import format_value
+from charted.utils.vectorized import project_linear, project_log
 
 if TYPE_CHECKING:
     from charted.charts.scales import Scale
@@ -183,6 +187,8 @@ class Axis(G):
                         max_values[n] += series[n]
             min_value = min(min_values)
             max_value = max(max_values)
+        elif any(isinstance(arr, SeriesView) for arr in data):
+            min_value, max_value = data_bounds(data)
         else:
             agg = [x for arr in data for x in arr]
             min_value = min(agg)
@@ -336,6 +342,50 @@ class Axis(G):
     def reproject(self, value: float) -> float:
         raise Exception("reproject not implemented for instance of Axis.")
 
+    @property
+    def _length(self) -> float:
+        raise Exception("_length not implemented for instance of Axis.")
+
+    def _collapsed_position(self) -> float | None:
+        """Pixel every value maps to when the domain is degenerate, if fixed."""
+        return None
+
+    def reproject_many(
+        self, values: Sequence[float], mirror_negative: bool = False
+    ) -> list[float]:
+        """Project a whole series; equivalent to ``reproject`` per value.
+
+        The plot size and domain are resolved once for the series rather than
+        per value, and the arithmetic runs on NumPy arrays when available (see
+        :mod:`charted.utils.vectorized`).
+
+        Args:
+            values: Data values.
+            mirror_negative: Project ``abs(value)`` and negate the result for
+                negative values (stacked magnitudes).
+        """
+        name = getattr(self.scale, "name", "linear") if self.scale is not None else ""
+        if name == "log" and not mirror_negative:
+            scale = cast("Scale", self.scale)
+            return project_log(values, scale.min_value, scale.max_value, self._length)
+        if name not in ("", "linear"):
+            out = []
+            for value in values:
+                v = self.reproject(abs(value) if mirror_negative else value)
+                out.append(-v if mirror_negative and value < 0 else v)
+            return out
+        collapsed = self._collapsed_position()
+        if collapsed is not None:
+            return [collapsed] * len(values)
+        return project_linear(
+            values,
+            self.axis_dimension.min_value,
+            self.axis_dimension.max_value,
+            self._length,
+            self.stacked,
+            mirror_negative,
+        )
+
     @property
     def zero(self) -> float:
         # Zero has no meaning on a log scale (and may be outside a time
@@ -465,6 +515,16 @@ class Axis(G):
 
 
 class XAxis(Axis):
+    @property
+    def _length(self) -> float:
+        return self.parent.plot_width
+
+    def _collapsed_position(self) -> float | None:
+        # Mirrors the single-point centring in ``reproject``.
+        if self.axis_dimension.max_value == self.axis_dimension.min_value:
+            return self.parent.plot_width / 2
+        return None
+
     def reproject(self, value: float) -> float:
         if self.scale is not None and getattr(self.scale, "name", "linear") != "linear":
             return self.scale.reproject(value, self.parent.plot_width)
@@ -648,16 +708,17 @@ class XAxis(Axis):
         dx: float,
         rotation_angle: float = 0.0,
     ) -> set[int]:
-        """Pick label indices whose boxes do not overlap their kept neighbour.
-
-        Walks the labels in left-to-right order and keeps an index only when its
-        x-footprint clears the previously kept label's. For an unrotated axis the
-        footprint is the centred label box; for a rotated axis it is the rotated
-        label's projected x-extent (see :meth:`_rotated_x_span`). The first and
-        last labels are always retained: if the final label collides with the last
-        kept middle label, that middle one is dropped instead so the axis range
-        stays labelled. The pass only ever removes labels, so an axis whose labels
-        already fit keeps every one and renders byte-for-byte the same.
+        """Pick label indices whose boxes do not overlap a kept label.
+
+        Labels are placed through a :class:`LabelPlacer` in priority order: the
+        first and last labels (by coordinate) are always kept so the axis range
+        stays labelled, then each middle label, left to right, is kept only when
+        its x-footprint clears every label kept so far. For an unrotated axis
+        the footprint is the centred label box; for a rotated axis it is the
+        rotated label's projected x-extent (see :meth:`_rotated_x_span`).
+        Neighbours may touch by a pixel. The pass only ever removes labels, so
+        an axis whose labels already fit keeps every one and renders
+        byte-for-byte the same.
         """
         n = len(labels)
         if n <= 1:
@@ -677,20 +738,21 @@ class XAxis(Axis):
                 half = labels[i].width / 2
                 return centre - half, centre + half
 
-        kept: list[int] = [order[0]]
-        last_right = box(order[0])[1]
-        for i in order[1:-1]:
+        # Tick labels share one row, so every footprint spans the same unit
+        # height and only the x-extents decide a collision.
+        requests = []
+        for rank, i in enumerate(order):
             left, right = box(i)
-            if left >= last_right - 1.0:
-                kept.append(i)
-                last_right = right
-        if len(order) > 1:
-            last = order[-1]
-            left, right = box(last)
-            while len(kept) > 1 and box(kept[-1])[1] > left + 1.0:
-                kept.pop()
-            kept.append(last)
-        return set(kept)
+            ends = rank in (0, n - 1)
+            requests.append(
+                LabelRequest(
+                    candidates=[(left, 0.0, right, 1.0)],
+                    priority=1.0 if ends else 0.0,
+                    required=ends,
+                )
+            )
+        chosen = LabelPlacer(tolerance=(1.0, 0.0)).place_all(requests)
+        return {i for i, pick in zip(order, chosen) if pick is not None}
 
     @property
     def axis_labels(self) -> G:
@@ -788,6 +850,10 @@ class XAxis(Axis):
 
 
 class YAxis(Axis):
+    @property
+    def _length(self) -> float:
+        return self.parent.plot_height
+
     def reproject(self, value: float) -> float:
         if self.scale is not None and getattr(self.scale, "name", "linear") != "linear":
             return self.scale.reproject(value, self.parent.plot_height)
@@ -7,7 +7,8 @@ from charted.config import get_bar_gap
 from charted.constants import DEFAULT_CHART_HEIGHT, DEFAULT_CHART_WIDTH
 from charted.html.element import Element, G, Path, Text
 from charted.themes.core import Theme
-from charted.utils.exceptions import NoDataError
+from charted.utils.buffers import as_chart_data
+from charted.utils.exceptions import NoDataError, ValidationError
 from charted.utils.types import (
     Labels,
     ReferenceLineDict,
@@ -42,6 +43,11 @@ class BarChart(Chart):
             wraps onto multiple lines. None (default) keeps the full label on a
             single line and grows the left gutter to fit it. Set this to wrap
             long names (no truncation) and keep the plot area wide.
+        compact_marks: When True, single-series charts coloured per bar draw
+            every bar sharing a fill as one ``<path>`` instead of one element
+            per bar, so the element count scales with the number of colours
+            rather than bars. Multi-series charts already draw one path per
+            series. Defaults to False.
 
     Example:
         >>> from charted import BarChart
@@ -49,6 +55,8 @@ class BarChart(Chart):
         >>> chart.save('sales.svg')
     """
 
+    _supports_update_data: bool = True
+
     def __init__(
         self,
         data: Vector | Vector2D,
@@ -77,29 +85,16 @@ class BarChart(Chart):
         category_label_max_width: float | None = None,
         category_patterns: list[str] | bool | None = None,
         domain_padding: float | None = None,
+        compact_marks: bool = False,
     ):
         self._bar_data_labels = data_labels
+        self._compact_marks = compact_marks
         if bar_gap is None:
             bar_gap = get_bar_gap()
         self.bar_gap = bar_gap
         self.x_stacked = x_stacked
 
-        x_data: Vector2D
-        if not isinstance(data, list) or not data or isinstance(data[0], (int, float)):
-            x_data = cast("Vector2D", [data])
-        else:
-            x_data = data
-
-        if not x_data or not x_data[0]:
-            raise NoDataError("No data was provided to the BarChart element.")
-
-        num_bars = len(x_data[0]) if x_data else 0
-        num_series = len(x_data) if x_data else 0
-        y_data: Vector2D
-        if num_bars <= 1:
-            y_data = [[0, 1] for _ in range(num_series)] if num_series > 0 else [[0, 1]]
-        else:
-            y_data = [[i for i in range(num_bars)] for _ in range(num_series)]
+        x_data, y_data = self._bar_data(data)
 
         super().__init__(
             width=width,
@@ -131,6 +126,50 @@ class BarChart(Chart):
             domain_padding=domain_padding,
         )
 
+    @staticmethod
+    def _bar_data(data: Vector | Vector2D) -> tuple[Vector2D, Vector2D]:
+        """Split bar values into (x_data, y_data) for the base Chart.
+
+        The values run along the x-axis; y_data holds each bar's category
+        position, one row per series.
+        """
+        data = cast("Vector | Vector2D", as_chart_data(data))
+        x_data: Vector2D
+        if not isinstance(data, list) or not data or isinstance(data[0], (int, float)):
+            x_data = cast("Vector2D", [data])
+        else:
+            x_data = data
+
+        if not x_data or not x_data[0]:
+            raise NoDataError("No data was provided to the BarChart element.")
+
+        num_bars = len(x_data[0]) if x_data else 0
+        num_series = len(x_data) if x_data else 0
+        y_data: Vector2D
+        if num_bars <= 1:
+            y_data = [[0, 1] for _ in range(num_series)] if num_series > 0 else [[0, 1]]
+        else:
+            y_data = [[i for i in range(num_bars)] for _ in range(num_series)]
+        return x_data, y_data
+
+    def _prepare_data_update(
+        self,
+        x_data: Vector | Vector2D | None,
+        y_data: Vector | Vector2D | None,
+    ) -> tuple[Vector | Vector2D | None, Vector | Vector2D | None]:
+        """Bar values are x_data; their category positions follow from them."""
+        if y_data is not None:
+            raise ValidationError(
+                "BarChart values run along the x-axis; pass them to "
+                "update_data() as x_data."
+            )
+        if x_data is None:
+            return None, None
+        return self._bar_data(x_data)
+
+    def _fit_layout(self) -> None:
+        super()._fit_layout()
+
         # Refresh axes grid_lines after parent is fully initialized.
         # During Chart.__init__, left_padding returns h_pad (25.0) because
         # y_axis doesn't exist yet. After initialization, it correctly
@@ -242,6 +281,8 @@ class BarChart(Chart):
                     and not has_fill_override
                 )
                 paths = []
+                # compact_marks: per-bar subpaths batched by their fill.
+                batches: dict[str, list[str]] = {}
                 for bar_idx, x in enumerate(x_values_series):
                     slot_y = start_y + bar_idx * (slot_height + gap)
                     bar_y = slot_y + series_idx * series_thickness
@@ -255,6 +296,9 @@ class BarChart(Chart):
                         bar_fill = self._category_fill(
                             bar_idx, self.colors[bar_idx % len(self.colors)]
                         )
+                        if self._compact_marks:
+                            batches.setdefault(bar_fill, []).append(bar_path)
+                            continue
                         bars_g.add_child(Path(d=[bar_path], fill=bar_fill, **outline))
                     else:
                         paths.append(bar_path)
@@ -263,6 +307,8 @@ class BarChart(Chart):
                         self._category_fill(series_idx, fill) if fill == color else fill
                     )
                     bars_g.add_child(Path(d=paths, fill=series_fill, **outline))
+                for bar_fill, subpaths in batches.items():
+                    bars_g.add_child(Path(d=subpaths, fill=bar_fill, **outline))
 
         # Render data labels at end of bars. Explicit data_labels take
         # precedence; otherwise fall back to synthesized value labels.
@@ -6,6 +6,7 @@ from charted.charts.scatter import ScatterChart
 from charted.constants import DEFAULT_CHART_HEIGHT, DEFAULT_CHART_WIDTH
 from charted.html.element import Circle, G, Path, Text
 from charted.themes.core import Theme
+from charted.utils.buffers import ROW_TYPES, as_chart_data
 from charted.utils.types import SeriesStyleConfig, Vector, Vector2D
 
 DEFAULT_BUBBLE_MIN_RADIUS = 4.0
@@ -81,6 +82,9 @@ class BubbleChart(ScatterChart):
         >>> chart.save('bubble.svg')
     """
 
+    # Marker radii and hue are derived from the points at construction.
+    _supports_update_data: bool = False
+
     def __init__(
         self,
         x_data: Vector | Vector2D,
@@ -118,9 +122,12 @@ class BubbleChart(ScatterChart):
         if max_radius < min_radius:
             raise ValueError("max_radius must be >= min_radius")
 
+        x_data = cast("Vector | Vector2D", as_chart_data(x_data))
+        y_data = cast("Vector | Vector2D", as_chart_data(y_data))
+
         # sizes applies per point index across every series, so validate it
         # against every series length, not just the first.
-        is_multi_series = bool(y_data) and isinstance(y_data[0], list)
+        is_multi_series = bool(y_data) and isinstance(y_data[0], ROW_TYPES)
         if is_multi_series:
             series_lengths = [len(cast("list[float]", series)) for series in y_data]
         else:
@@ -293,7 +300,7 @@ class BubbleChart(ScatterChart):
             return {"x": 0.0, "y": 0.0}
 
         def flat(data: Vector | Vector2D) -> list[float]:
-            if data and isinstance(data[0], list):
+            if data and isinstance(data[0], ROW_TYPES):
                 return [v for row in data for v in row]
             return list(cast("Vector", data)) if data else []
 
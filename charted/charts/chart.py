@@ -6,6 +6,7 @@ separate modules to address God Class architectural debt (Issue #64).
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Protocol, cast
 
 from charted.charts._chart_config import ChartConfigMixin
@@ -25,8 +26,10 @@ from charted.constants import (
 )
 from charted.html.element import Child, ClipPath, Defs, G, Path, Rect, Svg, Text
 from charted.themes.core import Theme
+from charted.utils.buffers import ROW_TYPES, as_chart_data
 from charted.utils.color_manager import ColorManager
 from charted.utils.data_model import DataModel
+from charted.utils.exceptions import ValidationError
 from charted.utils.layout_engine import LayoutEngine
 from charted.utils.series_legend import SeriesLegend
 from charted.utils.theme_manager import ThemeManager
@@ -39,9 +42,11 @@ from charted.utils.types import (
     Vector,
     Vector2D,
 )
+from charted.utils.vectorized import stack_offsets
 
 if TYPE_CHECKING:
     from charted.charts.axes import _AxisParent
+    from charted.charts.render_plan import RenderPlan
     from charted.html.element import Element
 
 
@@ -105,6 +110,13 @@ class Chart(
     # Radial charts (radar, polar) draw data as a centred circle rather than
     # filling the rectangular plot, so a corner legend never sits over the data.
     _radial_plot: bool = False
+    # Set by RenderPlan.render() before __init__ runs; supplies the resolved
+    # theme and bounded labels of earlier renders with the same options.
+    _render_plan: RenderPlan[Chart] | None = None
+    # Whether update_data() may re-run the shared layout on new values. Chart
+    # types that derive extra state from their data before Chart.__init__
+    # leave this False.
+    _supports_update_data: bool = False
 
     # Instance attributes assigned in __init__ (declared here so mypy can infer
     # their type at every read site; conditional assignment otherwise leaves the
@@ -128,12 +140,8 @@ class Chart(
         """
         from charted.themes.core import Theme
 
-        # Build an override Theme from kwargs. Theme's runtime ``__init__`` takes
-        # arbitrary keyword overrides (it replaces the dataclass-synthesised one),
-        # so the heterogeneous override mapping is splatted in directly.
         overrides = {k: v for k, v in kwargs.items() if hasattr(Theme, k)}
-        override = Theme(**overrides)  # type: ignore[arg-type]
-        self.theme = self.theme.compose(override)
+        self.theme = ThemeManager.apply_overrides(self.theme, overrides)
         return self
 
     # =========================================================================
@@ -219,6 +227,11 @@ class Chart(
         self._x_scale_spec = x_scale
         self._y_scale_spec = y_scale
 
+        # NumPy arrays and other buffers become zero-copy SeriesView rows; see
+        # charted.utils.buffers.
+        x_data = cast("Vector | Vector2D | None", as_chart_data(x_data))
+        y_data = cast("Vector | Vector2D | None", as_chart_data(y_data))
+
         # Time scales accept dates/datetimes/ISO strings. DataModel only
         # handles numeric data, so convert time x_data to epoch seconds here
         # while remembering the original domain for the scale.
@@ -232,9 +245,10 @@ class Chart(
             raise NoDataError()
 
         # Create default x_labels if not provided (for ordinal charts)
-        if not x_data and not x_labels:
+        self._default_x_labels = not x_data and not x_labels
+        if self._default_x_labels:
             # y_data might be Vector (1D) or Vector2D (2D) - handle both
-            if y_data and isinstance(y_data[0], list):
+            if y_data and isinstance(y_data[0], ROW_TYPES):
                 array_len = len(y_data[0])
             elif y_data:
                 array_len = len(y_data)
@@ -269,8 +283,6 @@ class Chart(
         # Parse reference_lines convenience API into h_lines/v_lines + labels
         self._reference_line_labels: list[ReferenceLineDict] = []
         if reference_lines:
-            from charted.utils.exceptions import ValidationError
-
             for index, ref in enumerate(reference_lines):
                 if "value" not in ref:
                     raise ValidationError(
@@ -296,14 +308,12 @@ class Chart(
         self._width = width
         self._height = height
 
-        # Load and apply theme using ThemeManager
-        self.theme = ThemeManager.load_theme(theme, chart_type)
+        # Load and apply theme using ThemeManager (once per render plan)
+        def load_theme() -> Theme:
+            return ThemeManager.load_theme(theme, chart_type, colors)
 
-        # Apply color shorthand: override theme colors if provided
-        if colors:
-            from dataclasses import replace as dc_replace
-
-            self.theme = dc_replace(self.theme, colors=list(colors))
+        plan = self._render_plan
+        self.theme = load_theme() if plan is None else plan.resolve_theme(load_theme)
 
         # Set internal padding attributes directly (properties are read-only)
         self._h_padding = self.theme.h_padding
@@ -335,6 +345,41 @@ class Chart(
         else:
             self._subtitle = None
 
+        # Everything below depends on the data values; update_data() re-runs
+        # it on new values without repeating the setup above.
+        self._chart_type = chart_type
+        self._axis_label_args = (x_labels, y_labels)
+        self._measured_labels = (self.data_model.x_labels, self.data_model.y_labels)
+        self._fit_layout()
+
+        # Initialize ColorManager for automatic color cycling. Use the theme's
+        # contrast-floor-adjusted palette so washed-out hues are darkened in
+        # the high-contrast theme; identical to theme.colors otherwise.
+        self._color_manager = ColorManager(colors=self.theme.resolved_colors)
+
+        # Initialize colors (set internal variable directly since property is read-only)
+        if not hasattr(self, "_colors"):
+            self._colors = self.theme.resolved_colors
+
+        # Whether data marks should carry native <title> tooltips. Off for
+        # file output (to_svg/save); toggled on only by to_html(tooltips=True).
+        self._tooltips = False
+
+        self._build_children()
+
+    def _fit_layout(self) -> None:
+        """Lay the chart out around the current data values.
+
+        Builds the layout engine, scales and axes, bounds long category labels
+        and projects every series. Called from ``__init__`` and again by
+        :meth:`update_data`; everything it reads besides the data (theme,
+        title, label arguments) was fixed at construction.
+        """
+        x_labels, y_labels = self._axis_label_args
+        # Category bounding below rewrites the measured labels in place, so
+        # start every pass from the labels as originally measured.
+        self.data_model._x_labels, self.data_model._y_labels = self._measured_labels
+
         # Subclasses (e.g. ScatterChart) may reserve a band outside the plot
         # for a legend. The defaults leave the layout unchanged.
         legend_layout_position = self._legend_layout_position()
@@ -342,8 +387,8 @@ class Chart(
 
         # Initialize LayoutEngine for layout calculations
         self.layout = LayoutEngine(
-            width=width,
-            height=height,
+            width=self.width,
+            height=self.height,
             h_padding=self.h_padding,
             v_padding=self.v_padding,
             x_labels=self.data_model.x_labels,
@@ -351,16 +396,16 @@ class Chart(
             title=self._title,
             subtitle=self._subtitle,
             subtitle_leading=self._subtitle_leading,
-            has_x_axis_label=bool(x_label),
-            has_y_axis_label=bool(y_label),
+            has_x_axis_label=bool(self._x_label),
+            has_y_axis_label=bool(self._y_label),
             legend_position=legend_layout_position,
             legend_extent=legend_layout_extent,
         )
 
         # Build scale instances from the data domain. None/linear leaves the
         # axis on its default LinearScale path (behaviour unchanged).
-        x_scale_inst = self._build_scale(x_scale, self.x_data)
-        y_scale_inst = self._build_scale(y_scale, self.y_data)
+        x_scale_inst = self._build_scale(self._x_scale_spec, self.x_data)
+        y_scale_inst = self._build_scale(self._y_scale_spec, self.y_data)
         self._x_scale = x_scale_inst
         self._y_scale = y_scale_inst
 
@@ -369,12 +414,12 @@ class Chart(
         # axis renders garbage (bars collapse to uniform height), so reject it
         # up front. The value axis is Y for column/area/histogram and X for
         # horizontal bar charts.
-        self._reject_unsupported_scales(chart_type, x_scale_inst, y_scale_inst)
+        self._reject_unsupported_scales(self._chart_type, x_scale_inst, y_scale_inst)
 
         # Apply fixed-domain (x_range/y_range) or fractional domain_padding by
         # anchoring the data the axes derive their min/max from. None leaves the
         # axis data untouched, so the auto-fit domain is unchanged.
-        value_axis = self._BAR_VALUE_AXIS.get(cast("str", chart_type))
+        value_axis = self._BAR_VALUE_AXIS.get(cast("str", self._chart_type))
         x_axis_data = self._anchor_axis_data(
             self.x_data,
             self._x_range,
@@ -422,7 +467,7 @@ class Chart(
             stacked=self.x_stacked,
             zero_index=(
                 False
-                if (x_data is not None and x_labels is not None)
+                if (self.data_model.x_data is not None and x_labels is not None)
                 else self.zero_index
             ),
             config=grid_config,
@@ -458,33 +503,17 @@ class Chart(
 
         # Initialize internal offsets and values directly (properties are read-only)
         # For ordinal charts (no x_data), generate default x-values [0, 1, 2, ...]
+        # Series are projected an array at a time (NumPy-backed when it is
+        # installed); see charted.utils.vectorized.
         if self.x_data:
             # XY chart: transform x_data through axis reproject
-            self._x_values = [
-                [self.x_axis.reproject(x) for x in arr] for arr in self.x_data
-            ]
+            self._x_values = [self.x_axis.reproject_many(arr) for arr in self.x_data]
 
             # Calculate stacking offsets for x-axis (for horizontal bar charts)
             if getattr(self, "x_stacked", False):
-                offsets = []
-                negative_offsets = [0.0] * self.x_count
-                positive_offsets = [0.0] * self.x_count
-
-                for row in self.x_data:
-                    row_offsets = []
-                    for i, x in enumerate(row):
-                        current_offset = 0.0
-                        if x >= 0:
-                            current_offset = positive_offsets[i]
-                            positive_offsets[i] += x
-                        elif x < 0:
-                            current_offset = negative_offsets[i]
-                            negative_offsets[i] -= abs(x)
-                        row_offsets.append(current_offset)
-                    offsets.append(row_offsets)
-
                 self._x_offsets = [
-                    [self.x_axis.reproject(x) for x in arr] for arr in offsets
+                    self.x_axis.reproject_many(arr)
+                    for arr in stack_offsets(self.x_data)
                 ]
             else:
                 # Non-stacked: all offsets are zero
@@ -492,68 +521,122 @@ class Chart(
         else:
             # Ordinal chart: use index-based values transformed through axis
             indices = [float(i) for i in range(self.x_count)]
-            x_vals = [self.x_axis.reproject(i) for i in indices]
+            x_vals = self.x_axis.reproject_many(indices)
             # Create one row of x_values per y_data series for multi-series charts
             num_series = len(self.y_data) if self.y_data else 1
             self._x_offsets = [[0.0] * self.x_count] * num_series
             self._x_values = [x_vals] * num_series
 
-        # Transform y_values through y_axis reproject, handling stacking correctly
-        data = []
-        for arr in self.y_data:
-            row = []
-            for y in arr:
-                if not self.y_stacked:
-                    v = self.y_axis.reproject(y)
-                else:
-                    v = self.y_axis.reproject(abs(y))
-                    if y < 0:
-                        v = -v
-                row.append(v)
-            data.append(row)
-        self._y_values = data
+        # Transform y_values through y_axis reproject. Stacked charts project
+        # magnitudes and restore the sign so negative segments hang downward.
+        self._y_values = [
+            self.y_axis.reproject_many(arr, mirror_negative=self.y_stacked)
+            for arr in self.y_data
+        ]
 
         # Calculate stacking offsets (cumulative for stacked charts)
-        offsets = []
-        negative_offsets = [0.0] * self.y_count
-        positive_offsets = [0.0] * self.y_count
-
-        for row in self.y_data:
-            row_offsets = []
-            for i, y in enumerate(row):
-                current_offset = 0.0
-                if y >= 0:
-                    current_offset = positive_offsets[i]
-                    positive_offsets[i] += y
-                elif y < 0:
-                    current_offset = negative_offsets[i]
-                    negative_offsets[i] -= abs(y)
-                row_offsets.append(current_offset)
-            offsets.append(row_offsets)
+        offsets = stack_offsets(self.y_data)
 
         # Transform offsets through y_axis. Stacking is undefined on log/time
         # scales (no meaningful zero), so offsets collapse to zero pixels.
         if self._y_scale is not None and self._y_scale.name != "linear":
             self._y_offsets = [[0.0] * len(arr) for arr in offsets]
         else:
-            self._y_offsets = [
-                [self.y_axis.reproject(y) for y in arr] for arr in offsets
-            ]
+            self._y_offsets = [self.y_axis.reproject_many(arr) for arr in offsets]
 
-        # Initialize ColorManager for automatic color cycling. Use the theme's
-        # contrast-floor-adjusted palette so washed-out hues are darkened in
-        # the high-contrast theme; identical to theme.colors otherwise.
-        self._color_manager = ColorManager(colors=self.theme.resolved_colors)
+    def update_data(
+        self,
+        y_data: Vector | Vector2D | None = None,
+        x_data: Vector | Vector2D | None = None,
+    ) -> Chart:
+        """Replace the chart's data values in place.
 
-        # Initialize colors (set internal variable directly since property is read-only)
-        if not hasattr(self, "_colors"):
-            self._colors = self.theme.resolved_colors
+        Only the value-dependent state is rebuilt: scales, axes, padding,
+        projected values and offsets, and the SVG children. The theme, title,
+        measured labels and colour palette from construction are reused, so
+        an update is much cheaper than building a new chart. The result is
+        identical to constructing the chart with the new data. A rejected
+        update, whether by validation or by the layout (e.g. non-positive
+        values on a log scale), leaves the chart as it was.
 
-        # Whether data marks should carry native <title> tooltips. Off for
-        # file output (to_svg/save); toggled on only by to_html(tooltips=True).
-        self._tooltips = False
+        Args:
+            y_data: New y-axis values. ``None`` keeps the current values.
+            x_data: New x-axis values. ``None`` keeps the current values.
 
-        self._build_children()
+        Returns:
+            self for chaining.
+
+        Raises:
+            ValidationError: If this chart type derives more state from its
+                data than the shared layout (e.g. pie slices, sankey flows,
+                downsampled series); construct a new chart instead.
+            LabelMismatchError: If the new data no longer matches the labels.
+
+        Example:
+            >>> chart = LineChart(data=[3, 1, 4], labels=["a", "b", "c"])
+            >>> chart.update_data(y_data=[2, 7, 1]).html
+        """
+        if not self._supports_update_data:
+            raise ValidationError(
+                f"{type(self).__name__} does not support update_data(); "
+                "construct a new chart instead."
+            )
+        x_data, y_data = self._prepare_data_update(
+            cast("Vector | Vector2D | None", as_chart_data(x_data)),
+            cast("Vector | Vector2D | None", as_chart_data(y_data)),
+        )
+        if x_data is not None and self._is_time_scale(self._x_scale_spec):
+            x_data = self._normalize_time_data(x_data)
+
+        model = self.data_model
+        new_x = model.x_data if x_data is None else model.validate_data(x_data)
+        new_y = model.y_data if y_data is None else model.validate_data(y_data)
+        saved = (
+            model._x_data,
+            model._y_data,
+            model._x_labels,
+            self._axis_label_args,
+            self._measured_labels,
+        )
+        model._x_data, model._y_data = new_x, new_y
+
+        try:
+            # Default ordinal labels ("0", "1", ...) follow the series length.
+            x_labels, y_labels = self._axis_label_args
+            if self._default_x_labels and len(x_labels or []) != self.y_count:
+                x_labels = DataModel.create_default_labels(self.y_count)
+                self._axis_label_args = (x_labels, y_labels)
+                model.x_labels = x_labels
+                self._measured_labels = (model.x_labels, self._measured_labels[1])
+            model._validate_label_lengths()
+            self._fit_layout()
+            self._build_children()
+        except Exception:
+            # Put the old values back and lay them out again, so scales, axes
+            # and children half-rebuilt for the rejected data are replaced.
+            (
+                model._x_data,
+                model._y_data,
+                model._x_labels,
+                self._axis_label_args,
+                self._measured_labels,
+            ) = saved
+            self._fit_layout()
+            self._build_children()
+            raise
+        return self
+
+    def _prepare_data_update(
+        self,
+        x_data: Vector | Vector2D | None,
+        y_data: Vector | Vector2D | None,
+    ) -> tuple[Vector | Vector2D | None, Vector | Vector2D | None]:
+        """Map update_data() arguments to the chart's x/y data.
+
+        Subclasses whose constructor maps its arguments to x/y differently
+        apply the same mapping here (e.g. BarChart, whose values are x_data).
+        """
+        return x_data, y_data
 
     def _apply_category_label_wrapping(self) -> None:
         """Bound the size of long category labels so they cannot eat the plot.
@@ -579,10 +662,9 @@ class Chart(
             if cap > 0:
                 from charted.utils.helpers import wrap_text_to_width
 
-                wrapped = [
-                    wrap_text_to_width(label.text, cap)
-                    for label in self.data_model.y_labels
-                ]
+                wrapped = self._bound_labels(
+                    "y", cap, self.data_model.y_labels, wrap_text_to_width
+                )
                 if any(w.lines for w in wrapped):
                     self.data_model._y_labels = wrapped
                     self.layout.y_labels = wrapped
@@ -603,10 +685,9 @@ class Chart(
             if x_cap > 0:
                 from charted.utils.helpers import truncate_text_to_width
 
-                truncated = [
-                    truncate_text_to_width(label.text, x_cap)
-                    for label in self.data_model.x_labels
-                ]
+                truncated = self._bound_labels(
+                    "x", x_cap, self.data_model.x_labels, truncate_text_to_width
+                )
                 if any(
                     t.text != orig.text
                     for t, orig in zip(truncated, self.data_model.x_labels)
@@ -627,6 +708,18 @@ class Chart(
             if getattr(self, "x_axis", None) is not None:
                 self.x_axis.rebuild()
 
+    def _bound_labels(
+        self,
+        axis: str,
+        cap: float,
+        labels: list[MeasuredText],
+        bound: Callable[[str, float], MeasuredText],
+    ) -> list[MeasuredText]:
+        """Apply ``bound`` (wrap or truncate) to each label, via the plan."""
+        if self._render_plan is not None:
+            return self._render_plan.bound_labels(axis, cap, labels, bound)
+        return [bound(label.text, cap) for label in labels]
+
     def _build_children(self) -> None:
         """Assemble the chart's SVG child elements.
 
@@ -38,6 +38,12 @@ class ColumnChart(Chart):
         series_names: Names for each series (shown in legend)
         y_stacked: If True, stack columns vertically instead of side-by-side
         series_styles: Per-series style overrides
+        compact_marks: When True, single-series charts coloured per column
+            draw every column sharing a fill as one ``<path>`` instead of one
+            element per column, so the element count scales with the number
+            of colours rather than columns. Columns carrying a tooltip keep
+            their own element. Multi-series charts already draw one path per
+            series. Defaults to False.
 
     Example:
         >>> from charted import ColumnChart
@@ -46,6 +52,7 @@ class ColumnChart(Chart):
     """
 
     y_stacked: bool = True
+    _supports_update_data: bool = True
 
     def __init__(
         self,
@@ -76,7 +83,9 @@ class ColumnChart(Chart):
         legend: str = "none",
         category_patterns: list[str] | bool | None = None,
         domain_padding: float | None = None,
+        compact_marks: bool = False,
     ):
+        self._compact_marks = compact_marks
         if column_gap is None:
             column_gap = get_column_gap()
         self.column_gap = column_gap
@@ -204,6 +213,8 @@ class ColumnChart(Chart):
                     self._category_fill(series_idx, fill) if fill == color else fill
                 )
                 paths = []
+                # compact_marks: per-bar subpaths batched by their fill.
+                batches: dict[str, list[str]] = {}
                 for x_idx, y in enumerate(y_values_series):
                     x = self.x_offset + x_idx * (
                         self.x_width + self.column_gap * self.x_width
@@ -218,6 +229,9 @@ class ColumnChart(Chart):
                         col_fill = self._category_fill(
                             x_idx, self.colors[x_idx % len(self.colors)]
                         )
+                        if self._compact_marks and title is None:
+                            batches.setdefault(col_fill, []).append(col_path)
+                            continue
                         mark = Path(d=[col_path], fill=col_fill, **outline)
                         if title is not None:
                             mark.add_child(title)
@@ -230,6 +244,8 @@ class ColumnChart(Chart):
                         paths.append(col_path)
                 if not per_bar and paths:
                     g.add_child(Path(d=paths, fill=series_fill, **outline))
+                for col_fill, subpaths in batches.items():
+                    g.add_child(Path(d=subpaths, fill=col_fill, **outline))
 
         # Render data labels above columns
         data_labels_g = self._render_data_labels()
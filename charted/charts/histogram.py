@@ -6,11 +6,13 @@ Shows the frequency of values within evenly-spaced intervals.
 from __future__ import annotations
 
 import math
+from typing import cast
 
 from charted.charts.chart import Chart
 from charted.constants import DEFAULT_CHART_HEIGHT, DEFAULT_CHART_WIDTH
 from charted.html.element import G, Rect
 from charted.themes.core import Theme
+from charted.utils.buffers import as_chart_data
 from charted.utils.types import ReferenceLineDict, Vector
 
 
@@ -89,6 +91,7 @@ class Histogram(Chart):
         value_labels: bool | str | dict[str, object] | None = None,
         domain_padding: float | None = None,
     ):
+        data = cast("Vector", as_chart_data(data))
         n_bins = bins if bins is not None else _auto_bins(data)
         bin_counts, bin_labels = _compute_bins(data, n_bins)
 
@@ -7,6 +7,11 @@ from charted.constants import DEFAULT_CHART_HEIGHT, DEFAULT_CHART_WIDTH
 from charted.html.element import G, Text
 from charted.themes.core import Theme
 from charted.utils.curves import VALID_CURVES
+from charted.utils.downsample import (
+    downsample_chart_data,
+    take,
+    validate_downsample,
+)
 from charted.utils.line_renderer import LineRenderer
 from charted.utils.types import (
     Labels,
@@ -38,6 +43,16 @@ class LineChart(Chart):
         theme: Optional theme configuration
         series_names: Names for each series (shown in legend)
         series_styles: Per-series style overrides (stroke, marker_shape, etc.)
+        downsample: Reduce each series before projection to about
+            ``downsample_threshold`` points: ``"lttb"``
+            (Largest-Triangle-Three-Buckets, preserves the trace's shape) or
+            ``"minmax"`` (per-bucket min/max envelope, keeps every spike).
+            Series already within the threshold are untouched. Defaults to
+            None (every point is drawn).
+        downsample_threshold: Target points per series when downsampling.
+            Defaults to ``width``, the whole chart's width in pixels. The
+            plot area is narrower (padding and axes take the rest), so the
+            default keeps somewhat more than one point per plot pixel.
 
     Example:
         >>> from charted import LineChart
@@ -59,6 +74,7 @@ class LineChart(Chart):
     pad_x_labels: bool = False
     markers: bool = False
     curve: str = "linear"
+    _supports_update_data: bool = True
 
     # Built-in dash patterns cycled for redundant (dash + colour) encoding when
     # ``dash_cycle=True``. A solid line leads so the first series is unchanged.
@@ -108,11 +124,30 @@ class LineChart(Chart):
         colors: list[str] | None = None,
         legend: str = "none",
         dash_cycle: list[str] | bool | None = None,
+        downsample: str | None = None,
+        downsample_threshold: int | None = None,
     ):
         if curve not in VALID_CURVES:
             raise ValueError(
                 f"Unknown curve {curve!r}. Valid options: {', '.join(VALID_CURVES)}"
             )
+        validate_downsample(downsample, downsample_threshold)
+        if downsample is not None:
+            # The kept points (and labels) depend on the values, so a
+            # downsampled chart cannot be updated in place.
+            self._supports_update_data = False
+            data, x_data, labels, keep = downsample_chart_data(
+                downsample,
+                downsample_threshold or int(width),
+                data,
+                x_data,
+                labels,
+            )
+            if keep is not None and data_labels:
+                if isinstance(data_labels[0], list):
+                    data_labels = [take(row, keep) for row in data_labels]
+                else:
+                    data_labels = take(data_labels, keep)
         self.markers = markers
         self.curve = curve
         # Redundant dash encoding so series differ by line pattern as well as
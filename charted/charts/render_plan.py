@@ -0,0 +1,103 @@
+"""Reusable render plans for re-rendering a chart with new data.
+
+A live dashboard redraws the same chart over and over: the chart type, size,
+theme, title and category labels stay fixed and only the values change.
+Building each frame from scratch repeats the value-independent work every
+time: resolving the theme (preset lookup, config file read, chart-type
+overrides) and bounding long category labels to the label gutter.
+
+A :class:`RenderPlan` fixes those options once and resolves that work on its
+first render. Every later :meth:`RenderPlan.render` reuses it and recomputes
+only what depends on the values: the scale domain and tick labels, the
+padding that follows from them, and the data marks.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
+
+if TYPE_CHECKING:
+    from charted.charts.chart import Chart
+    from charted.themes.core import Theme
+    from charted.utils.types import MeasuredText
+
+ChartT = TypeVar("ChartT", bound="Chart")
+
+
+class RenderPlan(Generic[ChartT]):
+    """Layout options for one chart, resolved once and reused per render.
+
+    Args:
+        chart_class: The chart type to render, e.g. ``LineChart``.
+        **options: Keyword arguments shared by every render (``labels``,
+            ``width``, ``height``, ``theme``, ``title``, ...). They are fixed
+            for the life of the plan.
+
+    Example:
+        >>> plan = RenderPlan(LineChart, labels=hours, theme="dark", width=800)
+        >>> svg = plan.render(data=latest_values()).html
+        >>> svg = plan.render(data=latest_values()).html  # reuses the layout
+    """
+
+    def __init__(self, chart_class: type[ChartT], **options: object) -> None:
+        self.chart_class = chart_class
+        self.options = options
+        self.renders = 0
+        self._theme: Theme | None = None
+        self._bounded_labels: dict[
+            tuple[str, float, tuple[str, ...]], list[MeasuredText]
+        ] = {}
+
+    def render(self, **values: object) -> ChartT:
+        """Build the chart for ``values`` on top of the plan's options.
+
+        Args:
+            **values: The per-render keyword arguments, typically ``data``
+                (and ``x_data``, ``series_names``, ``data_labels``...).
+
+        Returns:
+            A new chart, identical to constructing ``chart_class`` with the
+            plan's options and ``values`` directly.
+
+        Raises:
+            ValueError: If ``values`` repeats an option fixed by the plan.
+        """
+        fixed = sorted(values.keys() & self.options.keys())
+        if fixed:
+            raise ValueError(
+                f"Options fixed by the render plan cannot be passed to render(): "
+                f"{', '.join(fixed)}. Create a new RenderPlan to change them."
+            )
+        chart = cast("ChartT", self.chart_class.__new__(self.chart_class))
+        chart._render_plan = cast("RenderPlan[Chart]", self)
+        chart.__init__(**self.options, **values)  # type: ignore[misc]
+        self.renders += 1
+        return chart
+
+    def clear(self) -> None:
+        """Forget the resolved state; the next render resolves it again."""
+        self._theme = None
+        self._bounded_labels.clear()
+
+    def resolve_theme(self, load: Callable[[], Theme]) -> Theme:
+        """The plan's theme, loaded with ``load`` on first use."""
+        if self._theme is None:
+            self._theme = load()
+        return self._theme
+
+    def bound_labels(
+        self,
+        axis: str,
+        cap: float,
+        labels: list[MeasuredText],
+        bound: Callable[[str, float], MeasuredText],
+    ) -> list[MeasuredText]:
+        """Category labels wrapped or truncated to ``cap``, cached by text."""
+        key = (axis, cap, tuple(label.text for label in labels))
+        cached = self._bounded_labels.get(key)
+        if cached is None:
+            cached = self._bounded_labels[key] = [
+                bound(label.text, cap) for label in labels
+            ]
+        return cached
@@ -22,10 +22,11 @@ from charted.utils.sankey_layout import (
     DEFAULT_ITERATIONS,
     DEFAULT_NODE_PADDING,
     DEFAULT_NODE_WIDTH,
+    DEFAULT_TOLERANCE,
     SankeyLayout,
     SankeyLink,
     SankeyNode,
-    compute_layout,
+    cached_layout,
 )
 from charted.utils.types import Vector2D
 
@@ -129,7 +130,7 @@ class SankeyChart(Chart):
         theme: Optional theme (name, dict, or Theme).
         node_width: Width of each node rectangle in pixels.
         node_padding: Minimum vertical gap between nodes in a column.
-        iterations: Number of layout relaxation passes (d3 default 6).
+        iterations: Maximum number of layout relaxation passes (d3 default 6).
         alignment: How nodes are assigned to columns. One of:
 
             * ``justify`` (default, matching d3-sankey): sink nodes (no
@@ -146,6 +147,10 @@ class SankeyChart(Chart):
         link_opacity: Ribbon fill opacity (0-1); slight transparency so
             overlaps read.
         show_values: Append each node's total flow to its label.
+        tolerance: Stop relaxing early once no node moves further than this
+            many pixels in a pass. Lets a large graph take a high
+            ``iterations`` budget without paying for passes that no longer
+            change the picture.
 
     Example:
         >>> from charted import SankeyChart
@@ -178,6 +183,7 @@ class SankeyChart(Chart):
         alignment: str = "justify",
         link_opacity: float = 0.45,
         show_values: bool = False,
+        tolerance: float = DEFAULT_TOLERANCE,
     ) -> None:
         if not nodes:
             raise ChartedError(
@@ -196,6 +202,7 @@ class SankeyChart(Chart):
         self._node_padding = float(node_padding)
         self._iterations = int(iterations)
         self._alignment = alignment
+        self._tolerance = float(tolerance)
         self._link_opacity = float(link_opacity)
         self._show_values = show_values
 
@@ -352,9 +359,11 @@ class SankeyChart(Chart):
             y0 = frame_pad
             y1 = self.height - frame_pad
 
-        layout = compute_layout(
-            self._node_names,
-            self._raw_links,
+        # Only geometry feeds the layout, so themed variants of one flow share
+        # the cached result.
+        layout = cached_layout(
+            tuple(self._node_names),
+            tuple(self._raw_links),
             x0=x0,
             y0=y0,
             x1=x1,
@@ -363,6 +372,7 @@ class SankeyChart(Chart):
             node_padding=self._node_padding,
             iterations=self._iterations,
             alignment=self._alignment,
+            tolerance=self._tolerance,
         )
 
         # Links first so nodes sit on top. Each ribbon inherits its source
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, TypedDict, cast
+from typing import TYPE_CHECKING, cast
 
 from charted.charts.chart import Chart
 from charted.constants import (
@@ -12,6 +12,8 @@ from charted.constants import (
 )
 from charted.html.element import Circle, Element, G, Path, Rect, Text
 from charted.themes.core import Theme
+from charted.utils.helpers import round_coordinate
+from charted.utils.label_placement import PlacedLabel, relax_labels
 from charted.utils.types import (
     PointStyleConfig,
     ReferenceLineDict,
@@ -24,19 +26,6 @@ if TYPE_CHECKING:
     from charted.charts.chart import _Annotation
 
 
-class _PlacedLabel(TypedDict):
-    """A data label's placement state during collision avoidance."""
-
-    text: str
-    px: float
-    py: float
-    cx: float
-    cy: float
-    w: float
-    h: float
-    marker: float
-
-
 class ScatterChart(Chart):
     """Scatter plot for displaying relationships between two variables.
 
@@ -98,6 +87,20 @@ class ScatterChart(Chart):
             which keeps the original fixed-offset label placement so existing
             renders are unchanged. See ``_render_data_labels`` for the
             algorithm and its limitations.
+        compact_marks: When True, the markers of a series that share a
+            resolved shape, size, fill and opacity are drawn as one ``<path>``
+            with a subpath per point instead of one element per point, so the
+            element count (and SVG size and browser paint cost) scales with
+            the number of series rather than points. Points carrying a tooltip
+            keep their own element so their ``<title>`` still attaches. Within
+            a series, points with different per-point styles no longer
+            interleave in paint order. Defaults to False.
+        label_collision_iterations: Maximum number of relaxation passes of
+            the ``avoid_label_collisions`` pass. Defaults to 60; the pass
+            stops earlier once no label moves.
+        label_collision_time_budget: Optional wall-clock limit in seconds for
+            the ``avoid_label_collisions`` pass, checked after each
+            relaxation pass. Defaults to None (no limit).
 
     Example:
         >>> from charted import ScatterChart
@@ -117,6 +120,8 @@ class ScatterChart(Chart):
     # when ``shape_cycle=True`` and no per-series shape is given.
     DEFAULT_SHAPE_CYCLE = ["circle", "square", "triangle", "diamond", "star"]
 
+    _supports_update_data: bool = True
+
     @staticmethod
     def _resolve_shape_cycle(
         shape_cycle: list[str] | bool | None,
@@ -167,8 +172,14 @@ class ScatterChart(Chart):
         domain_padding: float | None = None,
         avoid_label_collisions: bool = False,
         value_labels: bool | str | dict[str, object] | None = None,
+        compact_marks: bool = False,
+        label_collision_iterations: int = 60,
+        label_collision_time_budget: float | None = None,
     ):
         self._avoid_label_collisions = avoid_label_collisions
+        self._label_collision_iterations = label_collision_iterations
+        self._label_collision_time_budget = label_collision_time_budget
+        self._compact_marks = compact_marks
         self._point_styles = point_styles
         self._quadrant_labels = quadrant_labels
         self._quadrant_label_inset = quadrant_label_inset
@@ -272,6 +283,8 @@ class ScatterChart(Chart):
 
             series = G(fill=fill)
             x_offset = self.x_offset
+            # compact_marks: subpaths batched per (shape, size, fill, opacity).
+            batches: dict[tuple[str, float, str, float | None], list[str]] = {}
 
             for i, (x, y, y_offset) in enumerate(zip(x_values, y_values, y_offsets)):
                 x += x_offset
@@ -294,6 +307,12 @@ class ScatterChart(Chart):
                         p_fill = cast(str, pstyle["fill"])
                     if pstyle.get("opacity") is not None:
                         p_opacity = pstyle["opacity"]
+                if self._compact_marks and title is None:
+                    subpath = self._marker_subpath(p_shape, x, y, p_size)
+                    if subpath is not None:
+                        key = (p_shape, p_size, p_fill, p_opacity)
+                        batches.setdefault(key, []).append(subpath)
+                    continue
                 mark = self._marker_element(p_shape, x, y, p_size, p_fill)
                 if mark is not None:
                     # Only set fill on the marker when it differs from the
@@ -306,6 +325,13 @@ class ScatterChart(Chart):
                     if title is not None:
                         mark.add_child(title)
                     series.add_child(mark)
+            for (_, _, p_fill, p_opacity), subpaths in batches.items():
+                batch = Path(d=subpaths)
+                if p_fill != fill:
+                    batch.kwargs["fill"] = p_fill
+                if p_opacity is not None:
+                    batch.kwargs["opacity"] = cast(str, p_opacity)
+                series.add_child(batch)
             g.add_children(series)
 
         # Data labels and quadrant labels rendered outside the clip group
@@ -359,17 +385,48 @@ class ScatterChart(Chart):
             return None
         if shape == "square":
             return Rect(x=x - size, y=y - size, width=size * 2, height=size * 2)
+        polygon = self._polygon_path(shape, x, y, size)
+        if polygon is not None:
+            return Path(d=polygon, fill=fill)
+        # default: circle
+        return Circle(cx=x, cy=y, r=size)
+
+    def _polygon_path(self, shape: str, x: float, y: float, size: float) -> str | None:
+        """Path data for the polygon marker shapes, or None for other shapes."""
         if shape == "diamond":
             pts = f"{x},{y - size} {x + size},{y} {x},{y + size} {x - size},{y}"
-            return Path(d=f"M{pts} Z", fill=fill)
+            return f"M{pts} Z"
         if shape == "triangle":
-            pts = self._polygon_points(x, y, size, sides=3)
-            return Path(d=f"M{pts} Z", fill=fill)
+            return f"M{self._polygon_points(x, y, size, sides=3)} Z"
         if shape == "star":
-            pts = self._star_points(x, y, size)
-            return Path(d=f"M{pts} Z", fill=fill)
+            return f"M{self._star_points(x, y, size)} Z"
+        return None
+
+    def _marker_subpath(
+        self, shape: str, x: float, y: float, size: float
+    ) -> str | None:
+        """Path data for one marker, for batching into a ``compact_marks`` path.
+
+        Draws the same geometry as ``_marker_element``: squares as a closed
+        rectangle and circles as two half-circle arcs. Returns None for shape
+        ``"none"``.
+        """
+        if shape == "none":
+            return None
+        polygon = self._polygon_path(shape, x, y, size)
+        if polygon is not None:
+            return polygon
+        left = round_coordinate(x - size)
+        if shape == "square":
+            top = round_coordinate(y - size)
+            side = round_coordinate(size * 2)
+            return f"M{left} {top}h{side}v{side}h{-side}Z"
         # default: circle
-        return Circle(cx=x, cy=y, r=size)
+        diameter = size * 2
+        return (
+            f"M{left} {round_coordinate(y)}"
+            f"a{size} {size} 0 1 0 {diameter} 0a{size} {size} 0 1 0 {-diameter} 0Z"
+        )
 
     # The plot group is rendered with a net vertical flip (see
     # LayoutEngine.get_base_transform), so a vertex placed at the bottom in
@@ -435,7 +492,7 @@ class ScatterChart(Chart):
         line_color = self.theme.resolved_reference_line_color
 
         # Gather placed labels and their anchor markers in plot coordinates.
-        placed: list[_PlacedLabel] = []
+        placed: list[PlacedLabel] = []
         for series_idx, label_row in enumerate(labels):
             if series_idx >= len(self.y_values):
                 break
@@ -475,7 +532,11 @@ class ScatterChart(Chart):
         if not placed:
             return None
 
-        self._deoverlap_labels(placed)
+        self._deoverlap_labels(
+            placed,
+            iterations=self._label_collision_iterations,
+            time_budget=self._label_collision_time_budget,
+        )
 
         g = G()
         # Leader lines first so labels render on top.
@@ -511,91 +572,17 @@ class ScatterChart(Chart):
         return g
 
     @staticmethod
-    def _deoverlap_labels(placed: list[_PlacedLabel], iterations: int = 60) -> None:
-        """Greedily push overlapping label boxes apart, in place.
-
-        Each iteration walks every label pair plus every label/marker pair and,
-        for any overlapping axis-aligned boxes, shifts the label along the axis
-        of least penetration. A small spring pulls each label back toward its
-        own marker so labels do not drift indefinitely. This is a local
-        heuristic with no global guarantee (see ``_render_data_labels``).
+    def _deoverlap_labels(
+        placed: list[PlacedLabel],
+        iterations: int = 60,
+        time_budget: float | None = None,
+    ) -> None:
+        """Push overlapping label boxes apart, in place.
+
+        Runs the shared grid-backed relaxation pass; see
+        :func:`charted.utils.label_placement.relax_labels`.
         """
-
-        def overlap(
-            a_cx: float,
-            a_cy: float,
-            a_w: float,
-            a_h: float,
-            b_cx: float,
-            b_cy: float,
-            b_w: float,
-            b_h: float,
-            pad: float = 2.0,
-        ) -> tuple[float, float] | None:
-            ox = (a_w + b_w) / 2 + pad - abs(a_cx - b_cx)
-            oy = (a_h + b_h) / 2 + pad - abs(a_cy - b_cy)
-            if ox > 0 and oy > 0:
-                return ox, oy
-            return None
-
-        for _ in range(iterations):
-            moved = False
-            for i, a in enumerate(placed):
-                # Label vs every other label.
-                for b in placed[i + 1 :]:
-                    res = overlap(
-                        a["cx"],
-                        a["cy"],
-                        a["w"],
-                        a["h"],
-                        b["cx"],
-                        b["cy"],
-                        b["w"],
-                        b["h"],
-                    )
-                    if res is None:
-                        continue
-                    ox, oy = res
-                    moved = True
-                    if ox < oy:
-                        shift = ox / 2 + 0.1
-                        sign = 1 if a["cx"] >= b["cx"] else -1
-                        a["cx"] += sign * shift
-                        b["cx"] -= sign * shift
-                    else:
-                        shift = oy / 2 + 0.1
-                        sign = 1 if a["cy"] >= b["cy"] else -1
-                        a["cy"] += sign * shift
-                        b["cy"] -= sign * shift
-                # Label vs markers (approximated by their bounding box).
-                for b in placed:
-                    m = b["marker"] * 2
-                    res = overlap(
-                        a["cx"],
-                        a["cy"],
-                        a["w"],
-                        a["h"],
-                        b["px"],
-                        b["py"],
-                        m,
-                        m,
-                    )
-                    if res is None:
-                        continue
-                    ox, oy = res
-                    moved = True
-                    if ox < oy:
-                        sign = 1 if a["cx"] >= b["px"] else -1
-                        a["cx"] += sign * (ox + 0.1)
-                    else:
-                        sign = 1 if a["cy"] >= b["py"] else -1
-                        a["cy"] += sign * (oy + 0.1)
-            # Weak spring back toward the marker keeps labels from wandering.
-            for a in placed:
-                a["cx"] += (a["px"] - a["cx"]) * 0.01
-                a["cy"] += (a["py"] - a["cy"]) * 0.01
-            if not moved:
-                break
+        relax_labels(placed, iterations=iterations, time_budget=time_budget)
 
     def _render_quadrant_labels(self) -> G | None:
         """Render text labels in each quadrant of the scatter plot.
@@ -1,14 +1,38 @@
 """Batch command for charted CLI."""
 
 import argparse
+import dataclasses
+import hashlib
+import json
+import math
+import os
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import NamedTuple
+
+from charted.utils.binary_formats import BINARY_SUFFIXES
+from charted.utils.defaults import DEFAULT_FONT, DEFAULT_FONT_SIZE
 
 from .create import CHART_TYPES, load_data
 
+# Input file types picked up from the input directory.
+DATA_SUFFIXES = (".csv", ".json") + BINARY_SUFFIXES
+
 
 def batch_command(args: argparse.Namespace) -> None:
-    """Generate multiple charts from a directory."""
+    """Generate multiple charts from a directory.
+
+    With ``args.jobs`` above 1 the files are rendered by a process pool
+    (``args.chunksize`` files per task); the report is printed in input order
+    either way, so it reads the same as a serial run.
+
+    A manifest in the output directory records a key for every file rendered
+    successfully (see :func:`_cache_key`); files whose key is unchanged and
+    whose SVG still exists are skipped. ``args.force`` re-renders everything.
+    """
     input_dir = Path(args.input_dir)
     output_dir = Path(args.output_dir)
     override_chart_type = (
@@ -26,7 +50,9 @@ def batch_command(args: argparse.Namespace) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Find all data files
-    data_files = list(input_dir.glob("*.csv")) + list(input_dir.glob("*.json"))
+    data_files = [
+        path for suffix in DATA_SUFFIXES for path in input_dir.glob(f"*{suffix}")
+    ]
 
     if not data_files:
         print(f"Error: No data files found in {input_dir}", file=sys.stderr)
@@ -34,70 +60,248 @@ def batch_command(args: argparse.Namespace) -> None:
 
     print(f"Found {len(data_files)} data files")
 
-    success_count = 0
-    error_count = 0
+    jobs = getattr(args, "jobs", 1)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    chunksize = getattr(args, "chunksize", None)
+    if jobs < 1 or (chunksize is not None and chunksize < 1):
+        print("Error: --jobs and --chunksize must be at least 1", file=sys.stderr)
+        sys.exit(1)
 
+    previous = {} if getattr(args, "force", False) else _load_manifest(output_dir)
+    settings = _settings_fingerprint()
+    keys = {
+        data_file.name: _cache_key(
+            data_file, _resolve_chart_type(data_file, override_chart_type), settings
+        )
+        for data_file in data_files
+    }
+    manifest = {}
+    pending = []
     for data_file in data_files:
-        try:
-            # Determine chart type from filename or override
-            if override_chart_type:
-                chart_type = override_chart_type
-            else:
-                stem = data_file.stem.lower()
-                chart_type = _infer_chart_type(stem)
+        key = keys[data_file.name]
+        if (
+            key is not None
+            and previous.get(data_file.name) == key
+            and (output_dir / f"{data_file.stem}.svg").exists()
+        ):
+            manifest[data_file.name] = key
+        else:
+            pending.append(data_file)
+    unchanged_count = len(data_files) - len(pending)
 
-            if chart_type not in CHART_TYPES:
-                print(f"  Skipping {data_file.name}: unknown chart type in filename")
-                error_count += 1
-                continue
-
-            ChartClass = CHART_TYPES[chart_type]
-            data = load_data(str(data_file))
-
-            chart = ChartClass(**data)
-            svg = chart.html
-
-            output_path = output_dir / f"{data_file.stem}.svg"
-            with open(output_path, "w") as f:
-                f.write(svg)
-
-            print(f"  Created: {output_path.name}")
-            success_count += 1
-
-        except (FileNotFoundError, ValueError, KeyError) as e:
-            # Expected errors from data loading or chart creation
-            error_msg = str(e)
-            print(f"  Error with {data_file.name}: {e}", file=sys.stderr)
-            if "not found" in error_msg:
-                print(
-                    "    Suggestion: Check that the data file exists and is readable",
-                    file=sys.stderr,
-                )
-            elif "chart type" in error_msg.lower() or "key" in error_msg.lower():
-                print(
-                    "    Suggestion: Check data matches expected chart format",
-                    file=sys.stderr,
-                )
-            else:
-                print(
-                    "    Suggestion: Check that your CSV/JSON is properly formatted",
-                    file=sys.stderr,
-                )
-            error_count += 1
-        except Exception as e:
-            # Unexpected errors - log and re-raise for debugging
-            import traceback
+    render = partial(
+        _render_file, output_dir=output_dir, override_chart_type=override_chart_type
+    )
+    jobs = min(jobs, len(pending))
+    if jobs <= 1:
+        results: Iterator[_FileResult] = map(render, pending)
+        executor = None
+    else:
+        if chunksize is None:
+            # Same heuristic as multiprocessing.Pool.map: about four chunks
+            # per worker keeps them busy without a round trip per file.
+            chunksize = max(1, math.ceil(len(pending) / (jobs * 4)))
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker)
+        results = executor.map(render, pending, chunksize=chunksize)
 
-            print(f"  Unexpected error with {data_file.name}: {e}", file=sys.stderr)
-            traceback.print_exc()
-            error_count += 1
+    success_count = 0
+    error_count = 0
+    try:
+        # Results arrive in input order, so the report reads the same as a
+        # serial run whatever order the workers finish in.
+        for data_file, result in zip(pending, results):
+            for to_stderr, text in result.messages:
+                print(text, file=sys.stderr if to_stderr else sys.stdout)
+            if result.ok:
+                success_count += 1
+                key = keys[data_file.name]
+                if key is not None:
+                    manifest[data_file.name] = key
+            else:
+                error_count += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        # Saved even when interrupted, so a rerun resumes where this stopped.
+        _save_manifest(output_dir, manifest)
 
-    print(f"\nCompleted: {success_count} succeeded, {error_count} failed")
+    summary = f"Completed: {success_count} succeeded, {error_count} failed"
+    if unchanged_count:
+        summary += f", {unchanged_count} unchanged"
+    print(f"\n{summary}")
 
     if error_count > 0:
         sys.exit(1)
 
 
+class _FileResult(NamedTuple):
+    """Outcome of rendering one data file.
+
+    ``messages`` holds the report lines as ``(to_stderr, text)`` pairs; they
+    are printed by the parent process so output from parallel workers is not
+    interleaved.
+    """
+
+    ok: bool
+    messages: list[tuple[bool, str]]
+
+
+def _render_file(
+    data_file: Path, output_dir: Path, override_chart_type: str | None
+) -> _FileResult:
+    """Render one data file to ``output_dir``; never raises for a bad file."""
+    messages: list[tuple[bool, str]] = []
+    try:
+        chart_type = _resolve_chart_type(data_file, override_chart_type)
+
+        if chart_type not in CHART_TYPES:
+            messages.append(
+                (False, f"  Skipping {data_file.name}: unknown chart type in filename")
+            )
+            return _FileResult(False, messages)
+
+        ChartClass = CHART_TYPES[chart_type]
+        data = load_data(str(data_file))
+
+        chart = ChartClass(**data)
+
+        output_path = output_dir / f"{data_file.stem}.svg"
+        with open(output_path, "w") as f:
+            chart.write_svg(f)
+
+        messages.append((False, f"  Created: {output_path.name}"))
+        return _FileResult(True, messages)
+
+    except (FileNotFoundError, ValueError, KeyError) as e:
+        # Expected errors from data loading or chart creation
+        error_msg = str(e)
+        messages.append((True, f"  Error with {data_file.name}: {e}"))
+        if "not found" in error_msg:
+            suggestion = "Check that the data file exists and is readable"
+        elif "chart type" in error_msg.lower() or "key" in error_msg.lower():
+            suggestion = "Check data matches expected chart format"
+        else:
+            suggestion = "Check that your data file is properly formatted"
+        messages.append((True, f"    Suggestion: {suggestion}"))
+        return _FileResult(False, messages)
+    except Exception as e:
+        # Unexpected errors - report with the traceback for debugging
+        import traceback
+
+        messages.append((True, f"  Unexpected error with {data_file.name}: {e}"))
+        messages.append((True, traceback.format_exc().rstrip("\n")))
+        return _FileResult(False, messages)
+
+
+def _resolve_chart_type(data_file: Path, override_chart_type: str | None) -> str:
+    """Chart type for ``data_file``: the override, else inferred from its name."""
+    if override_chart_type:
+        return override_chart_type
+    return _infer_chart_type(data_file.stem.lower())
+
+
+# Name of the incremental-build manifest written to the output directory.
+MANIFEST_NAME = ".charted-manifest.json"
+# Bumped whenever the key derivation changes, invalidating older manifests.
+MANIFEST_FORMAT = 1
+# Bytes read at a time when hashing an input file.
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def _load_manifest(output_dir: Path) -> dict[str, str]:
+    """Keys recorded by the previous run, or an empty mapping if unusable."""
+    try:
+        with open(output_dir / MANIFEST_NAME) as f:
+            loaded = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(loaded, dict) or loaded.get("format") != MANIFEST_FORMAT:
+        return {}
+    files = loaded.get("files")
+    if not isinstance(files, dict):
+        return {}
+    return {str(name): str(key) for name, key in files.items()}
+
+
+def _save_manifest(output_dir: Path, files: dict[str, str]) -> None:
+    """Write the manifest atomically so an interrupted run cannot corrupt it."""
+    path = output_dir / MANIFEST_NAME
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(
+            {"format": MANIFEST_FORMAT, "files": dict(sorted(files.items()))},
+            f,
+            indent=1,
+        )
+    os.replace(tmp_path, path)
+
+
+def _settings_fingerprint() -> str:
+    """Digest of everything besides the input that shapes the output.
+
+    Covers the charted version and the resolved default theme together with
+    the loaded ``.chartedrc`` (which carries the per-chart-type theme
+    overrides), so upgrading charted or editing the config re-renders every
+    file.
+    """
+    from charted import __version__
+    from charted.config import load_config
+    from charted.utils.theme_manager import ThemeManager
+
+    settings = {
+        "version": __version__,
+        "theme": dataclasses.asdict(ThemeManager.load_theme(None)),
+        "config": load_config(),
+    }
+    encoded = json.dumps(settings, sort_keys=True, default=repr)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _cache_key(data_file: Path, chart_type: str, settings: str) -> str | None:
+    """Content-addressed key for rendering ``data_file`` as ``chart_type``.
+
+    ``None`` if the file cannot be read; it is then always rendered, and the
+    render reports the error.
+    """
+    try:
+        content = _file_digest(data_file)
+    except OSError:
+        return None
+    return hashlib.sha256(f"{content}:{chart_type}:{settings}".encode()).hexdigest()
+
+
+def _file_digest(path: Path) -> str:
+    """SHA-256 of a file, streamed so multi-GB inputs are never held whole."""
+    with open(path, "rb") as f:
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _init_worker() -> None:
+    """Warm a pool worker's caches before it takes its first file.
+
+    Loads the default theme and the font metrics tables the default theme
+    measures with, so each worker parses them once up front instead of the
+    first file in every worker paying for it.
+    """
+    from charted.utils.helpers import calculate_text_dimensions
+    from charted.utils.theme_manager import ThemeManager
+
+    theme = ThemeManager.load_theme(None)
+    for font, size in (
+        (DEFAULT_FONT, DEFAULT_FONT_SIZE),
+        (theme.title_font_family, theme.title_font_size),
+        (theme.title_font_family, theme.title_font_size - 4),
+        (theme.legend_font_family, theme.legend_font_size),
+    ):
+        calculate_text_dimensions("0", font=font, font_size=size)
+
+
 def _infer_chart_type(filename: str) -> str:
     """Infer chart type from filename."""
     # Look for chart type keywords in filename
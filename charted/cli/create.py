@@ -23,6 +23,8 @@ from ..charts import (
     SankeyChart,
     ScatterChart,
 )
+from ..utils.binary_formats import BINARY_SUFFIXES, read_columns
+from ..utils.buffers import SeriesView
 from ..utils.types import ChartDataDict, ComboSeriesDict
 
 CHART_TYPES = {
@@ -45,10 +47,11 @@ CHART_TYPES = {
 
 
 def load_data(data_path: str, transpose: bool = False) -> ChartDataDict:
-    """Load data from CSV or JSON file.
+    """Load data from a CSV, JSON or binary (.npy/.npz/Arrow/Parquet) file.
 
     Args:
-        data_path: Path to a .csv or .json file.
+        data_path: Path to a .csv, .json, .npy, .npz, .arrow, .feather or
+            .parquet file.
         transpose: Only applies to CSV. When False (default) the first column
             holds the x-axis labels and every other column is a data series.
             When True the layout is read sideways: each data row becomes a
@@ -67,8 +70,13 @@ def load_data(data_path: str, transpose: bool = False) -> ChartDataDict:
             return cast("ChartDataDict", json.load(f))
     elif suffix == ".csv":
         return _parse_csv(path, transpose=transpose)
+    elif suffix in BINARY_SUFFIXES:
+        return _read_binary(path)
     else:
-        raise ValueError(f"Unsupported file format: {suffix}. Use .csv or .json")
+        raise ValueError(
+            f"Unsupported file format: {suffix}. Use .csv, .json, .npy, .npz, "
+            ".arrow, .feather or .parquet"
+        )
 
 
 def _to_number(value: str) -> float | str:
@@ -147,6 +155,32 @@ def _parse_csv_transposed(path: Path) -> ChartDataDict:
     return result
 
 
+def _read_binary(path: Path) -> ChartDataDict:
+    """Map a binary file's columns onto the chart data dict.
+
+    Numeric columns stay zero-copy views over the mapped file and each
+    becomes a series, named after its column. The first non-numeric column,
+    if any, supplies the x-axis labels.
+    """
+    columns = read_columns(path)
+    series = {name: col for name, col in columns.items() if isinstance(col, SeriesView)}
+    if not series:
+        raise ValueError(f"No numeric columns found in {path.name}")
+    labels = next(
+        (col for col in columns.values() if not isinstance(col, SeriesView)), None
+    )
+
+    result: ChartDataDict = {}
+    if len(series) == 1:
+        result["data"] = next(iter(series.values()))
+    else:
+        result["data"] = list(series.values())
+        result["series_names"] = list(series)
+    if labels is not None:
+        result["labels"] = labels
+    return result
+
+
 def _build_combo_kwargs(data: ChartDataDict) -> ChartDataDict:
     """Map loaded data into ComboChart's series-based keyword arguments.
 
@@ -290,12 +324,11 @@ def create_command(args: argparse.Namespace) -> None:
     # Create chart
     try:
         chart = ChartClass(**data)
-        svg = chart.html
 
-        # Write output
+        # Stream the SVG to disk rather than building it as one string first.
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, "w") as f:
-            f.write(svg)
+            chart.write_svg(f)
 
         print(f"Chart saved to: {output_path}")
     except (ValueError, FileNotFoundError) as e:
@@ -0,0 +1,29 @@
+import argparse
+
+from charted.fonts.compiled import compile_definitions
+from charted.utils.defaults import BASE_DEFINITIONS_DIR
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compile JSON font definitions into the binary mmap format."
+    )
+
+    parser.add_argument(
+        "definitions_dir",
+        nargs="?",
+        type=str,
+        help="Directory holding the <family>.json definitions.",
+        default=BASE_DEFINITIONS_DIR,
+    )
+    parser.add_argument(
+        "output_dir",
+        nargs="?",
+        type=str,
+        help="Where to write <family>.bin files (defaults to definitions_dir).",
+        default=None,
+    )
+
+    args = parser.parse_args()
+
+    for path in compile_definitions(args.definitions_dir, args.output_dir):
+        print(path)
@@ -1,14 +1,51 @@
 """Data loading utilities for charted.
 
-Provides functions to load data from various file formats (CSV, JSON, TSV)
-without requiring external dependencies like pandas.
+Provides functions to load data from various file formats (CSV, JSON, TSV,
+and the binary ``.npy``/``.npz``/Arrow/Parquet formats) without requiring
+external dependencies like pandas. Files may be gzip or
+zstd compressed; compression is detected from the file's magic bytes.
+
+For large CSV/TSV files, :func:`stream_csv` reads the file a chunk of rows at
+a time and keeps only the requested columns, as packed ``array('d')``
+buffers that charts accept without conversion. Binary files go through
+:func:`load_columns`, which memory-maps them and returns zero-copy views.
 """
 
-__all__ = ["load_data", "load_csv", "load_json"]
+from __future__ import annotations
+
+__all__ = [
+    "BadRow",
+    "CsvColumns",
+    "load_columns",
+    "load_data",
+    "load_csv",
+    "load_json",
+    "stream_csv",
+]
 
 import csv
+import dataclasses
+import gzip
+import importlib
+import io
 import json
+from array import array
+from collections.abc import Iterable, Sequence
+from itertools import islice
 from pathlib import Path
+from typing import IO, NamedTuple, cast
+
+from charted.utils.binary_formats import BINARY_SUFFIXES, Column, read_columns
+from charted.utils.buffers import SeriesView
+
+# Rows parsed and converted per batch by stream_csv().
+CHUNK_ROWS = 4096
+# Buffer size for reading (and decompressing) input files.
+READ_BUFFER_SIZE = 1 << 20
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_COMPRESSED_SUFFIXES = (".gz", ".zst")
 
 
 def load_data(
@@ -19,12 +56,15 @@ def load_data(
 ) -> tuple[list[str], list[float], list[str]]:
     """Load data from a file and return x_data, y_data, and labels.
 
-    Auto-detects file format based on extension (.csv, .tsv, .json).
+    Auto-detects file format based on extension (.csv, .tsv, .json, .npy,
+    .npz, .arrow, .feather, .parquet).
 
     Args:
         source: Path to the data file.
-        x_col: Column name for x-axis data (required for CSV/TSV).
-        y_col: Column name for y-axis data (required for CSV/TSV).
+        x_col: Column name for x-axis data (required for CSV/TSV; optional
+            for binary files, which default to index labels).
+        y_col: Column name for y-axis data (required for CSV/TSV, and for
+            binary files holding more than one numeric column).
         delimiter: Field delimiter for CSV/TSV (auto-detected if None).
 
     Returns:
@@ -52,14 +92,60 @@ def load_data(
     if not source.exists():
         raise FileNotFoundError(f"Data file not found: {source}")
 
-    suffix = source.suffix.lower()
+    suffix = _data_suffix(source)
 
     if suffix in (".csv", ".tsv"):
         return _load_csv(source, x_col, y_col, delimiter)
     elif suffix == ".json":
         return _load_json(source)
+    elif suffix in BINARY_SUFFIXES:
+        return _load_binary(source, x_col, y_col)
     else:
-        raise ValueError(f"Unsupported file format: {suffix}. Use .csv, .tsv, or .json")
+        raise ValueError(
+            f"Unsupported file format: {suffix}. Use .csv, .tsv, .json, .npy, "
+            ".npz, .arrow, .feather, or .parquet"
+        )
+
+
+def load_columns(source: str | Path) -> dict[str, SeriesView | list[str]]:
+    """Load every column of a binary data file without copying it.
+
+    ``.npy`` and ``.npz`` files are memory-mapped and read without NumPy;
+    Arrow IPC/Feather and Parquet files need pyarrow. Numeric columns come
+    back as :class:`~charted.utils.buffers.SeriesView` objects over the
+    mapped file, which charts accept as ``data`` directly, so a
+    multi-million point series is never converted to Python floats. Other
+    columns (Arrow strings, dates) come back as lists of strings.
+
+    A two-dimensional array becomes one column per row, named
+    ``<name>_<i>``.
+
+    Args:
+        source: Path to a ``.npy``, ``.npz``, ``.arrow``/``.feather``/``.ipc``
+            or ``.parquet`` file.
+
+    Returns:
+        Columns by name, in file order.
+
+    Raises:
+        FileNotFoundError: If the source file doesn't exist.
+        ValueError: If the format or dtype is unsupported, or the file is
+            malformed.
+        ImportError: For Arrow/Parquet files when pyarrow is not installed.
+
+    Example:
+        >>> columns = load_columns("prices.npz")
+        >>> chart = LineChart(data=columns["close"])
+    """
+    source = Path(source)
+    if not source.exists():
+        raise FileNotFoundError(f"Data file not found: {source}")
+    if source.suffix.lower() not in BINARY_SUFFIXES:
+        raise ValueError(
+            f"Unsupported binary format: {source.suffix}. "
+            f"Use one of {', '.join(BINARY_SUFFIXES)}"
+        )
+    return read_columns(source)
 
 
 def _load_csv(
@@ -69,50 +155,58 @@ def _load_csv(
     delimiter: str | None,
 ) -> tuple[list[str], list[float], list[str]]:
     """Load data from a CSV or TSV file."""
-    if delimiter is None:
-        delimiter = "\t" if path.suffix == ".tsv" else ","
-
     if x_col is None or y_col is None:
         raise ValueError("x_col and y_col are required for CSV/TSV files")
 
-    x_data: list[str] = []
-    y_data: list[float] = []
-    labels: list[str] = []
+    result = stream_csv(
+        path, [y_col], label_col=x_col, delimiter=delimiter, errors="raise"
+    )
+
+    # Use y_col name as series label
+    labels = [y_col]
 
-    with open(path, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=delimiter)
+    return cast("list[str]", result.labels), result.columns[y_col].tolist(), labels
 
-        # Validate columns exist
-        if reader.fieldnames is None:
-            raise ValueError(f"Empty or invalid CSV file: {path}")
 
-        if x_col not in reader.fieldnames:
-            raise ValueError(
-                f"Column '{x_col}' not found in {path}. Available: {reader.fieldnames}"
-            )
-        if y_col not in reader.fieldnames:
+def _load_binary(
+    path: Path,
+    x_col: str | None,
+    y_col: str | None,
+) -> tuple[list[str], list[float], list[str]]:
+    """Load one series from a binary file as lists, like the other formats."""
+    columns = load_columns(path)
+    numeric = [name for name, col in columns.items() if isinstance(col, SeriesView)]
+    if y_col is None:
+        if len(numeric) != 1:
             raise ValueError(
-                f"Column '{y_col}' not found in {path}. Available: {reader.fieldnames}"
+                f"y_col is required for {path.name}: it has {len(numeric)} numeric "
+                f"columns ({', '.join(numeric)})"
             )
+        y_col = numeric[0]
+    y_values = _binary_column(columns, y_col, path)
+    if not isinstance(y_values, SeriesView):
+        raise ValueError(f"Column '{y_col}' in {path.name} is not numeric")
+    if x_col is None:
+        x_data = [str(i) for i in range(len(y_values))]
+    else:
+        x_values = _binary_column(columns, x_col, path)
+        x_data = [str(v) for v in x_values]
+    return x_data, [float(v) for v in y_values], [y_col]
 
-        for row in reader:
-            x_data.append(row[x_col])
-            try:
-                y_data.append(float(row[y_col]))
-            except (ValueError, TypeError):
-                raise ValueError(
-                    f"Invalid numeric value in column '{y_col}': {row[y_col]}"
-                )
-
-    # Use y_col name as series label
-    labels = [y_col]
 
-    return x_data, y_data, labels
+def _binary_column(columns: dict[str, Column], name: str, path: Path) -> Column:
+    try:
+        return columns[name]
+    except KeyError:
+        raise ValueError(
+            f"Column '{name}' not found in {path.name}. "
+            f"Available columns: {', '.join(columns)}"
+        ) from None
 
 
 def _load_json(path: Path) -> tuple[list[str], list[float], list[str]]:
     """Load data from a JSON file."""
-    with open(path, "r", encoding="utf-8") as f:
+    with _open_text(path) as f:
         data = json.load(f)
 
     # Handle different JSON structures
@@ -207,3 +301,227 @@ def load_json(path: str | Path) -> tuple[list[str], list[float], list[str]]:
         >>> x, y, labels = load_json("sales.json")
     """
     return load_data(path)
+
+
+class BadRow(NamedTuple):
+    """A CSV row :func:`stream_csv` skipped.
+
+    Attributes:
+        row: 1-based data row number (the header is not counted).
+        reason: Why the row was rejected.
+    """
+
+    row: int
+    reason: str
+
+
+@dataclasses.dataclass
+class CsvColumns:
+    """Columns projected out of a CSV/TSV file by :func:`stream_csv`.
+
+    Attributes:
+        columns: Each requested numeric column, in request order.
+        labels: The ``label_col`` values, or None if none was requested.
+        bad_rows: The first ``max_bad_rows`` skipped rows.
+        bad_row_count: Total number of skipped rows.
+    """
+
+    columns: dict[str, array[float]]
+    labels: list[str] | None = None
+    bad_rows: list[BadRow] = dataclasses.field(default_factory=list)
+    bad_row_count: int = 0
+
+    @property
+    def rows(self) -> int:
+        """Number of rows loaded."""
+        return len(next(iter(self.columns.values()), ()))
+
+
+def stream_csv(
+    source: str | Path,
+    columns: Sequence[str],
+    label_col: str | None = None,
+    delimiter: str | None = None,
+    errors: str = "report",
+    max_bad_rows: int = 100,
+) -> CsvColumns:
+    """Load selected numeric columns from a CSV/TSV file in bounded memory.
+
+    The file is read a chunk of rows at a time; only ``columns`` (and
+    ``label_col``) are kept, the numeric ones as ``array('d')`` buffers, so
+    memory grows with the selected data rather than the file. Gzip and zstd
+    compressed files are decompressed on the fly.
+
+    Args:
+        source: Path to the CSV/TSV file, optionally compressed.
+        columns: Names of the numeric columns to load.
+        label_col: Optional column to load as string labels.
+        delimiter: Field delimiter (comma by default, tab for .tsv).
+        errors: "report" skips malformed rows (too few fields, or a
+            non-numeric value in a numeric column) and records them in the
+            result; "raise" raises ValueError at the first one.
+        max_bad_rows: How many skipped rows to keep in ``bad_rows``.
+
+    Returns:
+        The loaded columns and a report of skipped rows.
+
+    Raises:
+        FileNotFoundError: If the source file doesn't exist.
+        ValueError: If the file has no header or a column is missing.
+        ImportError: If the file is zstd compressed and no zstd module is
+            available.
+
+    Example:
+        >>> result = stream_csv("requests.csv.gz", ["latency_ms"], label_col="ts")
+        >>> chart = LineChart(data=result.columns["latency_ms"], labels=result.labels)
+    """
+    if errors not in ("report", "raise"):
+        raise ValueError(f"errors must be 'report' or 'raise', not {errors!r}")
+    path = Path(source)
+    if not path.exists():
+        raise FileNotFoundError(f"Data file not found: {path}")
+    if delimiter is None:
+        delimiter = "\t" if _data_suffix(path) == ".tsv" else ","
+
+    with _open_text(path) as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if not header:
+            raise ValueError(f"Empty or invalid CSV file: {path}")
+        wanted = list(columns) + ([label_col] if label_col is not None else [])
+        for name in wanted:
+            if name not in header:
+                raise ValueError(
+                    f"Column '{name}' not found in {path}. Available: {header}"
+                )
+
+        indices = [header.index(name) for name in columns]
+        label_idx = header.index(label_col) if label_col is not None else None
+        result = CsvColumns(
+            columns={name: array("d") for name in columns},
+            labels=[] if label_col is not None else None,
+        )
+        loader = _ChunkLoader(result, columns, indices, label_idx, errors, max_bad_rows)
+        while chunk := list(islice(reader, CHUNK_ROWS)):
+            loader.add(chunk)
+    return result
+
+
+class _ChunkLoader:
+    """Appends chunks of parsed CSV rows to a :class:`CsvColumns`.
+
+    A clean chunk is transposed with ``zip`` and each column converted by a
+    single ``array('d', map(float, ...))``. Only a chunk that fails is
+    re-read row by row to find, report and skip its malformed rows.
+    """
+
+    def __init__(
+        self,
+        result: CsvColumns,
+        names: Sequence[str],
+        indices: list[int],
+        label_idx: int | None,
+        errors: str,
+        max_bad_rows: int,
+    ) -> None:
+        self.result = result
+        self.arrays = [result.columns[name] for name in names]
+        self.names = list(names)
+        self.indices = indices
+        self.label_idx = label_idx
+        self.needed = max(indices + ([label_idx] if label_idx is not None else []))
+        self.errors = errors
+        self.max_bad_rows = max_bad_rows
+        self.row_number = 0
+
+    def add(self, chunk: list[list[str]]) -> None:
+        first = self.row_number + 1
+        self.row_number += len(chunk)
+        # Blank lines are skipped silently, as csv.DictReader does.
+        rows = [row for row in chunk if row]
+        if len(rows) == len(chunk) and all(len(row) > self.needed for row in rows):
+            try:
+                converted = [
+                    array("d", map(float, [row[i] for row in rows]))
+                    for i in self.indices
+                ]
+            except ValueError:
+                pass
+            else:
+                for target, values in zip(self.arrays, converted):
+                    target.extend(values)
+                self._add_labels(rows)
+                return
+        self._add_rows(chunk, first)
+
+    def _add_labels(self, rows: Iterable[list[str]]) -> None:
+        if self.label_idx is not None:
+            labels = cast("list[str]", self.result.labels)
+            labels.extend(row[self.label_idx] for row in rows)
+
+    def _add_rows(self, chunk: list[list[str]], first: int) -> None:
+        for number, row in enumerate(chunk, start=first):
+            if not row:
+                continue
+            if len(row) <= self.needed:
+                self._bad(number, f"expected {self.needed + 1} fields, got {len(row)}")
+                continue
+            values = []
+            for name, i in zip(self.names, self.indices):
+                try:
+                    values.append(float(row[i]))
+                except ValueError:
+                    self._bad(
+                        number, f"Invalid numeric value in column '{name}': {row[i]}"
+                    )
+                    break
+            else:
+                for target, value in zip(self.arrays, values):
+                    target.append(value)
+                self._add_labels([row])
+
+    def _bad(self, number: int, reason: str) -> None:
+        if self.errors == "raise":
+            raise ValueError(f"Row {number}: {reason}")
+        self.result.bad_row_count += 1
+        if len(self.result.bad_rows) < self.max_bad_rows:
+            self.result.bad_rows.append(BadRow(number, reason))
+
+
+def _data_suffix(path: Path) -> str:
+    """The format suffix of ``path``, looking through a compression suffix."""
+    suffixes = [s.lower() for s in path.suffixes]
+    if len(suffixes) > 1 and suffixes[-1] in _COMPRESSED_SUFFIXES:
+        return suffixes[-2]
+    return path.suffix.lower()
+
+
+def _open_text(path: Path) -> IO[str]:
+    """Open ``path`` for reading as UTF-8 text, decompressing if needed."""
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    binary: IO[bytes]
+    if magic.startswith(_GZIP_MAGIC):
+        binary = io.BufferedReader(
+            cast("io.RawIOBase", gzip.open(path, "rb")), READ_BUFFER_SIZE
+        )
+    elif magic == _ZSTD_MAGIC:
+        binary = _zstd_open(path)
+    else:
+        binary = open(path, "rb", buffering=READ_BUFFER_SIZE)
+    return io.TextIOWrapper(binary, encoding="utf-8", newline="")
+
+
+def _zstd_open(path: Path) -> IO[bytes]:
+    """Open zstd-compressed ``path`` with the stdlib module or zstandard."""
+    try:
+        zstd = importlib.import_module("compression.zstd")  # Python 3.14+
+    except ImportError:
+        try:
+            zstd = importlib.import_module("zstandard")
+        except ImportError:
+            raise ImportError(
+                "Reading zstd-compressed files requires Python 3.14+ or the "
+                "zstandard package. Install it with: pip install zstandard"
+            ) from None
+    return cast("IO[bytes]", zstd.open(path, "rb"))
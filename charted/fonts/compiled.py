@@ -0,0 +1,400 @@
+"""Binary precompiled font definitions loaded through ``mmap``.
+
+The JSON files under ``charted/fonts/definitions`` stay the source of truth;
+this module converts them into a compact binary form at build time (see
+``hatch_build.py``) and reads that form back without parsing. The file is
+mapped read-only and measurement indexes the mapped tables directly, so every
+forked render worker shares the same physical pages instead of holding its own
+parsed copy.
+
+Layout (all little-endian)::
+
+    header   magic b"CHFM", u16 version, u16 size count, u32 reserved,
+             32-byte SHA-256 of the source JSON, 4 pad bytes
+    index    per size: u16 font size, u8 table flags, u8 pad,
+             u32 dense count, u32 sparse count, u32 data offset,
+             f64 max glyph height
+    tables   per size, each array 8-byte aligned:
+             dense widths[dense], dense heights[dense],
+             sparse codepoints u32[sparse], sparse widths[sparse],
+             sparse heights[sparse], glyph flags u8[dense + sparse]
+
+Glyphs below :data:`DENSE_LIMIT` (Latin-1, nearly every label character) live
+in dense tables indexed by codepoint, with :data:`MISSING` marking gaps; the
+few symbols above it are stored sorted and found by binary search. A width or
+height column is stored as i32 when every value in it is an int and as f64
+otherwise, so values read back with the exact type the JSON held and
+measurements format identically in SVG output. Metrics stay f64 rather than
+f32: narrowing would perturb fractional advances such as ``4.8`` and shift
+rendered coordinates.
+
+The source digest lets a loader tell whether the binary still matches the
+JSON next to it; file timestamps do not survive checkouts and copies.
+
+This module imports nothing from ``charted`` at runtime, so the wheel build
+hook can load it by path without importing the package.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, NamedTuple, cast
+
+if TYPE_CHECKING:
+    from charted.utils.types import CharMetrics, FontDefinition
+
+# Extension of a compiled definition, written next to (or in place of) the
+# ``<family>.json`` it was converted from.
+COMPILED_SUFFIX = ".bin"
+
+MAGIC = b"CHFM"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sHHI32s4x")
+_INDEX_ENTRY = struct.Struct("<HBxIIId")
+
+# Codepoints below this are stored in dense, directly indexed tables.
+DENSE_LIMIT = 256
+
+# Width and height stored for a dense slot the definition does not cover.
+MISSING = -1
+
+# Per-table flag bits.
+TABLE_WIDTH_INT = 0x1
+TABLE_HEIGHT_INT = 0x2
+TABLE_MAX_HEIGHT_INT = 0x4
+# A column mixes ints and floats, so only the per-glyph flags say which
+# values were ints.
+TABLE_MIXED = 0x8
+
+# Per-glyph flag bits.
+FLAG_PRESENT = 0x1
+FLAG_WIDTH_INT = 0x2
+FLAG_HEIGHT_INT = 0x4
+
+_I32_MAX = 2**31 - 1
+
+# Array typecodes used by the tables: i32 and f64 metrics, u32 codepoints.
+_Typecode = Literal["i", "I", "d"]
+
+
+class CompiledFontError(ValueError):
+    """Raised when a compiled definition is truncated or has the wrong format."""
+
+
+class CompiledTable(NamedTuple):
+    """Zero-copy views over one font size's glyph tables.
+
+    ``dense_widths``/``dense_heights`` are indexed by codepoint and hold
+    :data:`MISSING` for uncovered slots. ``codepoints`` is sorted and
+    parallel to ``sparse_widths``/``sparse_heights``. ``flags`` holds the
+    per-glyph bits, dense slots first.
+    """
+
+    dense_widths: Sequence[float]
+    dense_heights: Sequence[float]
+    codepoints: Sequence[int]
+    sparse_widths: Sequence[float]
+    sparse_heights: Sequence[float]
+    flags: Sequence[int]
+    max_height: float
+    mixed: bool
+
+    def lookup(self, code: int) -> tuple[float, float] | None:
+        """``(width, height)`` of glyph ``code``, or ``None`` if absent."""
+        if code < len(self.dense_widths):
+            width = self.dense_widths[code]
+            if width < 0:
+                return None
+            return width, self.dense_heights[code]
+        codepoints = self.codepoints
+        i = bisect_left(codepoints, code)
+        if i == len(codepoints) or codepoints[i] != code:
+            return None
+        return self.sparse_widths[i], self.sparse_heights[i]
+
+
+def source_digest(data: bytes) -> bytes:
+    """Digest of a JSON definition's bytes, as stored in the header."""
+    return hashlib.sha256(data).digest()
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _table_array(typecode: _Typecode, values: Sequence[float]) -> bytes:
+    packed = array(typecode, values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    data = packed.tobytes()
+    return data + bytes(_align(len(data)) - len(data))
+
+
+def _column_type(values: Sequence[float]) -> tuple[_Typecode, bool]:
+    """Typecode for a metric column and whether it mixes ints and floats."""
+    ints = [type(v) is int for v in values]
+    if all(ints) and all(-_I32_MAX <= v <= _I32_MAX for v in values):
+        return "i", False
+    return "d", any(ints)
+
+
+def _encode_table(
+    glyphs: Mapping[int, CharMetrics],
+) -> tuple[int, int, int, float, bytes]:
+    """Pack one size's glyphs.
+
+    Returns the table flags, dense and sparse counts, tallest glyph height and
+    the packed arrays.
+    """
+    entries = sorted(glyphs.items())
+    dense = [(code, m) for code, m in entries if code < DENSE_LIMIT]
+    sparse = [(code, m) for code, m in entries if code >= DENSE_LIMIT]
+    dense_count = dense[-1][0] + 1 if dense else 0
+
+    width_type, width_mixed = _column_type([m["width"] for _, m in entries])
+    height_type, height_mixed = _column_type([m["height"] for _, m in entries])
+    dense_widths: list[float] = [MISSING] * dense_count
+    dense_heights: list[float] = [MISSING] * dense_count
+    dense_flags = bytearray(dense_count)
+    for code, m in dense:
+        dense_widths[code] = m["width"]
+        dense_heights[code] = m["height"]
+    glyph_flags = [
+        FLAG_PRESENT
+        | (FLAG_WIDTH_INT if type(m["width"]) is int else 0)
+        | (FLAG_HEIGHT_INT if type(m["height"]) is int else 0)
+        for _, m in entries
+    ]
+    for (code, _), flag in zip(dense, glyph_flags):
+        dense_flags[code] = flag
+
+    # Tallest glyph, taken in the definition's own order so ties keep the
+    # type the JSON loader would report.
+    max_height: float = 0
+    for metrics in glyphs.values():
+        max_height = max(max_height, metrics["height"])
+
+    flags = (
+        (TABLE_WIDTH_INT if width_type == "i" else 0)
+        | (TABLE_HEIGHT_INT if height_type == "i" else 0)
+        | (TABLE_MAX_HEIGHT_INT if type(max_height) is int else 0)
+        | (TABLE_MIXED if width_mixed or height_mixed else 0)
+    )
+    table = (
+        _table_array(width_type, dense_widths)
+        + _table_array(height_type, dense_heights)
+        + _table_array("I", [code for code, _ in sparse])
+        + _table_array(width_type, [m["width"] for _, m in sparse])
+        + _table_array(height_type, [m["height"] for _, m in sparse])
+        + bytes(dense_flags)
+        + bytes(glyph_flags[len(dense) :])
+    )
+    return flags, dense_count, len(sparse), max_height, table
+
+
+def encode_definition(
+    definition: Mapping[int, Mapping[int, CharMetrics]]
+    | Mapping[str, Mapping[str, CharMetrics]],
+    digest: bytes = b"",
+) -> bytes:
+    """Serialize a font definition (size -> codepoint -> metrics) to bytes.
+
+    Accepts both the generator's int-keyed lookup and a loaded JSON
+    definition keyed by strings. ``digest`` is the :func:`source_digest` of
+    the JSON the definition was read from; leave it empty when there is none.
+    """
+    sizes = sorted(
+        (int(size), {int(code): m for code, m in glyphs.items()})
+        for size, glyphs in definition.items()
+    )
+    index_end = _HEADER.size + _INDEX_ENTRY.size * len(sizes)
+    index = bytearray()
+    body = bytearray()
+    offset = _align(index_end)
+
+    for size, glyphs in sizes:
+        flags, dense_count, sparse_count, max_height, table = _encode_table(glyphs)
+        index += _INDEX_ENTRY.pack(
+            size, flags, dense_count, sparse_count, offset, max_height
+        )
+        padded = _align(len(table))
+        body += table + bytes(padded - len(table))
+        offset += padded
+
+    header = _HEADER.pack(MAGIC, VERSION, len(sizes), 0, digest.ljust(32, b"\0"))
+    return header + bytes(index) + bytes(_align(index_end) - index_end) + body
+
+
+def _column(view: memoryview, typecode: _Typecode) -> Sequence[float]:
+    """Typed view of ``view``'s values (a swapped copy on big-endian hosts)."""
+    if sys.byteorder != "little":
+        swapped = array(typecode, view.tobytes())
+        swapped.byteswap()
+        return swapped
+    return cast("Sequence[float]", view.cast(typecode))
+
+
+class CompiledDefinition:
+    """A compiled font definition mapped read-only into memory.
+
+    Tables are exposed as ``memoryview`` slices of the mapping, so looking up a
+    size copies nothing; measuring indexes the mapped pages directly.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.digest, self._index = self._read_index()
+        except CompiledFontError:
+            self._map.close()
+            raise
+
+    def _read_index(
+        self,
+    ) -> tuple[bytes, dict[str, tuple[int, int, int, int, float]]]:
+        if len(self._map) < _HEADER.size:
+            raise CompiledFontError(f"{self.path}: truncated header")
+        magic, version, count, _, digest = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise CompiledFontError(f"{self.path}: not a v{VERSION} compiled font")
+        index: dict[str, tuple[int, int, int, int, float]] = {}
+        for n in range(count):
+            entry = _HEADER.size + n * _INDEX_ENTRY.size
+            if entry + _INDEX_ENTRY.size > len(self._map):
+                raise CompiledFontError(f"{self.path}: truncated index")
+            size, flags, dense, sparse, offset, max_height = _INDEX_ENTRY.unpack_from(
+                self._map, entry
+            )
+            if offset + self._table_size(flags, dense, sparse) > len(self._map):
+                raise CompiledFontError(f"{self.path}: truncated table {size}")
+            index[str(size)] = (flags, dense, sparse, offset, max_height)
+        return cast("bytes", digest), index
+
+    @staticmethod
+    def _table_size(flags: int, dense: int, sparse: int) -> int:
+        width = 4 if flags & TABLE_WIDTH_INT else 8
+        height = 4 if flags & TABLE_HEIGHT_INT else 8
+        return (
+            _align(dense * width)
+            + _align(dense * height)
+            + _align(sparse * 4)
+            + _align(sparse * width)
+            + _align(sparse * height)
+            + dense
+            + sparse
+        )
+
+    def matches(self, json_bytes: bytes) -> bool:
+        """True when this file was compiled from exactly ``json_bytes``."""
+        return self.digest == source_digest(json_bytes)
+
+    def sizes(self) -> list[str]:
+        """Size keys present, in the string form JSON definitions use."""
+        return list(self._index)
+
+    def table(self, size_key: str) -> CompiledTable | None:
+        """Views over the tables for ``size_key``, or ``None`` if absent."""
+        entry = self._index.get(size_key)
+        if entry is None:
+            return None
+        flags, dense, sparse, offset, max_height = entry
+        width_type: _Typecode = "i" if flags & TABLE_WIDTH_INT else "d"
+        height_type: _Typecode = "i" if flags & TABLE_HEIGHT_INT else "d"
+        width_size = 4 if flags & TABLE_WIDTH_INT else 8
+        height_size = 4 if flags & TABLE_HEIGHT_INT else 8
+        view = memoryview(self._map)
+        columns: list[Sequence[float]] = []
+        layout: tuple[tuple[_Typecode, int, int], ...] = (
+            (width_type, width_size, dense),
+            (height_type, height_size, dense),
+            ("I", 4, sparse),
+            (width_type, width_size, sparse),
+            (height_type, height_size, sparse),
+        )
+        for typecode, item, count in layout:
+            column = view[offset : offset + item * count]
+            columns.append(_column(column, typecode))
+            offset += _align(item * count)
+        glyph_flags = view[offset : offset + dense + sparse]
+        return CompiledTable(
+            columns[0],
+            columns[1],
+            cast("Sequence[int]", columns[2]),
+            columns[3],
+            columns[4],
+            glyph_flags,
+            int(max_height) if flags & TABLE_MAX_HEIGHT_INT else max_height,
+            bool(flags & TABLE_MIXED),
+        )
+
+    def glyphs(self, size_key: str) -> dict[str, CharMetrics]:
+        """One size as the JSON-shaped codepoint -> metrics dict."""
+        table = self.table(size_key)
+        if table is None:
+            return {}
+        dense = len(table.dense_widths)
+        entries = [
+            (code, table.dense_widths[code], table.dense_heights[code], flag)
+            for code, flag in enumerate(table.flags[:dense])
+            if flag & FLAG_PRESENT
+        ]
+        entries += zip(
+            table.codepoints,
+            table.sparse_widths,
+            table.sparse_heights,
+            table.flags[dense:],
+        )
+        return {
+            str(code): {
+                "width": int(width) if flag & FLAG_WIDTH_INT else float(width),
+                "height": int(height) if flag & FLAG_HEIGHT_INT else float(height),
+            }
+            for code, width, height, flag in entries
+        }
+
+    def to_definition(self) -> FontDefinition:
+        """Rebuild the JSON-shaped definition (for callers needing the dict)."""
+        return {size_key: self.glyphs(size_key) for size_key in self._index}
+
+
+def compiled_path(json_path: str | os.PathLike[str]) -> Path:
+    """Path of the compiled definition for a ``<family>.json`` file."""
+    return Path(json_path).with_suffix(COMPILED_SUFFIX)
+
+
+def compile_definitions(
+    definitions_dir: str | os.PathLike[str],
+    output_dir: str | os.PathLike[str] | None = None,
+) -> list[Path]:
+    """Convert every JSON definition in a directory to the binary format.
+
+    Args:
+        definitions_dir: Directory holding ``<family>.json`` definitions.
+        output_dir: Where to write ``<family>.bin`` files. Defaults to
+            ``definitions_dir``.
+
+    Returns:
+        Paths of the compiled files written.
+    """
+    import json
+
+    target = Path(output_dir) if output_dir is not None else Path(definitions_dir)
+    target.mkdir(parents=True, exist_ok=True)
+    written = []
+    for source in sorted(Path(definitions_dir).glob("*.json")):
+        data = source.read_bytes()
+        out = target / compiled_path(source.name)
+        out.write_bytes(encode_definition(json.loads(data), source_digest(data)))
+        written.append(out)
+    return written
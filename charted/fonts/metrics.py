@@ -0,0 +1,251 @@
+"""Process-wide registry of compiled font metric tables.
+
+Loading a font definition means parsing a ~100 KB JSON file keyed by
+stringified codepoints. Doing that per ``Font`` instance (and so per
+``calculate_text_dimensions`` cache miss) made label measurement the dominant
+per-chart cost. The registry loads each family once per process (mapping the
+precompiled binary form when one is installed, see
+:mod:`charted.fonts.compiled`) and resolves each (family, size) pair on first
+use into codepoint-indexed tables, so measuring a string is a run of
+integer-indexed lookups.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import cast
+
+from charted.fonts.compiled import (
+    MISSING,
+    CompiledDefinition,
+    CompiledFontError,
+    CompiledTable,
+    compiled_path,
+)
+from charted.utils.types import CharMetrics, FontDefinition
+
+# Family substituted when the requested definition file does not exist.
+FALLBACK_FAMILY = "DejaVu Sans"
+
+# Width used for an unknown narrow glyph (Latin punctuation, accented letters,
+# symbols not in the font definition). Roughly the average advance of the
+# definition fonts at their reference size.
+NARROW_FALLBACK_WIDTH = 5
+
+# Height used for a glyph whose definition entry omits one.
+DEFAULT_GLYPH_HEIGHT = 9
+
+
+class FontFamily:
+    """A loaded font definition plus how it was resolved.
+
+    ``source`` is either a parsed JSON definition or a memory-mapped
+    :class:`~charted.fonts.compiled.CompiledDefinition`. ``warning`` carries
+    the message to surface when the requested family had to be substituted or
+    could not be parsed; ``None`` for a clean load.
+    """
+
+    __slots__ = ("family", "source", "warning", "_definitions")
+
+    def __init__(
+        self,
+        family: str,
+        source: FontDefinition | CompiledDefinition,
+        warning: str | None = None,
+    ) -> None:
+        self.family = family
+        self.source = source
+        self.warning = warning
+        self._definitions: FontDefinition | None = (
+            None if isinstance(source, CompiledDefinition) else source
+        )
+
+    @property
+    def definitions(self) -> FontDefinition:
+        """The definition as a size -> codepoint -> metrics dict.
+
+        Decoded from a compiled source on first access; measuring never
+        needs it.
+        """
+        if self._definitions is None:
+            self._definitions = cast("CompiledDefinition", self.source).to_definition()
+        return self._definitions
+
+    def compile(self, size_key: str) -> FontMetrics | None:
+        """Build the lookup tables for one size, or ``None`` if it is absent."""
+        if isinstance(self.source, CompiledDefinition):
+            table = self.source.table(size_key)
+            if table is None:
+                return None
+            if table.mixed:
+                # Only per-glyph flags know which values were ints; decode.
+                return FontMetrics(self.source.glyphs(size_key))
+            return FontMetrics.from_compiled(table)
+        glyphs = self.source.get(size_key)
+        if not glyphs:
+            return None
+        return FontMetrics(glyphs)
+
+
+class FontMetrics:
+    """Glyph metrics for one font family at one size.
+
+    ``widths`` and ``heights`` are tables indexed by codepoint for codes below
+    ``len(widths)``; slots the definition does not cover hold
+    :data:`~charted.fonts.compiled.MISSING`. Glyphs past the end of the tables
+    are found with :meth:`lookup`. For a compiled definition the tables are
+    views of the mapped file, so measuring reads the shared pages directly.
+    Values keep the exact type stored in the definition (the generators have
+    written both ints and floats), so measured dimensions format identically
+    in the SVG output.
+    """
+
+    __slots__ = ("widths", "heights", "max_height", "lookup")
+
+    def __init__(self, glyphs: Mapping[str, CharMetrics]) -> None:
+        limit = max((int(code) for code in glyphs), default=-1) + 1
+        widths: list[float] = [MISSING] * limit
+        heights: list[float] = [MISSING] * limit
+        max_height: float = 0
+        for code, metrics in glyphs.items():
+            index = int(code)
+            widths[index] = metrics.get("width", NARROW_FALLBACK_WIDTH)
+            height = metrics.get("height", DEFAULT_GLYPH_HEIGHT)
+            heights[index] = height
+            max_height = max(max_height, height)
+        self._set(CompiledTable(widths, heights, (), (), (), (), max_height, False))
+
+    @classmethod
+    def from_compiled(cls, table: CompiledTable) -> FontMetrics:
+        """Wrap a compiled definition's glyph views without copying them."""
+        instance = cls.__new__(cls)
+        instance._set(table)
+        return instance
+
+    def _set(self, table: CompiledTable) -> None:
+        self.widths = table.dense_widths
+        self.heights = table.dense_heights
+        self.max_height = table.max_height
+        # ``(width, height)`` of any codepoint, or ``None`` if uncovered.
+        self.lookup = table.lookup
+
+    def __len__(self) -> int:
+        return len(self.widths)
+
+
+class FontMetricsRegistry:
+    """Lazily parsed families and compiled per-size tables, shared process-wide.
+
+    Entries are keyed by definitions directory as well as family so callers
+    pointing ``Font`` at a custom directory never see another directory's
+    metrics. A lock guards population because charts are built from worker
+    threads (MCP server, batch rendering).
+    """
+
+    def __init__(self) -> None:
+        self._families: dict[tuple[str, str], FontFamily] = {}
+        self._metrics: dict[tuple[str, str, str], FontMetrics | None] = {}
+        self._lock = threading.Lock()
+
+    def family(self, family: str, definitions_dir: str) -> FontFamily:
+        """Return the parsed definition for ``family``, loading it once."""
+        key = (str(definitions_dir), family)
+        loaded = self._families.get(key)
+        if loaded is None:
+            with self._lock:
+                loaded = self._families.get(key)
+                if loaded is None:
+                    loaded = _load_family(family, str(definitions_dir))
+                    self._families[key] = loaded
+        return loaded
+
+    def metrics(
+        self, family: str, size: float, definitions_dir: str
+    ) -> FontMetrics | None:
+        """Return the compiled table for ``family`` at ``size``.
+
+        ``None`` when the definition has no entry for that size, in which case
+        every glyph measures with the fallback widths.
+        """
+        # Definitions are keyed by the size's string form, so a float size
+        # such as ``12.0`` resolves to its own (usually absent) entry rather
+        # than sharing the ``12`` table; key the cache the same way.
+        size_key = str(size)
+        key = (str(definitions_dir), family, size_key)
+        try:
+            return self._metrics[key]
+        except KeyError:
+            pass
+        compiled = self.family(family, definitions_dir).compile(size_key)
+        with self._lock:
+            return self._metrics.setdefault(key, compiled)
+
+    def clear(self) -> None:
+        """Drop every cached family and table (e.g. after regenerating fonts)."""
+        with self._lock:
+            self._families.clear()
+            self._metrics.clear()
+
+
+def _read_definition(path: Path) -> FontDefinition | CompiledDefinition:
+    """Load a family's definition, preferring an up-to-date compiled file.
+
+    The compiled ``.bin`` is mapped instead of parsing JSON when it exists and
+    was compiled from the JSON next to it, byte for byte (the JSON stays the
+    source of truth; the check hashes it rather than trusting timestamps,
+    which checkouts and copies reset). An unreadable compiled file falls back
+    to the JSON.
+    """
+    binary = compiled_path(path)
+    if binary.exists():
+        try:
+            compiled = CompiledDefinition(binary)
+        except (CompiledFontError, OSError, ValueError):
+            if not path.exists():
+                raise
+        else:
+            if not path.exists():
+                return compiled
+            data = path.read_bytes()
+            if compiled.matches(data):
+                return compiled
+            return cast("FontDefinition", json.loads(data))
+    with open(path, "r") as f:
+        return cast("FontDefinition", json.load(f))
+
+
+def _definition_exists(path: Path) -> bool:
+    return path.exists() or compiled_path(path).exists()
+
+
+def _load_family(family: str, definitions_dir: str) -> FontFamily:
+    font_path = Path(definitions_dir) / f"{family}.json"
+
+    if not _definition_exists(font_path):
+        if family == FALLBACK_FAMILY:
+            return FontFamily(family, {})
+        warning = f"Font '{family}' not found, falling back to {FALLBACK_FAMILY}"
+        fallback_path = Path(definitions_dir) / f"{FALLBACK_FAMILY}.json"
+        definitions: FontDefinition | CompiledDefinition = {}
+        try:
+            if _definition_exists(fallback_path):
+                definitions = _read_definition(fallback_path)
+        except (json.JSONDecodeError, IOError, ValueError):
+            definitions = {}
+        return FontFamily(FALLBACK_FAMILY, definitions, warning)
+
+    try:
+        return FontFamily(family, _read_definition(font_path))
+    except json.JSONDecodeError as e:
+        return FontFamily(family, {}, f"Failed to parse font JSON for '{family}': {e}")
+    except CompiledFontError as e:
+        return FontFamily(family, {}, f"Failed to load compiled font: {e}")
+    except IOError as e:
+        return FontFamily(family, {}, f"Failed to load font file '{font_path}': {e}")
+
+
+# Shared registry used by every ``Font`` in the process.
+registry = FontMetricsRegistry()
@@ -1,6 +1,7 @@
 import json
 import os
 
+from charted.fonts.compiled import COMPILED_SUFFIX, encode_definition, source_digest
 from charted.utils.defaults import BASE_DEFINITIONS_DIR
 from charted.utils.types import CharMetrics
 
@@ -24,5 +25,13 @@ def create_font_definition(
                     "height": h,
                 }
 
-        with open(os.path.join(BASE_DEFINITIONS_DIR, f"{font}.json"), "w") as dst:
-            dst.write(json.dumps(lookup, indent=2))
+        data = json.dumps(lookup, indent=2).encode()
+        with open(os.path.join(BASE_DEFINITIONS_DIR, f"{font}.json"), "wb") as dst:
+            dst.write(data)
+
+        # Binary form loaded through mmap at runtime; the JSON above stays the
+        # source of truth and is what gets committed.
+        with open(
+            os.path.join(BASE_DEFINITIONS_DIR, f"{font}{COMPILED_SUFFIX}"), "wb"
+        ) as dst:
+            dst.write(encode_definition(lookup, source_digest(data)))
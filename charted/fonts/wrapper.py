@@ -1,18 +1,18 @@
 """Font wrapper for loading and measuring text with custom fonts."""
 
-import json
 import os
-from pathlib import Path
-from typing import cast
-
+import warnings
+
+from charted.fonts.compiled import MISSING
+from charted.fonts.metrics import (
+    DEFAULT_GLYPH_HEIGHT,
+    NARROW_FALLBACK_WIDTH,
+    FontMetrics,
+    registry,
+)
 from charted.utils.defaults import BASE_DEFINITIONS_DIR, DEFAULT_FONT, DEFAULT_FONT_SIZE
 from charted.utils.types import FontDefinition
 
-# Width used for an unknown narrow glyph (Latin punctuation, accented letters,
-# symbols not in the font definition). Roughly the average advance of the
-# definition fonts at their reference size.
-_NARROW_FALLBACK_WIDTH = 5
-
 
 def _is_wide_glyph(char_code: int) -> bool:
     """True when a codepoint is drawn roughly full-width (~1em).
@@ -40,8 +40,20 @@ def _is_wide_glyph(char_code: int) -> bool:
     )
 
 
+# Stand-in tables for a size the definition does not cover: every glyph misses.
+_EMPTY_METRICS = FontMetrics({})
+
+# ``(width, height)`` of a glyph no table covers.
+_ABSENT = (MISSING, MISSING)
+
+
 class Font:
-    """Font wrapper that loads definitions from JSON and measures text."""
+    """Font wrapper that measures text against shared compiled metric tables.
+
+    Definitions are parsed and compiled once per process by
+    :data:`charted.fonts.metrics.registry`, so constructing a ``Font`` is
+    cheap and measuring never re-reads the JSON definition file.
+    """
 
     def __init__(
         self,
@@ -60,48 +72,22 @@ class Font:
         self.size = size or DEFAULT_FONT_SIZE
         self.definitions_dir = definitions_dir or BASE_DEFINITIONS_DIR
 
-        # Load font definition file
-        self.definitions = self._load_definitions()
-
-    def _load_definitions(self) -> FontDefinition:
-        """Load font definitions from JSON file."""
-        font_path = Path(self.definitions_dir) / f"{self.family}.json"
-
-        if not font_path.exists():
-            # Fallback to Arial if requested font not found
-            if self.family != "DejaVu Sans":
-                import warnings
-
-                warnings.warn(f"Font '{self.family}' not found, falling back to Arial")
-                return self._load_definitions_fallback("DejaVu Sans")
-            return {}
-
-        try:
-            with open(font_path, "r") as f:
-                return cast("FontDefinition", json.load(f))
-        except json.JSONDecodeError as e:
-            import warnings
-
-            warnings.warn(f"Failed to parse font JSON for '{self.family}': {e}")
-            return {}
-        except IOError as e:
-            import warnings
-
-            warnings.warn(f"Failed to load font file '{font_path}': {e}")
-            return {}
-
-    def _load_definitions_fallback(self, fallback: str) -> FontDefinition:
-        """Load fallback font definitions."""
-        fallback_path = Path(self.definitions_dir) / f"{fallback}.json"
-
-        if not fallback_path.exists():
-            return {}
-
-        try:
-            with open(fallback_path, "r") as f:
-                return cast("FontDefinition", json.load(f))
-        except (json.JSONDecodeError, IOError):
-            return {}
+        # Resolve (and on first use, load) the shared family definition. A
+        # substituted or unreadable family warns on every construction, as it
+        # did when each Font parsed its own file.
+        loaded = registry.family(self.family, self.definitions_dir)
+        if loaded.warning:
+            warnings.warn(loaded.warning)
+
+    @property
+    def definitions(self) -> FontDefinition:
+        """Parsed font definition (size -> codepoint -> metrics), shared."""
+        return registry.family(self.family, self.definitions_dir).definitions
+
+    def _metrics(self, size: int | None) -> FontMetrics | None:
+        return registry.metrics(
+            self.family, size if size is not None else self.size, self.definitions_dir
+        )
 
     def measure(self, text: str, size: int | None = None) -> tuple[float, float]:
         """Measure text dimensions at given size.
@@ -114,29 +100,37 @@ class Font:
             Tuple of (width, height) in points.
         """
         measure_size = size if size is not None else self.size
-        definitions = self.definitions.get(str(measure_size), {})
+        metrics = self._metrics(measure_size) or _EMPTY_METRICS
+        widths = metrics.widths
+        heights = metrics.heights
+        lookup = metrics.lookup
+        limit = len(widths)
 
-        total_width = 0
-        max_height = 0
+        total_width: float = 0
+        max_height: float = 0
 
         for char in text:
             char_code = ord(char)
-            if str(char_code) in definitions:
-                char_def = definitions[str(char_code)]
-                total_width += char_def.get("width", _NARROW_FALLBACK_WIDTH)
-                max_height = max(max_height, char_def.get("height", 9))
+            if char_code < limit:
+                width = widths[char_code]
+                height = heights[char_code]
             else:
+                width, height = lookup(char_code) or _ABSENT
+            if width >= 0:
+                total_width += width
+                if height > max_height:
+                    max_height = height
+            elif _is_wide_glyph(char_code):
                 # Unknown glyph: full-width scripts (CJK/kana/Hangul/emoji)
                 # advance ~1em, so the narrow fallback would badly
                 # under-measure them and let labels overflow. Reserve a
                 # near-em width for those; keep the small width for genuinely
                 # narrow unknowns.
-                if _is_wide_glyph(char_code):
-                    total_width += round(measure_size * 0.95)
-                    max_height = max(max_height, measure_size)
-                else:
-                    total_width += _NARROW_FALLBACK_WIDTH
-                    max_height = max(max_height, 9)
+                total_width += round(measure_size * 0.95)
+                max_height = max(max_height, measure_size)
+            else:
+                total_width += NARROW_FALLBACK_WIDTH
+                max_height = max(max_height, DEFAULT_GLYPH_HEIGHT)
 
         return (total_width, max_height)
 
@@ -147,31 +141,24 @@ class Font:
 
     def measure_height(self, size: int | None = None) -> float:
         """Get font height at given size."""
-        definitions = self.definitions.get(
-            str(size if size is not None else self.size), {}
-        )
-        if not definitions:
+        metrics = self._metrics(size)
+        if metrics is None:
             return float(size if size is not None else self.size)
-
-        # Get max height from any character
-        heights = [defn.get("height", 9) for defn in definitions.values()]
-        return (
-            max(heights) if heights else float(size if size is not None else self.size)
-        )
+        # Tallest glyph in the definition, precomputed when the table compiled.
+        return metrics.max_height
 
     def get_char_width(self, char: str, size: int | None = None) -> float:
         """Get width of single character."""
-        definitions = self.definitions.get(
-            str(size if size is not None else self.size), {}
-        )
+        metrics = self._metrics(size)
         char_code = ord(char)
 
         resolved_size = size if size is not None else self.size
-        if str(char_code) in definitions:
-            return definitions[str(char_code)].get("width", _NARROW_FALLBACK_WIDTH)
+        found = metrics.lookup(char_code) if metrics is not None else None
+        if found is not None:
+            return found[0]
         if _is_wide_glyph(char_code):
             return round(resolved_size * 0.95)
-        return _NARROW_FALLBACK_WIDTH  # Default width for unknown narrow chars
+        return NARROW_FALLBACK_WIDTH  # Default width for unknown narrow chars
 
     @classmethod
     def list_available(cls, definitions_dir: str | None = None) -> list[str]:
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from typing import Union, cast
+import io
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from typing import IO, Union, cast
 from xml.sax.saxutils import escape as _xml_escape
 
 Child = Union["Element", str]
 Children = list[Child]
 
+# Characters buffered by ``Element.write_to`` before each write to the sink.
+WRITE_BUFFER_SIZE = 1 << 16
+
 
 def _escape_attr(value: str) -> str:
     """XML-escape an attribute value for safe inclusion in a double-quoted attribute.
@@ -17,11 +23,119 @@ def _escape_attr(value: str) -> str:
     return _xml_escape(str(value), {'"': "&quot;"})
 
 
+class Attributes(dict[str, str]):
+    """Attribute mapping of an ``Element`` that caches its rendered string.
+
+    ``rendered`` holds the serialized attribute string once computed; every
+    mutating method resets it, so ``element.kwargs["fill"] = ...`` after a
+    render is picked up on the next one.
+    """
+
+    __slots__ = ("rendered",)
+
+    def __init__(self, *args: Mapping[str, str], **kwargs: str) -> None:
+        super().__init__(*args, **kwargs)
+        self.rendered: str | None = None
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self.rendered = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.rendered = None
+        super().__delitem__(key)
+
+    def __ior__(self, other: Mapping[str, str]) -> Attributes:  # type: ignore[override,misc]
+        self.rendered = None
+        super().update(other)
+        return self
+
+    def clear(self) -> None:
+        self.rendered = None
+        super().clear()
+
+    def pop(self, key: str, *default: str) -> str:  # type: ignore[override]
+        self.rendered = None
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, str]:
+        self.rendered = None
+        return super().popitem()
+
+    def setdefault(self, key: str, default: str) -> str:
+        self.rendered = None
+        return super().setdefault(key, default)
+
+    def update(self, *args: Mapping[str, str], **kwargs: str) -> None:  # type: ignore[override]
+        self.rendered = None
+        super().update(*args, **kwargs)
+
+
+# Interned SVG attribute names, keyed by the Python keyword that spells them
+# (``stroke_width`` -> ``stroke-width``).
+_ATTRIBUTE_NAMES: dict[str, str] = {}
+
+_ESCAPED_CHARACTERS = frozenset('&<>"')
+
+
+def _attribute_name(key: str) -> str:
+    name = _ATTRIBUTE_NAMES.get(key)
+    if name is None:
+        name = _ATTRIBUTE_NAMES[key] = sys.intern(key.replace("_", "-"))
+    return name
+
+
+def _render_attributes(kwargs: Mapping[str, str]) -> str:
+    parts = []
+    for k, v in kwargs.items():
+        value = v
+        # Carry a generic fallback so a viewer that lacks the named
+        # font degrades to a sane family rather than the browser's
+        # default serif. Skip when the caller already supplied a stack.
+        if k == "font_family" and isinstance(v, str) and "," not in v:
+            generic = (
+                "monospace"
+                if ("mono" in v.lower() or "code" in v.lower())
+                else "sans-serif"
+            )
+            value = f"{v}, {generic}"
+        text = str(value)
+        if not _ESCAPED_CHARACTERS.isdisjoint(text):
+            text = _escape_attr(text)
+        parts.append(f'{_attribute_name(k)}="{text}"')
+    return " " + " ".join(parts) if parts else ""
+
+
 class Element(object):
+    """A node of the SVG tree.
+
+    Nodes are slotted: a chart can hold tens of thousands of marks, so none of
+    them carries a per-instance ``__dict__``. Subclasses declare
+    ``__slots__ = ()`` to keep that, and may still set a class-level
+    ``kwargs`` dict of default attributes.
+    """
+
+    __slots__ = ("parent", "children", "_kwargs")
+
     tag: str
-    kwargs: dict[str, str] = {}
-    children: Children = []
     class_name: str | None = None
+    _default_kwargs: dict[str, str] = {}
+
+    parent: object
+    children: Children
+    _kwargs: Attributes
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        namespace = cls.__dict__
+        if "tag" in namespace:
+            cls.tag = sys.intern(namespace["tag"])
+        defaults = namespace.get("kwargs")
+        if isinstance(defaults, dict):
+            # Class-level ``kwargs`` are the subclass's default attributes;
+            # move them aside so the ``kwargs`` property stays reachable.
+            cls._default_kwargs = {**cls._default_kwargs, **defaults}
+            delattr(cls, "kwargs")
 
     def __init__(self, parent: object = None, **kwargs: object) -> None:
         self.parent = parent
@@ -35,44 +149,48 @@ class Element(object):
             if type(value) is list:
                 _kwargs[key] = " ".join(value)
 
-        self.kwargs: dict[str, str] = cast("dict[str, str]", {**self.kwargs, **_kwargs})
-
+        attributes = Attributes(self._default_kwargs)
+        attributes.update(cast("dict[str, str]", _kwargs))
         if self.class_name:
-            self.kwargs["class"] = self.class_name
+            attributes["class"] = self.class_name
+        self._kwargs = attributes
 
-        self.children: Children = []
+        self.children = []
 
     def __new__(cls, *args: object, **kwargs: object) -> "Element":
         instance = super().__new__(cls)
         instance.children = []
         return instance
 
+    @property
+    def kwargs(self) -> Attributes:
+        """The element's attributes, keyed by Python-style names."""
+        try:
+            return self._kwargs
+        except AttributeError:
+            # Subclasses that skip ``Element.__init__`` start from the defaults.
+            self._kwargs = Attributes(self._default_kwargs)
+            return self._kwargs
+
+    @kwargs.setter
+    def kwargs(self, value: Mapping[str, str]) -> None:
+        self._kwargs = Attributes(value)
+
     @property
     def attributes(self) -> str:
         """Generate the attributes passed in as kwargs as a string.
 
+        The string is cached on the attribute mapping and rebuilt only after
+        the mapping changes.
+
         Returns:
             str: A string representing HTML attributes in the format "key1="value1" key2="value2" ...".
         """
-        string = ""
-        if len(self.kwargs) > 0:
-            string += " "
-            attributes_array = []
-            for k, v in self.kwargs.items():
-                value = v
-                # Carry a generic fallback so a viewer that lacks the named
-                # font degrades to a sane family rather than the browser's
-                # default serif. Skip when the caller already supplied a stack.
-                if k == "font_family" and isinstance(v, str) and "," not in v:
-                    generic = (
-                        "monospace"
-                        if ("mono" in v.lower() or "code" in v.lower())
-                        else "sans-serif"
-                    )
-                    value = f"{v}, {generic}"
-                attributes_array.append(f'{k.replace("_", "-")}="{_escape_attr(value)}"')
-            string += " ".join(attributes_array)
-        return string
+        kwargs = self.kwargs
+        rendered = kwargs.rendered
+        if rendered is None:
+            rendered = kwargs.rendered = _render_attributes(kwargs)
+        return rendered
 
     @property
     def html(self) -> str:
@@ -81,9 +199,7 @@ class Element(object):
         Returns:
             str: A string containing the HTML markup for the element.
         """
-        if not self.children:
-            return f"<{self.tag}{self.attributes}/>"
-        return f"<{self.tag}{self.attributes}>{self.children_html}</{self.tag}>"
+        return "".join(self.iter_chunks())
 
     @property
     def children_html(self) -> str:
@@ -93,12 +209,69 @@ class Element(object):
             str: A string containing the HTML markup for all child elements.
         """
         return "".join(
-            cast("Element", child).html
-            if type(child) is not str
-            else _xml_escape(child)
+            chunk
             for child in self.children
+            for chunk in (
+                cast("Element", child).iter_chunks()
+                if type(child) is not str
+                else (_xml_escape(child),)
+            )
         )
 
+    def iter_chunks(self) -> Iterator[str]:
+        """Yield the element's markup in document order.
+
+        Walks the tree once with an explicit stack, yielding each tag and text
+        node as it is reached, so callers can stream a large document to a
+        sink without any level of the tree materializing its subtree as an
+        intermediate string. Joining the chunks gives exactly ``html``.
+
+        Yields:
+            str: Consecutive fragments of the element's markup.
+        """
+        if not self.children:
+            yield f"<{self.tag}{self.attributes}/>"
+            return
+        yield f"<{self.tag}{self.attributes}>"
+        stack: list[tuple[Iterator[Child], str]] = [
+            (iter(self.children), f"</{self.tag}>")
+        ]
+        while stack:
+            children, closing = stack[-1]
+            for child in children:
+                if type(child) is str:
+                    yield _xml_escape(child)
+                    continue
+                element = cast("Element", child)
+                if element.children:
+                    yield f"<{element.tag}{element.attributes}>"
+                    stack.append((iter(element.children), f"</{element.tag}>"))
+                    break
+                yield f"<{element.tag}{element.attributes}/>"
+            else:
+                stack.pop()
+                yield closing
+
+    def write_to(
+        self,
+        fp: IO[str] | IO[bytes],
+        encoding: str = "utf-8",
+        buffer_size: int = WRITE_BUFFER_SIZE,
+    ) -> None:
+        """Stream the element's markup to a text or binary file object.
+
+        Chunks from :meth:`iter_chunks` are batched into writes of roughly
+        ``buffer_size`` characters, so peak memory stays near the buffer size
+        rather than the size of the document.
+
+        Args:
+            fp: Destination. Binary sinks (``open(..., "wb")``, ``BytesIO``)
+                receive ``encoding``-encoded bytes; text sinks receive ``str``.
+            encoding: Encoding used for binary sinks.
+            buffer_size: Approximate number of characters per write.
+        """
+        write_chunks(fp, self.iter_chunks(), encoding, buffer_size)
+
     def add_child(self, child: Child | None) -> "Element":
         """Add a child element to the current element.
 
@@ -130,9 +303,49 @@ class Element(object):
         return self.html
 
 
+def write_chunks(
+    fp: IO[str] | IO[bytes],
+    chunks: Iterable[str],
+    encoding: str = "utf-8",
+    buffer_size: int = WRITE_BUFFER_SIZE,
+) -> None:
+    """Write markup chunks to a text or binary file object in batches.
+
+    Args:
+        fp: Destination. Binary sinks (``open(..., "wb")``, ``BytesIO``)
+            receive ``encoding``-encoded bytes; text sinks receive ``str``.
+        chunks: Markup fragments, e.g. from :meth:`Element.iter_chunks`.
+        encoding: Encoding used for binary sinks.
+        buffer_size: Approximate number of characters per write.
+    """
+    binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or (
+        not isinstance(fp, io.TextIOBase) and "b" in getattr(fp, "mode", "")
+    )
+
+    def flush(data: str) -> None:
+        if binary:
+            cast("IO[bytes]", fp).write(data.encode(encoding))
+        else:
+            cast("IO[str]", fp).write(data)
+
+    pending: list[str] = []
+    pending_size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= buffer_size:
+            flush("".join(pending))
+            pending.clear()
+            pending_size = 0
+    if pending:
+        flush("".join(pending))
+
+
 class Svg(Element):
+    __slots__ = ()
+
     tag = "svg"
-    kwargs = {
+    _default_kwargs = {
         "xmlns": "http://www.w3.org/2000/svg",
     }
 
@@ -142,14 +355,20 @@ class Svg(Element):
 
 
 class G(Element):
+    __slots__ = ()
+
     tag = "g"
 
 
 class Circle(Element):
+    __slots__ = ()
+
     tag = "circle"
 
 
 class Path(Element):
+    __slots__ = ()
+
     tag = "path"
 
     @classmethod
@@ -168,6 +387,8 @@ class Path(Element):
 
 
 class Text(Element):
+    __slots__ = ()
+
     tag = "text"
 
     def __init__(self, text: str | None = None, **kwargs: object) -> None:
@@ -178,6 +399,8 @@ class Text(Element):
 class TSpan(Element):
     """SVG ``<tspan>`` for a single line within a multi-line ``<text>``."""
 
+    __slots__ = ()
+
     tag = "tspan"
 
     def __init__(self, text: str | None = None, **kwargs: object) -> None:
@@ -193,6 +416,8 @@ class Title(Element):
     accessible name. Requires no JavaScript.
     """
 
+    __slots__ = ()
+
     tag = "title"
 
     def __init__(self, text: str | None = None, **kwargs: object) -> None:
@@ -201,12 +426,18 @@ class Title(Element):
 
 
 class Rect(Element):
+    __slots__ = ()
+
     tag = "rect"
 
 
 class ClipPath(Element):
+    __slots__ = ()
+
     tag = "clipPath"
 
 
 class Defs(Element):
+    __slots__ = ()
+
     tag = "defs"
@@ -3,8 +3,8 @@
 import re
 from collections.abc import Iterable
 from dataclasses import dataclass, field, replace
-from functools import wraps
-from typing import Optional, cast
+from functools import cached_property, wraps
+from typing import NoReturn, Optional, cast
 
 from charted.constants import REFERENCE_LINE_WIDTH
 
@@ -224,6 +224,38 @@ OPACITY_TIERS = {
 }
 
 
+class _FrozenColors(list[str]):
+    """A read-only palette list, so a theme shared between charts stays intact.
+
+    Compares, iterates and serializes like the plain list it stands in for;
+    only in-place mutation is refused. ``copy()`` returns an ordinary list.
+    Hashable, which makes a :class:`Theme` hashable too.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: object, **kwargs: object) -> NoReturn:
+        raise TypeError(
+            "Theme colors are read-only; build a new theme instead, e.g. "
+            "theme.compose(Theme(colors=[...]))."
+        )
+
+    __setitem__ = __delitem__ = _read_only
+    __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = _read_only
+    remove = clear = sort = reverse = _read_only
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(tuple(self))
+
+    def __reduce__(self) -> tuple[type["_FrozenColors"], tuple[list[str]]]:
+        return _FrozenColors, (list(self),)
+
+
+# Built-in presets, constructed on first use by Theme.from_preset.
+_PRESETS: dict[type["Theme"], dict[str, "Theme"]] = {}
+
+
 @dataclass(frozen=True)
 class Theme:
     """Immutable theme configuration for charted charts.
@@ -232,6 +264,10 @@ class Theme:
     for custom themes. Use `compose()` to layer customizations on top
     of presets.
 
+    Themes are immutable all the way down (``colors`` is a read-only list),
+    so one instance can be shared by any number of charts. The
+    ``resolved_*`` values are computed on first use and then kept.
+
     Args:
         colors: Color palette (list of hex strings). Empty = use defaults.
         root_color: Base color for deriving opacity-tiered colors.
@@ -320,6 +356,8 @@ class Theme:
 
     def __post_init__(self) -> None:
         """Validate color format after initialization."""
+        if not isinstance(self.colors, _FrozenColors):
+            object.__setattr__(self, "colors", _FrozenColors(self.colors))
         for color in self.colors:
             if not _is_valid_hex_color(color):
                 raise ValueError(f"Invalid color in palette: {color!r}")
@@ -379,7 +417,7 @@ class Theme:
         """
         return getattr(self, "_explicitly_set", frozenset())
 
-    @property
+    @cached_property
     def resolved_grid_color(self) -> str:
         """Grid color: explicit override or root_color at 20% opacity."""
         if self._is_explicit("grid_color"):
@@ -390,12 +428,12 @@ class Theme:
             self.root_color, OPACITY_TIERS["grid_color"], self.background_color
         )
 
-    @property
+    @cached_property
     def resolved_grid_width(self) -> Optional[float]:
         """Major gridline stroke width, or None for the SVG default."""
         return self.grid_width
 
-    @property
+    @cached_property
     def resolved_minor_grid_color(self) -> str:
         """Minor gridline colour: explicit override or root_color at 10%."""
         if self.minor_grid_color is not None:
@@ -408,7 +446,7 @@ class Theme:
             self.background_color,
         )
 
-    @property
+    @cached_property
     def resolved_minor_grid_width(self) -> float:
         """Minor gridline stroke width: explicit override or half the major."""
         if self.minor_grid_width is not None:
@@ -417,7 +455,7 @@ class Theme:
         base = major if major is not None else 1.0
         return base / 2.0
 
-    @property
+    @cached_property
     def resolved_axis_border_color(self) -> str:
         """Axis border color: root_color at 60% opacity."""
         from charted.utils.colors import derive_color
@@ -426,7 +464,7 @@ class Theme:
             self.root_color, OPACITY_TIERS["axis_border_color"], self.background_color
         )
 
-    @property
+    @cached_property
     def resolved_reference_line_color(self) -> str:
         """Reference line color: root_color at 50% opacity."""
         from charted.utils.colors import derive_color
@@ -437,14 +475,14 @@ class Theme:
             self.background_color,
         )
 
-    @property
+    @cached_property
     def resolved_reference_line_width(self) -> float:
         """Reference-line stroke width: explicit override or library default."""
         if self.reference_line_width is not None:
             return self.reference_line_width
         return REFERENCE_LINE_WIDTH
 
-    @property
+    @cached_property
     def resolved_axis_title_color(self) -> str:
         """Axis title color: explicit override or root_color at 80% opacity."""
         if self._is_explicit("title_color"):
@@ -455,7 +493,7 @@ class Theme:
             self.root_color, OPACITY_TIERS["axis_title_color"], self.background_color
         )
 
-    @property
+    @cached_property
     def resolved_label_color(self) -> str:
         """Label color: root_color at 100% opacity."""
         from charted.utils.colors import derive_color
@@ -464,7 +502,7 @@ class Theme:
             self.root_color, OPACITY_TIERS["label_color"], self.background_color
         )
 
-    @property
+    @cached_property
     def resolved_data_label_color(self) -> str:
         """Data-label colour: explicit override or the axis-title tier.
 
@@ -489,7 +527,7 @@ class Theme:
         )
         return self.shape_outline_color, width
 
-    @property
+    @cached_property
     def resolved_series_stroke_width(self) -> float:
         """Series line stroke width: explicit override or the 2px default.
 
@@ -500,7 +538,7 @@ class Theme:
             return self.series_stroke_width
         return 2
 
-    @property
+    @cached_property
     def resolved_axis_label_font_size(self) -> int:
         """Axis tick label font size: override or the library default (12)."""
         from charted.constants import AXIS_LABEL_FONT_SIZE
@@ -524,7 +562,7 @@ class Theme:
             foreground, self.background_color, self.contrast_floor
         )
 
-    @property
+    @cached_property
     def resolved_colors(self) -> list[str]:
         """Series palette with the contrast floor applied (if any).
 
@@ -534,9 +572,9 @@ class Theme:
         """
         if self.contrast_floor is None:
             return self.colors
-        return [self.enforce_contrast(c) for c in self.colors]
+        return _FrozenColors(self.enforce_contrast(c) for c in self.colors)
 
-    @property
+    @cached_property
     def resolved_quadrant_label_color(self) -> str:
         """Quadrant label color: root_color at 18% opacity."""
         from charted.utils.colors import derive_color
@@ -555,11 +593,24 @@ class Theme:
             name: Preset name ("light", "dark", "high-contrast").
 
         Returns:
-            Theme instance with preset values.
+            Theme instance with preset values. Presets are built once and
+            shared, which is safe because themes are immutable.
 
         Raises:
             ValueError: If preset name is unknown.
         """
+        presets = _PRESETS.get(cls)
+        if presets is None:
+            presets = _PRESETS[cls] = cls._build_presets()
+        if name not in presets:
+            raise ValueError(
+                f"Unknown theme: {name!r}. Available: {list(presets.keys())}"
+            )
+        return presets[name]
+
+    @classmethod
+    def _build_presets(cls) -> dict[str, "Theme"]:
+        """Construct every built-in preset (once per class; see from_preset)."""
         presets = {
             "light": cls(
                 colors=["#3b82f6", "#10b981", "#f59e0b", "#8b5cf6", "#ec4899"],
@@ -611,11 +662,9 @@ class Theme:
                 contrast_floor=3.0,
             ),
         }
-        if name not in presets:
-            raise ValueError(
-                f"Unknown theme: {name!r}. Available: {list(presets.keys())}"
-            )
-        return presets[name].__copy__()
+        # Stored as copies, so a preset reports every field as explicitly set
+        # (what compose() sees when a preset is used as the overrides).
+        return {name: theme.__copy__() for name, theme in presets.items()}
 
     def __copy__(self) -> "Theme":
         """Create a copy of this theme."""
@@ -683,8 +732,11 @@ class Theme:
         Returns:
             Hex color string.
         """
-        palette = ColorPalette(colors=self.colors)
-        return palette.get_color(index)
+        return self._palette.get_color(index)
+
+    @cached_property
+    def _palette(self) -> ColorPalette:
+        return ColorPalette(colors=self.colors)
 
 
 def _is_dark_color(hex_color: str) -> bool:
@@ -714,14 +766,21 @@ def _wrap_theme_init() -> None:
     original_init = Theme.__init__
     field_order = list(Theme.__dataclass_fields__.keys())
     signature = inspect.signature(original_init)
+    memoized = [
+        name for name, attr in vars(Theme).items() if isinstance(attr, cached_property)
+    ]
 
     @wraps(original_init)
     def __init__(self: Theme, *args: object, **kwargs: object) -> None:  # noqa: N807
         # The tracking marker leaks into ``vars(theme)``; tolerate (and honour)
         # it when a caller round-trips a theme via ``Theme(**vars(theme))`` so
         # the provided-set survives the copy and isn't passed to the dataclass
-        # constructor (which would reject the unknown keyword).
+        # constructor (which would reject the unknown keyword). Memoized
+        # ``resolved_*`` values leak the same way and are dropped: the new
+        # theme derives its own.
         preset = kwargs.pop("_explicitly_set", None)
+        for name in memoized:
+            kwargs.pop(name, None)
         if preset is not None:
             provided = frozenset(cast("Iterable[str]", preset))
         else:
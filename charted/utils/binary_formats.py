@@ -0,0 +1,268 @@
+"""Zero-copy readers for binary array files: ``.npy``, ``.npz``, Arrow, Parquet.
+
+``.npy`` and ``.npz`` are parsed here directly, without NumPy: the file is
+memory-mapped and each array becomes a :class:`SeriesView` over the mapped
+pages, so values are only paged in as a chart reads them. Uncompressed
+``.npz`` members are mapped in place too; compressed ones are inflated once.
+
+Arrow IPC (Feather v2) and Parquet files are read with pyarrow when it is
+installed. Arrow files are memory-mapped, and numeric columns without nulls
+are viewed through their Arrow buffers rather than converted.
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib
+import mmap
+import struct
+import sys
+import zipfile
+from array import array
+from pathlib import Path
+from types import ModuleType
+from typing import Protocol, cast
+
+from charted.utils.buffers import SeriesView
+
+#: A loaded column: numbers as a zero-copy view, anything else as strings.
+Column = SeriesView | list[str]
+
+NPY_SUFFIXES = (".npy", ".npz")
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc", ".arrows")
+PARQUET_SUFFIXES = (".parquet",)
+BINARY_SUFFIXES = NPY_SUFFIXES + ARROW_SUFFIXES + PARQUET_SUFFIXES
+
+_NPY_MAGIC = b"\x93NUMPY"
+
+# NumPy dtype (kind + itemsize) to struct format, for the types charts take.
+_NPY_FORMATS = {
+    "f2": "e",
+    "f4": "f",
+    "f8": "d",
+    "i1": "b",
+    "i2": "h",
+    "i4": "i",
+    "i8": "q",
+    "u1": "B",
+    "u2": "H",
+    "u4": "I",
+    "u8": "Q",
+    "b1": "?",
+}
+
+# Arrow primitive type name to struct format.
+_ARROW_FORMATS = {
+    "double": "d",
+    "float": "f",
+    "int8": "b",
+    "int16": "h",
+    "int32": "i",
+    "int64": "q",
+    "uint8": "B",
+    "uint16": "H",
+    "uint32": "I",
+    "uint64": "Q",
+}
+
+# Local file header: fixed 30 bytes, then the name and extra fields.
+_ZIP_LOCAL_HEADER_SIZE = 30
+
+
+def read_columns(path: Path) -> dict[str, Column]:
+    """Read every array or column of a binary data file.
+
+    A one-dimensional array is one column, named after the file (``.npy``)
+    or the archive member (``.npz``). A two-dimensional array contributes
+    one column per row, ``<name>_<i>``, matching how charts read 2-D data as
+    one series per row.
+
+    Raises:
+        ValueError: If the file is malformed, empty, or holds an unsupported dtype.
+        ImportError: For Arrow/Parquet files when pyarrow is not installed.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        data = _map_file(path)
+        return _npy_columns(path.stem, data, str(path))
+    if suffix == ".npz":
+        return _npz_columns(path)
+    if suffix in ARROW_SUFFIXES + PARQUET_SUFFIXES:
+        return _arrow_columns(path, suffix)
+    raise ValueError(f"Unsupported binary format: {suffix}")
+
+
+def _map_file(path: Path) -> memoryview:
+    """A read-only memory map of ``path``; it stays open while viewed."""
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            raise ValueError(f"Empty data file: {path}")
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _npy_columns(name: str, data: memoryview, source: str) -> dict[str, Column]:
+    view = _parse_npy(data, source)
+    if view.ndim == 1:
+        return {name: SeriesView(view)}
+    rows, length = cast("tuple[int, int]", view.shape)
+    flat = view.cast("B").cast(view.format)  # type: ignore[call-overload]
+    return {
+        f"{name}_{i}": SeriesView(flat[i * length : (i + 1) * length])
+        for i in range(rows)
+    }
+
+
+def _parse_npy(data: memoryview, source: str) -> memoryview:
+    """View the array stored in ``.npy`` bytes, without copying.
+
+    Only a byte-swapped (foreign-endian) array is copied, once, and a float16
+    array is decoded into float64, which memoryview can index.
+    """
+    if bytes(data[:6]) != _NPY_MAGIC:
+        raise ValueError(f"Not a .npy file: {source}")
+    major = data[6]
+    size_bytes = 2 if major == 1 else 4
+    header_len = int.from_bytes(data[8 : 8 + size_bytes], "little")
+    start = 8 + size_bytes + header_len
+    try:
+        header = ast.literal_eval(bytes(data[8 + size_bytes : start]).decode("latin1"))
+        descr = str(header["descr"])
+        shape = tuple(int(n) for n in header["shape"])
+        fortran_order = bool(header["fortran_order"])
+    except (ValueError, SyntaxError, KeyError, TypeError):
+        raise ValueError(f"Invalid .npy header in {source}") from None
+
+    fmt = _NPY_FORMATS.get(descr[1:]) if isinstance(descr, str) else None
+    if fmt is None:
+        raise ValueError(
+            f"Unsupported dtype {descr!r} in {source} - expected a numeric type"
+        )
+    if len(shape) not in (1, 2):
+        raise ValueError(
+            f"Array in {source} must be one- or two-dimensional, got {len(shape)} "
+            "dimensions"
+        )
+    if fortran_order and len(shape) == 2:
+        raise ValueError(
+            f"Fortran-ordered array in {source} is not supported; save it with "
+            "numpy.ascontiguousarray()"
+        )
+
+    itemsize = int(descr[2:])
+    count = shape[0] * (shape[1] if len(shape) == 2 else 1)
+    if count == 0:
+        raise ValueError(f"Array in {source} is empty, shape {shape}")
+    body = data[start : start + count * itemsize]
+    if len(body) != count * itemsize:
+        raise ValueError(f"Truncated array data in {source}")
+    order = descr[0]
+    if fmt == "e":
+        endian = "<" if order == "|" else order
+        body = memoryview(array("d", struct.unpack(f"{endian}{count}e", body)))
+        body, fmt = body.cast("B"), "d"
+    elif itemsize > 1 and order in "<>" and order != _NATIVE_ORDER:
+        swapped = array(fmt, body.tobytes())
+        swapped.byteswap()
+        body = memoryview(swapped).cast("B")
+    return body.cast(fmt, shape)  # type: ignore[call-overload, no-any-return]
+
+
+_NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+
+def _npz_columns(path: Path) -> dict[str, Column]:
+    data = _map_file(path)
+    columns: dict[str, Column] = {}
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            if not info.filename.endswith(".npy"):
+                continue
+            if info.compress_type == zipfile.ZIP_STORED:
+                offset = _zip_member_offset(data, info)
+                member = data[offset : offset + info.file_size]
+            else:
+                member = memoryview(archive.read(info))
+            name = info.filename[: -len(".npy")]
+            columns.update(_npy_columns(name, member, f"{path}:{info.filename}"))
+    if not columns:
+        raise ValueError(f"No arrays found in {path}")
+    return columns
+
+
+def _zip_member_offset(data: memoryview, info: zipfile.ZipInfo) -> int:
+    """Offset of a stored member's bytes, past its local file header."""
+    header = info.header_offset
+    name_len = int.from_bytes(data[header + 26 : header + 28], "little")
+    extra_len = int.from_bytes(data[header + 28 : header + 30], "little")
+    return header + _ZIP_LOCAL_HEADER_SIZE + name_len + extra_len
+
+
+def _require_pyarrow(suffix: str) -> ModuleType:
+    try:
+        return importlib.import_module("pyarrow")
+    except ImportError:
+        raise ImportError(
+            f"Reading {suffix} files requires pyarrow. "
+            "Install it with: pip install pyarrow"
+        ) from None
+
+
+def _arrow_columns(path: Path, suffix: str) -> dict[str, Column]:
+    pa = _require_pyarrow(suffix)
+    if suffix in PARQUET_SUFFIXES:
+        parquet = importlib.import_module("pyarrow.parquet")
+        table = parquet.read_table(str(path), memory_map=True)
+    else:
+        ipc = importlib.import_module("pyarrow.ipc")
+        source = pa.memory_map(str(path), "r")
+        try:
+            table = ipc.open_file(source).read_all()
+        except pa.ArrowInvalid:
+            # Not the random-access file format: an IPC stream (.arrows).
+            source.seek(0)
+            table = ipc.open_stream(source).read_all()
+    return {
+        str(name): _arrow_column(str(name), column, path)
+        for name, column in zip(table.column_names, table.columns)
+    }
+
+
+def _arrow_column(name: str, column: object, path: Path) -> Column:
+    """A zero-copy view of a numeric Arrow column, or its values as strings."""
+    chunked = cast("_ChunkedArray", column)
+    fmt = _ARROW_FORMATS.get(str(chunked.type))
+    if fmt is None:
+        return ["" if v is None else str(v) for v in chunked.to_pylist()]
+    if chunked.null_count:
+        raise ValueError(f"Column '{name}' in {path} contains null values")
+    # A single chunk is viewed in place; several are concatenated once.
+    values = chunked.chunk(0) if chunked.num_chunks == 1 else chunked.combine_chunks()
+    itemsize = array(fmt).itemsize
+    buffer = memoryview(values.buffers()[1])
+    start = values.offset * itemsize
+    data = buffer[start : start + len(values) * itemsize]
+    return SeriesView(data.cast(fmt))  # type: ignore[call-overload]
+
+
+class _Array(Protocol):
+    """The parts of ``pyarrow.Array`` used here (pyarrow is untyped)."""
+
+    offset: int
+
+    def buffers(self) -> list[bytes]: ...
+
+    def __len__(self) -> int: ...
+
+
+class _ChunkedArray(Protocol):
+    """The parts of ``pyarrow.ChunkedArray`` used here."""
+
+    type: object
+    null_count: int
+    num_chunks: int
+
+    def chunk(self, i: int) -> _Array: ...
+
+    def combine_chunks(self) -> _Array: ...
+
+    def to_pylist(self) -> list[object]: ...
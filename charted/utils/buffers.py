@@ -0,0 +1,241 @@
+"""Zero-copy chart data from buffer-protocol objects.
+
+NumPy arrays, ``array.array``, ``memoryview`` and Arrow buffers already hold
+their values as packed machine numbers. Converting a multi-million element
+column into a list of boxed Python floats costs far more time and memory than
+drawing it, so charts wrap such inputs in :class:`SeriesView`: a read-only
+sequence over the caller's memory. Validation (NaN/inf and the min/max the
+axes need) runs as array reductions, and values only become Python objects
+when something indexes or iterates them.
+
+A 2-D input is split into one view per row, each pointing into the same
+buffer, so multi-series data is still a list of rows like a list-of-lists.
+Inputs whose memory cannot be viewed as flat numbers (object arrays,
+non-contiguous or foreign-endian arrays) are copied once instead.
+"""
+
+from __future__ import annotations
+
+import array
+import math
+from collections.abc import Iterator, Sequence
+from typing import cast, overload
+
+from charted.utils.exceptions import InvalidDataError
+from charted.utils.vectorized import HAS_NUMPY, numpy_enabled
+
+if HAS_NUMPY:
+    import numpy as np
+
+# struct-syntax formats of the numeric element types a view may hold.
+_INTEGER_FORMATS = frozenset("bBhHiIlLqQnN?")
+_FLOAT_FORMATS = frozenset("fd")
+
+# Sequences that support the buffer protocol but are never chart data.
+_NOT_DATA = (str, bytes, bytearray, list, tuple)
+
+
+class SeriesView(Sequence[float]):
+    """Read-only numeric series backed by a caller-owned buffer.
+
+    Behaves like the list of values it stands for: ``len``, indexing (a
+    slice is another view), iteration and ``==`` against a list all work.
+    ``tolist()`` materializes the Python list explicitly. NumPy sees the
+    underlying memory directly through ``__array__``.
+
+    Attributes:
+        minimum: Smallest value, set by :meth:`validate`.
+        maximum: Largest value, set by :meth:`validate`.
+    """
+
+    __slots__ = ("_view", "minimum", "maximum")
+
+    def __init__(self, view: memoryview) -> None:
+        self._view = view
+        self.minimum: float | None = None
+        self.maximum: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...
+
+    @overload
+    def __getitem__(
+        self, index: slice[int | None, int | None, int | None]
+    ) -> SeriesView: ...
+
+    def __getitem__(
+        self, index: int | slice[int | None, int | None, int | None]
+    ) -> float | SeriesView:
+        if isinstance(index, slice):
+            return SeriesView(self._view[index])
+        return cast("float", self._view[index])
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(cast("Sequence[float]", self._view))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SeriesView):
+            return self._view == other._view
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"SeriesView({self.tolist()!r})"
+
+    def __array__(self, dtype: object = None, copy: bool | None = None) -> object:
+        # Zero-copy unless NumPy asks for a different dtype.
+        return np.asarray(self._view, dtype=cast("str | None", dtype))
+
+    def tolist(self) -> list[float]:
+        """The values as a new list of Python numbers."""
+        return cast("list[float]", self._view.tolist())
+
+    def validate(self) -> None:
+        """Reject NaN/inf values and record ``minimum``/``maximum``.
+
+        One min and one max reduction cover both: NaN propagates through
+        either, and an infinite value is necessarily an extreme.
+
+        Raises:
+            InvalidDataError: If the series holds NaN or infinite values.
+        """
+        if not len(self._view):
+            return
+        if numpy_enabled():
+            data = np.asarray(self._view)
+            low = data.min().item()
+            high = data.max().item()
+        else:
+            values = cast("Sequence[float]", self._view)
+            if self._view.format in _FLOAT_FORMATS and not all(
+                map(math.isfinite, values)
+            ):
+                low = high = next(v for v in values if not math.isfinite(v))
+            else:
+                low = min(values)
+                high = max(values)
+        for bound in (low, high):
+            if bound != bound:
+                raise InvalidDataError("NaN values are not allowed in chart data")
+            if isinstance(bound, float) and math.isinf(bound):
+                raise InvalidDataError("Infinite values are not allowed in chart data")
+        self.minimum = low
+        self.maximum = high
+
+
+#: Types a row of multi-series chart data may have.
+ROW_TYPES = (list, SeriesView)
+
+
+def is_buffer(data: object) -> bool:
+    """True if ``data`` is array-like chart data rather than a Python list."""
+    if data is None or isinstance(data, (*_NOT_DATA, SeriesView)):
+        return False
+    if isinstance(data, (memoryview, array.array)):
+        return True
+    if HAS_NUMPY and hasattr(data, "__array__"):
+        # NumPy scalars expose __array__ too, but are single values.
+        return not isinstance(data, np.generic)
+    try:
+        memoryview(cast("bytes", data))
+    except TypeError:
+        return False
+    return True
+
+
+def as_chart_data(data: object) -> object:
+    """Wrap buffer-protocol chart data in :class:`SeriesView` rows.
+
+    A 1-D buffer becomes a single ``SeriesView`` and a 2-D buffer (or a list
+    of 1-D buffers) a list of them, mirroring the flat-list and
+    list-of-lists shapes charts already accept. Anything else is returned
+    unchanged.
+
+    Raises:
+        InvalidDataError: If the buffer is not numeric or has more than two
+            dimensions.
+    """
+    if isinstance(data, list) and data and all(is_buffer(row) for row in data):
+        rows: list[SeriesView] = []
+        for row in data:
+            wrapped = as_chart_data(row)
+            if not isinstance(wrapped, SeriesView):
+                raise InvalidDataError("Each series must be one-dimensional")
+            rows.append(wrapped)
+        return rows
+    if not is_buffer(data):
+        return data
+
+    view = _numeric_view(data)
+    if view.ndim == 0:
+        raise InvalidDataError("Chart data must have at least one dimension")
+    if view.ndim > 2:
+        raise InvalidDataError(
+            f"Chart data must be one- or two-dimensional, got {view.ndim} dimensions"
+        )
+    if view.ndim == 1:
+        return SeriesView(view)
+    count, length = cast("tuple[int, int]", view.shape)
+    flat = view.cast("B").cast(view.format)  # type: ignore[call-overload]
+    return [SeriesView(flat[i * length : (i + 1) * length]) for i in range(count)]
+
+
+def data_bounds(data: Sequence[Sequence[float]]) -> tuple[float, float]:
+    """Minimum and maximum over every row, using validated view bounds."""
+    lows = []
+    highs = []
+    for row in data:
+        if isinstance(row, SeriesView) and row.minimum is not None:
+            lows.append(row.minimum)
+            highs.append(cast("float", row.maximum))
+        else:
+            lows.append(min(row))
+            highs.append(max(row))
+    return min(lows), max(highs)
+
+
+def materialize(data: Sequence[Sequence[float]]) -> list[list[float]]:
+    """Rows as plain lists, converting any ``SeriesView`` rows."""
+    return [
+        row.tolist() if isinstance(row, SeriesView) else cast("list[float]", row)
+        for row in data
+    ]
+
+
+def _numeric_view(data: object) -> memoryview:
+    """A C-contiguous memoryview of native numbers over ``data``.
+
+    Falls back to a single copy through NumPy (or a list, without NumPy) when
+    the memory cannot be viewed in place.
+    """
+    try:
+        view = memoryview(cast("bytes", data))
+    except TypeError:
+        view = None
+    if view is not None and view.c_contiguous and _is_numeric(view.format):
+        return view
+    if HAS_NUMPY:
+        values = np.asarray(data)
+        if values.dtype.kind in "iub":
+            return np.ascontiguousarray(values, dtype=np.int64).data
+        try:
+            return np.ascontiguousarray(values, dtype=np.float64).data
+        except (TypeError, ValueError):
+            raise InvalidDataError(
+                f"Invalid data of dtype {values.dtype} - expected numeric type"
+            ) from None
+    if view is not None and view.ndim == 1:
+        return memoryview(array.array("d", view.tolist()))
+    raise InvalidDataError(
+        f"Invalid data value: {type(data).__name__} - expected numeric type"
+    )
+
+
+def _is_numeric(fmt: str) -> bool:
+    return fmt in _INTEGER_FORMATS or fmt in _FLOAT_FORMATS
@@ -188,7 +188,9 @@ def from_dataframe(df: object, **kwargs: object) -> Chart:
                 "Provide at least one numeric column as y_data."
             )
 
-        y_data = [df[c].tolist() for c in numeric_cols]
+        # Numeric columns go in as arrays: charts view their memory directly
+        # instead of boxing every value into a Python float.
+        y_data = [df[c].to_numpy() for c in numeric_cols]
         series_names = list(numeric_cols)
 
         # Use index or first string column as x_labels
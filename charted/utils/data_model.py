@@ -4,7 +4,9 @@ Extracted from Chart class to reduce architectural debt and improve separation o
 """
 
 import math
+from typing import cast
 
+from charted.utils.buffers import ROW_TYPES, SeriesView, as_chart_data
 from charted.utils.exceptions import (
     InvalidDataError,
     LabelMismatchError,
@@ -119,6 +121,10 @@ class DataModel:
     def validate_data(cls, data: Vector | Vector2D | None) -> Vector2D | None:
         """Validate and normalize chart data.
 
+        Buffer-protocol inputs (NumPy arrays, ``array.array``, ``memoryview``)
+        are kept as zero-copy ``SeriesView`` rows and validated with array
+        reductions; see :mod:`charted.utils.buffers`.
+
         Args:
             data: Single series (list of values) or multi-series (list of lists)
 
@@ -129,6 +135,7 @@ class DataModel:
             NoDataError: If data is empty
             InvalidDataError: If data has mismatched lengths or invalid values
         """
+        data = cast("Vector | Vector2D | None", as_chart_data(data))
         if data is not None and len(data) == 0:
             raise NoDataError("No data was provided.")
 
@@ -136,7 +143,7 @@ class DataModel:
             return None
 
         # Convert single series to 2D
-        if not isinstance(data[0], list):
+        if not isinstance(data[0], ROW_TYPES):
             data = [data]
 
         max_length = max([len(i) for i in data])
@@ -146,6 +153,9 @@ class DataModel:
 
         # Validate values (no NaN)
         for series in data:
+            if isinstance(series, SeriesView):
+                series.validate()
+                continue
             for value in series:
                 if not isinstance(value, (int, float)):
                     raise InvalidDataError(
@@ -0,0 +1,232 @@
+"""Level-of-detail downsampling for long line and area series.
+
+A plot a few hundred pixels wide cannot show more than a couple of points per
+pixel column, so rendering a 1M-point series spends almost all of its time and
+output bytes on vertices nobody can see. These helpers pick the subset of
+points worth drawing before the chart projects anything, keeping output size
+and render time bounded by the threshold instead of the input length.
+
+Supported methods:
+
+- ``lttb``: Largest-Triangle-Three-Buckets (Steinarsson, 2013). Splits the
+  interior into ``threshold - 2`` buckets and keeps, from each, the point
+  forming the largest triangle with the previously kept point and the average
+  of the next bucket. Good at preserving the visual shape of a trace.
+- ``minmax``: per-bucket min/max envelope. Keeps the lowest and highest point
+  of each of ``(threshold - 2) // 2`` buckets, so every spike survives. Buckets
+  hold equal point counts, which match pixel columns for evenly spaced x.
+
+Both always keep the first and last point. Multi-series charts share one x
+axis, so the kept indices are the union across series and every series is
+reduced with the same indices; series stay aligned for stacking.
+"""
+
+from __future__ import annotations
+
+from typing import TypeVar, cast
+
+from charted.utils.buffers import ROW_TYPES, SeriesView, as_chart_data
+from charted.utils.data_model import DataModel
+from charted.utils.types import Labels, Vector, Vector2D
+
+#: Downsampling methods accepted by ``LineChart`` and ``AreaChart``.
+VALID_DOWNSAMPLE = ("lttb", "minmax")
+
+#: Fewest points a downsampled series may keep (first, one interior, last).
+MIN_THRESHOLD = 3
+
+_T = TypeVar("_T")
+
+
+def lttb_indices(xs: Vector, ys: Vector, threshold: int) -> list[int]:
+    """Indices kept by Largest-Triangle-Three-Buckets.
+
+    Args:
+        xs: X coordinates, in ascending order.
+        ys: Y values, the same length as ``xs``.
+        threshold: Number of points to keep.
+
+    Returns:
+        Ascending indices into the series; every index when the series is no
+        longer than ``threshold``.
+    """
+    n = len(ys)
+    if threshold >= n or threshold < MIN_THRESHOLD:
+        return list(range(n))
+
+    every = (n - 2) / (threshold - 2)
+    kept = [0]
+    a = 0
+    for bucket in range(threshold - 2):
+        # Average of the next bucket: the third vertex of each triangle.
+        avg_start = int((bucket + 1) * every) + 1
+        avg_end = min(int((bucket + 2) * every) + 1, n)
+        span = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / span
+        avg_y = sum(ys[avg_start:avg_end]) / span
+
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        ax = xs[a]
+        ay = ys[a]
+        dx = avg_x - ax
+        dy = avg_y - ay
+        best = start
+        best_area = -1.0
+        for j in range(start, end):
+            # Twice the triangle area; the constant factor cannot change the max.
+            area = abs(dx * (ys[j] - ay) - (xs[j] - ax) * dy)
+            if area > best_area:
+                best_area = area
+                best = j
+        kept.append(best)
+        a = best
+    kept.append(n - 1)
+    return kept
+
+
+def minmax_indices(xs: Vector, ys: Vector, threshold: int) -> list[int]:
+    """Indices kept by the per-bucket min/max envelope.
+
+    Args:
+        xs: X coordinates (unused; buckets hold equal point counts). Accepted
+            so both methods share a signature.
+        ys: Y values.
+        threshold: Upper bound on the number of points kept.
+
+    Returns:
+        Ascending indices into the series; every index when the series is no
+        longer than ``threshold``.
+    """
+    n = len(ys)
+    if threshold >= n or threshold < MIN_THRESHOLD:
+        return list(range(n))
+
+    buckets = max(1, (threshold - 2) // 2)
+    every = (n - 2) / buckets
+    kept = [0]
+    for bucket in range(buckets):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        if start >= end:
+            continue
+        window = ys[start:end]
+        low = start + window.index(min(window))
+        high = start + window.index(max(window))
+        if low == high:
+            kept.append(low)
+        else:
+            kept.extend((low, high) if low < high else (high, low))
+    kept.append(n - 1)
+    return kept
+
+
+_METHODS = {"lttb": lttb_indices, "minmax": minmax_indices}
+
+
+def validate_downsample(method: str | None, threshold: int | None) -> None:
+    """Raise ``ValueError`` for an unknown method or a too-small threshold."""
+    if method is not None and method not in _METHODS:
+        raise ValueError(
+            f"Unknown downsample {method!r}. "
+            f"Valid options: {', '.join(VALID_DOWNSAMPLE)}"
+        )
+    if threshold is not None and threshold < MIN_THRESHOLD:
+        raise ValueError(
+            f"downsample_threshold must be at least {MIN_THRESHOLD}, got {threshold}"
+        )
+
+
+def downsample_indices(
+    method: str,
+    data: Vector | Vector2D,
+    x_data: Vector | Vector2D | None,
+    threshold: int,
+) -> list[int] | None:
+    """Indices to keep across every series, or None when nothing is dropped.
+
+    Args:
+        method: One of ``VALID_DOWNSAMPLE``.
+        data: Single series or list of equal-length series.
+        x_data: Shared x values, per-series x rows, or None for index
+            positions. Non-numeric x (dates, ISO strings) falls back to index
+            positions for the selection.
+        threshold: Target number of points per series.
+    """
+    validate_downsample(method, threshold)
+    rows = _rows(data)
+    if not rows or len(rows[0]) <= threshold:
+        return None
+    n = len(rows[0])
+    x_rows = _rows(x_data) if x_data is not None else []
+    select = _METHODS[method]
+    kept: set[int] = set()
+    for idx, ys in enumerate(rows):
+        xs = x_rows[min(idx, len(x_rows) - 1)] if x_rows else None
+        if not xs or len(xs) != n or not isinstance(xs[0], (int, float)):
+            xs = [float(i) for i in range(n)]
+        # The selection loops index point by point; give them plain lists.
+        kept.update(select(_as_list(xs), _as_list(ys), threshold))
+    return sorted(kept)
+
+
+def take(values: list[_T], keep: list[int]) -> list[_T]:
+    """Select the ``keep`` indices of a flat list."""
+    return [values[i] for i in keep]
+
+
+def take_series(values: Vector | Vector2D, keep: list[int]) -> Vector | Vector2D:
+    """Select the ``keep`` indices of one series, or of every row of several."""
+    if values and isinstance(values[0], ROW_TYPES):
+        return [take(row, keep) for row in values]
+    return take(cast("Vector", values), keep)
+
+
+def downsample_chart_data(
+    method: str,
+    threshold: int,
+    data: Vector | Vector2D,
+    x_data: Vector | Vector2D | None,
+    labels: Labels | None,
+) -> tuple[
+    Vector | Vector2D, Vector | Vector2D | None, Labels | None, list[int] | None
+]:
+    """Reduce a chart's series, x values and labels to the kept points.
+
+    Without ``x_data`` the kept indices become the x values, so the reduced
+    points stay at their original positions instead of being re-spaced evenly.
+
+    Returns:
+        ``(data, x_data, labels, keep)``; the inputs unchanged and ``keep``
+        None when the series already fit the threshold.
+
+    Raises:
+        InvalidDataError: If the series (or numeric x values) hold values a
+            chart would reject, before the selection math sees them.
+    """
+    data = cast("Vector | Vector2D", as_chart_data(data))
+    x_data = cast("Vector | Vector2D | None", as_chart_data(x_data))
+    DataModel.validate_data(data)
+    first_x = _rows(x_data)[0] if x_data else None
+    if first_x and isinstance(first_x[0], (int, float)):
+        # Dates and ISO strings select by index position; only numeric x
+        # values feed the triangle areas.
+        DataModel.validate_data(x_data)
+    keep = downsample_indices(method, data, x_data, threshold)
+    if keep is None:
+        return data, x_data, labels, None
+    reduced_x: Vector | Vector2D = (
+        take_series(x_data, keep) if x_data is not None else [float(i) for i in keep]
+    )
+    reduced_labels = take(labels, keep) if labels else labels
+    return take_series(data, keep), reduced_x, reduced_labels, keep
+
+
+def _as_list(values: Vector) -> Vector:
+    return values.tolist() if isinstance(values, SeriesView) else values
+
+
+def _rows(data: Vector | Vector2D) -> Vector2D:
+    if data and isinstance(data[0], ROW_TYPES):
+        return data
+    return [cast("Vector", data)]
@@ -0,0 +1,322 @@
+"""Collision-aware placement shared by the chart label layers.
+
+Axis tick labels, value labels and scatter data labels all need the same
+thing: put a text box where it was asked for unless it would collide with a
+box already drawn. :class:`LabelPlacer` keeps the placed boxes in a
+:class:`~charted.utils.spatial_index.GridIndex`, so a collision test only
+visits the neighbouring cells and a whole layer places in near-linear time.
+
+Placement is greedy: requests are taken in priority order, and each takes the
+first of its candidate positions that is clear (and inside the optional
+bounds). Required requests are placed even when every candidate collides, so
+for example the first and last tick of an axis are always labelled.
+
+Scatter labels are placed by relaxation rather than by candidate choice;
+:func:`relax_labels` runs that pass over the same index.
+
+Pie outside labels, radar ring badges and the bar value-label inside/outside
+choice keep their own placement: pie labels sit in fixed rows that cannot
+overlap, every ring badge is always drawn, and a bar label only checks the
+plot edge, so none of them has collisions to resolve.
+
+Boxes are ``(x0, y0, x1, y1)`` tuples in whatever coordinate system the layer
+draws in.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TypedDict
+
+from charted.utils.spatial_index import GridIndex
+
+Box = tuple[float, float, float, float]
+
+
+class PlacedLabel(TypedDict):
+    """A data label's placement state during :func:`relax_labels`."""
+
+    text: str
+    px: float
+    py: float
+    cx: float
+    cy: float
+    w: float
+    h: float
+    marker: float
+
+
+def boxes_collide(
+    a: Box, b: Box, tolerance: tuple[float, float] = (0.0, 0.0)
+) -> bool:
+    """True when ``a`` and ``b`` overlap by more than ``tolerance`` on both axes."""
+    tx, ty = tolerance
+    return (
+        a[0] < b[2] - tx
+        and b[0] < a[2] - tx
+        and a[1] < b[3] - ty
+        and b[1] < a[3] - ty
+    )
+
+
+@dataclass
+class LabelRequest:
+    """One label to place.
+
+    Attributes:
+        candidates: Positions to try, most preferred first.
+        priority: Higher priorities are placed first; ties keep input order.
+        required: Place the first candidate even if every candidate collides.
+    """
+
+    candidates: Sequence[Box]
+    priority: float = 0.0
+    required: bool = False
+
+
+class LabelPlacer:
+    """Greedy label placement against the boxes placed so far.
+
+    Args:
+        bounds: Optional ``(x0, y0, x1, y1)`` area every placed box must stay
+            inside. Use ``math.inf`` for an open side.
+        tolerance: Overlap in pixels, along x and y, that still counts as
+            clear. ``(1.0, 0.0)`` lets neighbouring labels touch by a pixel.
+        cell_size: Grid cell size of the index. Any size is correct; one near
+            the typical label size keeps queries cheapest.
+
+    Example:
+        >>> placer = LabelPlacer()
+        >>> placer.place((0, 0, 40, 12))
+        True
+        >>> placer.place((30, 5, 70, 17))
+        False
+    """
+
+    def __init__(
+        self,
+        bounds: Box | None = None,
+        tolerance: tuple[float, float] = (0.0, 0.0),
+        cell_size: float = 64.0,
+    ) -> None:
+        self.bounds = bounds
+        self.tolerance = tolerance
+        self.boxes: list[Box] = []
+        self._index = GridIndex(cell_size, cell_size)
+        self._half_w = 0.0
+        self._half_h = 0.0
+
+    def inside(self, box: Box) -> bool:
+        """True when ``box`` lies within the placer's bounds (if any)."""
+        b = self.bounds
+        if b is None:
+            return True
+        return (
+            box[0] >= b[0] and box[1] >= b[1] and box[2] <= b[2] and box[3] <= b[3]
+        )
+
+    def collides(self, box: Box) -> bool:
+        """True when ``box`` collides with any placed box."""
+        if not self.boxes:
+            return False
+        half_w = (box[2] - box[0]) / 2
+        half_h = (box[3] - box[1]) / 2
+        near = self._index.query(
+            box[0] + half_w,
+            box[1] + half_h,
+            half_w + self._half_w,
+            half_h + self._half_h,
+        )
+        boxes = self.boxes
+        return any(boxes_collide(box, boxes[k], self.tolerance) for k in near)
+
+    def fits(self, box: Box) -> bool:
+        """True when ``box`` is inside the bounds and collides with nothing."""
+        return self.inside(box) and not self.collides(box)
+
+    def add(self, box: Box) -> None:
+        """Record ``box`` as placed, whether or not it collides."""
+        half_w = (box[2] - box[0]) / 2
+        half_h = (box[3] - box[1]) / 2
+        self._half_w = max(self._half_w, half_w)
+        self._half_h = max(self._half_h, half_h)
+        self._index.insert(len(self.boxes), box[0] + half_w, box[1] + half_h)
+        self.boxes.append(box)
+
+    def place(self, box: Box) -> bool:
+        """Place ``box`` if it fits; return whether it was placed."""
+        if not self.fits(box):
+            return False
+        self.add(box)
+        return True
+
+    def place_first(
+        self, candidates: Sequence[Box], required: bool = False
+    ) -> int | None:
+        """Place the first candidate that fits and return its index.
+
+        Returns None when no candidate fits, unless ``required``, in which case
+        the first candidate is placed anyway.
+        """
+        for i, box in enumerate(candidates):
+            if self.place(box):
+                return i
+        if required and candidates:
+            self.add(candidates[0])
+            return 0
+        return None
+
+    def place_all(self, requests: Sequence[LabelRequest]) -> list[int | None]:
+        """Place ``requests`` by priority; return each one's chosen candidate."""
+        chosen: list[int | None] = [None] * len(requests)
+        order = sorted(range(len(requests)), key=lambda i: -requests[i].priority)
+        for i in order:
+            request = requests[i]
+            chosen[i] = self.place_first(request.candidates, request.required)
+        return chosen
+
+
+def relax_labels(
+    placed: list[PlacedLabel],
+    iterations: int = 60,
+    time_budget: float | None = None,
+) -> None:
+    """Greedily push overlapping label boxes apart, in place.
+
+    Each iteration walks every label pair plus every label/marker pair and,
+    for any overlapping axis-aligned boxes, shifts the label along the axis
+    of least penetration. A small spring pulls each label back toward its
+    own marker so labels do not drift indefinitely. This is a local
+    heuristic with no global guarantee.
+
+    Labels and markers are bucketed in a :class:`GridIndex`, so each label
+    is only tested against boxes in the neighbouring cells. Candidates are
+    visited in the same order as an all-pairs scan (and re-queried after a
+    move), so the placements match the exhaustive pass exactly.
+
+    Args:
+        placed: Label boxes (centre ``cx``/``cy``, size ``w``/``h``) anchored
+            to markers (centre ``px``/``py``, radius ``marker``).
+        iterations: Maximum number of relaxation passes.
+        time_budget: Optional wall-clock limit in seconds; checked after
+            each pass. The pass also stops as soon as nothing moves.
+    """
+    if not placed:
+        return
+
+    def overlap(
+        a_cx: float,
+        a_cy: float,
+        a_w: float,
+        a_h: float,
+        b_cx: float,
+        b_cy: float,
+        b_w: float,
+        b_h: float,
+        pad: float = 2.0,
+    ) -> tuple[float, float] | None:
+        ox = (a_w + b_w) / 2 + pad - abs(a_cx - b_cx)
+        oy = (a_h + b_h) / 2 + pad - abs(a_cy - b_cy)
+        if ox > 0 and oy > 0:
+            return ox, oy
+        return None
+
+    pad = 2.0
+    max_w = max(lab["w"] for lab in placed)
+    max_h = max(lab["h"] for lab in placed)
+    max_m = max(lab["marker"] for lab in placed) * 2
+    markers = GridIndex(max_m + pad, max_m + pad)
+    for k, lab in enumerate(placed):
+        markers.insert(k, lab["px"], lab["py"])
+    deadline = None if time_budget is None else perf_counter() + time_budget
+
+    for _ in range(iterations):
+        moved = False
+        boxes = GridIndex(max_w + pad, max_h + pad)
+        for k, lab in enumerate(placed):
+            boxes.insert(k, lab["cx"], lab["cy"])
+        for i, a in enumerate(placed):
+            reach_x = (a["w"] + max_w) / 2 + pad
+            reach_y = (a["h"] + max_h) / 2 + pad
+            # Label vs every later label near it.
+            near = boxes.query(a["cx"], a["cy"], reach_x, reach_y)
+            candidates = [k for k in near if k > i]
+            pos = 0
+            while pos < len(candidates):
+                k = candidates[pos]
+                pos += 1
+                b = placed[k]
+                res = overlap(
+                    a["cx"],
+                    a["cy"],
+                    a["w"],
+                    a["h"],
+                    b["cx"],
+                    b["cy"],
+                    b["w"],
+                    b["h"],
+                )
+                if res is None:
+                    continue
+                ox, oy = res
+                moved = True
+                if ox < oy:
+                    shift = ox / 2 + 0.1
+                    sign = 1 if a["cx"] >= b["cx"] else -1
+                    a["cx"] += sign * shift
+                    b["cx"] -= sign * shift
+                else:
+                    shift = oy / 2 + 0.1
+                    sign = 1 if a["cy"] >= b["cy"] else -1
+                    a["cy"] += sign * shift
+                    b["cy"] -= sign * shift
+                boxes.move(i, a["cx"], a["cy"])
+                boxes.move(k, b["cx"], b["cy"])
+                # The label moved: look again from its new position.
+                near = boxes.query(a["cx"], a["cy"], reach_x, reach_y)
+                candidates = [j for j in near if j > k]
+                pos = 0
+            # Label vs markers (approximated by their bounding box).
+            reach_x = (a["w"] + max_m) / 2 + pad
+            reach_y = (a["h"] + max_m) / 2 + pad
+            candidates = markers.query(a["cx"], a["cy"], reach_x, reach_y)
+            pos = 0
+            while pos < len(candidates):
+                k = candidates[pos]
+                pos += 1
+                b = placed[k]
+                m = b["marker"] * 2
+                res = overlap(
+                    a["cx"],
+                    a["cy"],
+                    a["w"],
+                    a["h"],
+                    b["px"],
+                    b["py"],
+                    m,
+                    m,
+                )
+                if res is None:
+                    continue
+                ox, oy = res
+                moved = True
+                if ox < oy:
+                    sign = 1 if a["cx"] >= b["px"] else -1
+                    a["cx"] += sign * (ox + 0.1)
+                else:
+                    sign = 1 if a["cy"] >= b["py"] else -1
+                    a["cy"] += sign * (oy + 0.1)
+                boxes.move(i, a["cx"], a["cy"])
+                near = markers.query(a["cx"], a["cy"], reach_x, reach_y)
+                candidates = [j for j in near if j > k]
+                pos = 0
+        # Weak spring back toward the marker keeps labels from wandering.
+        for a in placed:
+            a["cx"] += (a["px"] - a["cx"]) * 0.01
+            a["cy"] += (a["py"] - a["cy"]) * 0.01
+        if not moved:
+            break
+        if deadline is not None and perf_counter() >= deadline:
+            break
@@ -4,6 +4,7 @@ Extracted from Chart class to reduce coupling and improve testability.
 This module encapsulates all layout calculation logic in a focused component.
 """
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -25,8 +26,24 @@ class LayoutEngine:
         x_labels: X-axis labels with width information.
         y_labels: Y-axis labels with width information.
         title: Chart title with height information (optional).
+
+    The derived dimensions (paddings, plot size, label rotation) are computed
+    once and cached; assigning any input attribute (e.g. ``x_labels`` once
+    the axes are built) clears the cache.
     """
 
+    # Derived values cached by cached_property; see __setattr__.
+    _DERIVED = (
+        "plot_width",
+        "plot_height",
+        "left_padding",
+        "_legend_band",
+        "right_padding",
+        "top_padding",
+        "bottom_padding",
+        "x_label_rotation",
+    )
+
     def __init__(
         self,
         width: float,
@@ -61,7 +78,14 @@ class LayoutEngine:
         self.legend_position = legend_position or "none"
         self.legend_extent = max(0.0, float(legend_extent))
 
-    @property
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        # cached_property stores straight into __dict__, so this only runs for
+        # input attributes: every derived value may depend on them.
+        for derived in self._DERIVED:
+            self.__dict__.pop(derived, None)
+
+    @cached_property
     def plot_width(self) -> float:
         """Calculate available plot area width.
 
@@ -70,7 +94,7 @@ class LayoutEngine:
         """
         return self.width - (self.left_padding + self.right_padding)
 
-    @property
+    @cached_property
     def plot_height(self) -> float:
         """Calculate available plot area height.
 
@@ -79,7 +103,7 @@ class LayoutEngine:
         """
         return self.height - (self.top_padding + self.bottom_padding)
 
-    @property
+    @cached_property
     def left_padding(self) -> float:
         """Calculate left padding for y-axis labels.
 
@@ -103,14 +127,14 @@ class LayoutEngine:
 
         return h_pad + max_width
 
-    @property
+    @cached_property
     def _legend_band(self) -> float:
         """Pixel band reserved for an outside-the-plot legend, or 0."""
         if self.legend_position in ("right", "bottom", "top"):
             return self.legend_extent
         return 0.0
 
-    @property
+    @cached_property
     def right_padding(self) -> float:
         """Calculate right padding.
 
@@ -123,7 +147,7 @@ class LayoutEngine:
             pad += self._legend_band
         return pad
 
-    @property
+    @cached_property
     def top_padding(self) -> float:
         """Calculate top padding including title space.
 
@@ -151,7 +175,7 @@ class LayoutEngine:
 
         return v_pad + offset
 
-    @property
+    @cached_property
     def bottom_padding(self) -> float:
         """Calculate bottom padding including rotated label space.
 
@@ -212,7 +236,7 @@ class LayoutEngine:
 
         return base + abs((dy - y))
 
-    @property
+    @cached_property
     def x_label_rotation(self) -> tuple[float, float] | None:
         """Calculate optimal rotation angle for x-axis labels.
 
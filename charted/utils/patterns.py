@@ -29,6 +29,8 @@ DEFAULT_PATTERN_CYCLE = [
 class Pattern(Element):
     """An SVG ``<pattern>`` tile."""
 
+    __slots__ = ()
+
     tag = "pattern"
 
 
@@ -1,8 +1,8 @@
 """Sankey diagram layout engine.
 
-A faithful port of d3-sankey's layout algorithm (https://github.com/d3/d3-sankey)
-to pure-stdlib Python. Given a directed acyclic graph of nodes and weighted
-links it computes, for a fixed drawing rectangle:
+A port of d3-sankey's layout algorithm (https://github.com/d3/d3-sankey) to
+pure-stdlib Python. Given a directed acyclic graph of nodes and weighted links
+it computes, for a fixed drawing rectangle:
 
 * a column (``depth``) for every node, by one of four alignment strategies;
 * a horizontal band per column;
@@ -13,9 +13,22 @@ links it computes, for a fixed drawing rectangle:
   node's height (the flow-conservation invariant).
 
 The vertical placement is solved iteratively: nodes are nudged toward the
-weighted average of the links touching them (6 relaxation passes alternating
-left-to-right and right-to-left), with a collision-resolution sweep after each
+weighted average of the links touching them (relaxation passes alternating
+right-to-left and left-to-right), with a collision-resolution sweep after each
 pass to enforce the minimum node padding and keep every node inside the frame.
+Relaxation runs for at most ``iterations`` passes and stops early once no node
+moves by more than ``tolerance`` pixels in a pass.
+
+The engine works on array-backed tables: nodes and links are integer ids into
+parallel lists (values, endpoints, positions, widths), so the inner loops index
+lists rather than chase object attributes. Depths come from one topological
+pass. Relaxation only translates nodes, so link widths are fixed once the node
+heights are known. Each link caches its stacking offset at both ends; a node's
+links are re-sorted, and those offsets recomputed, only when a node at the
+other end of one of them moved. Every sort orders by position, rounded to
+``1 / LEVELS_PER_PX`` px, and then by id, so the order depends only on where the
+nodes are, never on which pass last sorted the list. The :class:`SankeyNode` /
+:class:`SankeyLink` objects are built once, from the final tables.
 
 No third-party dependencies: this module is part of the zero-runtime-dependency
 ``charted`` package.
@@ -23,6 +36,7 @@ No third-party dependencies: this module is part of the zero-runtime-dependency
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 
 from charted.utils.exceptions import ChartedError
@@ -31,6 +45,16 @@ from charted.utils.exceptions import ChartedError
 DEFAULT_NODE_WIDTH = 24.0
 DEFAULT_NODE_PADDING = 8.0
 DEFAULT_ITERATIONS = 6
+# Relaxation stops once no node moves further than this many pixels in a pass.
+DEFAULT_TOLERANCE = 1e-3
+
+# Nodes and links are ordered by position in steps of 1/LEVELS_PER_PX pixels,
+# so positions that differ only by float rounding count as level; ties then go
+# to the lower id.
+LEVELS_PER_PX = 1e9
+
+# Distinct layouts kept by cached_layout.
+LAYOUT_CACHE_SIZE = 32
 
 # Alignment strategies (d3's nodeAlign equivalents).
 ALIGNMENTS = ("justify", "left", "right", "center")
@@ -86,11 +110,77 @@ class SankeyLayout:
     links: list[SankeyLink]
 
 
+class _Graph:
+    """Array-backed node and link tables for one layout run.
+
+    Nodes and links are integer ids. Per-node columns (``value``, ``layer``,
+    ``y0`` ...) and per-link columns (``src``, ``tgt``, ``width`` ...) are
+    parallel lists; ``out_links`` / ``in_links`` hold each node's link ids in
+    stacking order, and ``out_ids`` / ``in_ids`` the same ids in id order.
+
+    The four offset columns cache where a link sits in its endpoints' stacks,
+    as the running sums d3's ``targetTop`` / ``sourceTop`` walk: ``out_gap``
+    and ``out_run`` are the widths (with and without padding) stacked above the
+    link on its source, ``in_gap`` and ``in_run`` the same on its target.
+    """
+
+    __slots__ = (
+        "n",
+        "src",
+        "tgt",
+        "link_value",
+        "out_links",
+        "in_links",
+        "out_ids",
+        "in_ids",
+        "value",
+        "depth",
+        "height",
+        "layer",
+        "x0",
+        "y0",
+        "y1",
+        "width",
+        "weight",
+        "out_gap",
+        "out_run",
+        "in_gap",
+        "in_run",
+    )
+
+    def __init__(self, n: int, raw_links: list[tuple[int, int, float]]) -> None:
+        m = len(raw_links)
+        self.n = n
+        self.src = [s for s, _t, _v in raw_links]
+        self.tgt = [t for _s, t, _v in raw_links]
+        self.link_value = [float(v) for _s, _t, v in raw_links]
+        self.out_links: list[list[int]] = [[] for _ in range(n)]
+        self.in_links: list[list[int]] = [[] for _ in range(n)]
+        for k in range(m):
+            self.out_links[self.src[k]].append(k)
+            self.in_links[self.tgt[k]].append(k)
+        self.out_ids = [tuple(links) for links in self.out_links]
+        self.in_ids = [tuple(links) for links in self.in_links]
+        self.value = [0.0] * n
+        self.depth = [0] * n
+        self.height = [0] * n
+        self.layer = [0] * n
+        self.x0 = [0.0] * n
+        self.y0 = [0.0] * n
+        self.y1 = [0.0] * n
+        self.width = [0.0] * m
+        self.weight = [0.0] * m
+        self.out_gap = [0.0] * m
+        self.out_run = [0.0] * m
+        self.in_gap = [0.0] * m
+        self.in_run = [0.0] * m
+
+
 def _build_graph(
     node_names: list[str],
     raw_links: list[tuple[int, int, float]],
-) -> tuple[list[SankeyNode], list[SankeyLink]]:
-    """Construct node/link objects and wire up adjacency, with validation."""
+) -> _Graph:
+    """Validate the input and build the node/link tables."""
     if not node_names:
         raise ChartedError(
             "SankeyChart needs at least one node. "
@@ -102,9 +192,7 @@ def _build_graph(
             "Pass flows via links=[(source, target, value), ...]."
         )
 
-    nodes = [SankeyNode(index=i, name=name) for i, name in enumerate(node_names)]
-    n = len(nodes)
-    links: list[SankeyLink] = []
+    n = len(node_names)
     for i, (s, t, v) in enumerate(raw_links):
         if not (0 <= s < n) or not (0 <= t < n):
             raise ChartedError(
@@ -120,171 +208,240 @@ def _build_graph(
             raise ChartedError(
                 f"links[{i}] has a negative value ({v}); flow values must be >= 0."
             )
-        link = SankeyLink(source=nodes[s], target=nodes[t], value=float(v), index=i)
-        nodes[s].source_links.append(link)
-        nodes[t].target_links.append(link)
-        links.append(link)
-    return nodes, links
+    return _Graph(n, raw_links)
 
 
-def _compute_node_values(nodes: list[SankeyNode]) -> None:
+def _compute_node_values(g: _Graph) -> None:
     """Node value = max(sum inbound, sum outbound), as in d3."""
-    for node in nodes:
-        out_sum = sum(link.value for link in node.source_links)
-        in_sum = sum(link.value for link in node.target_links)
-        node.value = max(out_sum, in_sum)
+    out_sum = [0.0] * g.n
+    in_sum = [0.0] * g.n
+    for s, t, v in zip(g.src, g.tgt, g.link_value):
+        out_sum[s] += v
+        in_sum[t] += v
+    g.value = [max(o, i) for o, i in zip(out_sum, in_sum)]
 
 
-def _compute_node_depths(nodes: list[SankeyNode]) -> int:
-    """Forward longest-path BFS assigning ``depth``; detects cycles.
+def _compute_node_depths(g: _Graph) -> list[int]:
+    """Assign ``depth`` (longest path from a source) in topological order.
 
-    Returns the number of columns (max depth + 1).
+    One Kahn pass: a node is settled once all its inbound links have been
+    seen, and its depth is one more than its deepest source. Returns the
+    topological order; a graph with a cycle never settles every node.
     """
-    n = len(nodes)
-    current = list(nodes)
-    x = 0
-    while current:
-        nxt: list[SankeyNode] = []
-        seen: set[int] = set()
-        for node in current:
-            node.depth = x
-            for link in node.source_links:
-                if link.target.index not in seen:
-                    seen.add(link.target.index)
-                    nxt.append(link.target)
-        x += 1
-        if x > n:
-            raise ChartedError(
-                "SankeyChart links form a cycle; the flow graph must be a DAG "
-                "(directed acyclic graph). Remove the back-edge and retry."
-            )
-        current = nxt
-    return x
-
-
-def _compute_node_heights(nodes: list[SankeyNode]) -> None:
-    """Reverse BFS assigning ``height`` (distance from the sink side)."""
-    n = len(nodes)
-    current = list(nodes)
-    x = 0
-    while current:
-        nxt: list[SankeyNode] = []
-        seen: set[int] = set()
-        for node in current:
-            node.height = x
-            for link in node.target_links:
-                if link.source.index not in seen:
-                    seen.add(link.source.index)
-                    nxt.append(link.source)
-        x += 1
-        if x > n:
-            raise ChartedError(
-                "SankeyChart links form a cycle; the flow graph must be a DAG."
-            )
-        current = nxt
+    tgt = g.tgt
+    depth = g.depth
+    pending = [len(links) for links in g.in_links]
+    order = [i for i in range(g.n) if not pending[i]]
+    for node in order:
+        d = depth[node] + 1
+        for k in g.out_links[node]:
+            t = tgt[k]
+            if depth[t] < d:
+                depth[t] = d
+            pending[t] -= 1
+            if not pending[t]:
+                order.append(t)
+    if len(order) < g.n:
+        raise ChartedError(
+            "SankeyChart links form a cycle; the flow graph must be a DAG "
+            "(directed acyclic graph). Remove the back-edge and retry."
+        )
+    return order
+
+
+def _compute_node_heights(g: _Graph, order: list[int]) -> None:
+    """Assign ``height`` (longest path to a sink) in reverse topological order."""
+    tgt = g.tgt
+    height = g.height
+    for node in reversed(order):
+        h = 0
+        for k in g.out_links[node]:
+            h = max(h, height[tgt[k]] + 1)
+        height[node] = h
 
 
-def _assign_layers(nodes: list[SankeyNode], n_cols: int, alignment: str) -> int:
+def _assign_layers(g: _Graph, n_cols: int, alignment: str) -> int:
     """Assign each node's final ``layer`` per the alignment strategy.
 
     Returns the number of distinct columns actually used.
     """
-    for node in nodes:
-        if alignment == "left":
-            node.layer = node.depth
-        elif alignment == "right":
-            node.layer = n_cols - 1 - node.height
-        elif alignment == "center":
-            # Sources (no inbound) stay at depth; everything else as left.
-            node.layer = node.depth
-        else:  # justify (default): sinks pushed to the far right column.
-            if not node.source_links:
-                node.layer = n_cols - 1
-            else:
-                node.layer = node.depth
-    used = {node.layer for node in nodes}
-    return max(used) + 1 if used else 1
-
-
-def _columns(nodes: list[SankeyNode], n_cols: int) -> list[list[SankeyNode]]:
-    """Group nodes by ``layer`` into ordered columns."""
-    cols: list[list[SankeyNode]] = [[] for _ in range(n_cols)]
-    for node in nodes:
-        cols[node.layer].append(node)
-    # Deterministic vertical order within a column: by original index.
-    for col in cols:
-        col.sort(key=lambda nd: nd.index)
-    return cols
+    if alignment == "right":
+        g.layer = [n_cols - 1 - h for h in g.height]
+    elif alignment == "justify":
+        # Sinks pushed to the far right column.
+        g.layer = [
+            d if out else n_cols - 1 for d, out in zip(g.depth, g.out_links)
+        ]
+    else:
+        # left, and center (sources stay at depth; everything else as left).
+        g.layer = list(g.depth)
+    return max(g.layer) + 1
 
 
 def _initialize_breadths(
-    columns: list[list[SankeyNode]],
+    g: _Graph,
+    columns: list[list[int]],
     y0: float,
     y1: float,
     node_padding: float,
 ) -> None:
     """Set initial node y0/y1 by scaling each column's values to the height."""
+    value = g.value
     ky = float("inf")
     for col in columns:
         if not col:
             continue
-        total = sum(node.value for node in col)
+        total = sum(value[i] for i in col)
         avail = (y1 - y0) - (len(col) - 1) * node_padding
         if total > 0:
             ky = min(ky, avail / total)
     if ky == float("inf") or ky <= 0:
         ky = 1.0
+    top = g.y0
+    bottom = g.y1
     for col in columns:
         y = y0
-        for node in col:
-            node.y0 = y
-            node.y1 = y + node.value * ky
-            y = node.y1 + node_padding
+        for i in col:
+            top[i] = y
+            bottom[i] = y + value[i] * ky
+            y = bottom[i] + node_padding
         # Centre each column vertically in the frame.
         if col:
-            used = col[-1].y1 - col[0].y0
+            used = bottom[col[-1]] - top[col[0]]
             shift = (y1 - y0 - used) / 2.0
             if shift > 0:
-                for node in col:
-                    node.y0 += shift
-                    node.y1 += shift
+                for i in col:
+                    top[i] += shift
+                    bottom[i] += shift
 
 
-def _target_top(source: SankeyNode, target: SankeyNode, node_padding: float) -> float:
-    """Ideal top for ``target`` so its ribbon from ``source`` lines up.
+def _set_link_widths(g: _Graph) -> None:
+    """Scale every link width to the tighter of its two endpoints' ratios.
+
+    Each node's height encodes ``value * ky``, so a link of value ``v`` at a
+    node of value ``V`` and pixel height ``H`` would be ``v / V * H`` wide.
+    A link is shared by two nodes whose ratios may differ; taking the smaller
+    keeps stacked link widths from overflowing either node, preserving the
+    flow-conservation invariant (per-node stacked widths sum to node height
+    when the node's own ratio is the binding one).
+
+    Relaxation moves nodes without resizing them, so this runs once.
+    """
+    ratio = [
+        (b - t) / v if v > 0 else 0.0 for t, b, v in zip(g.y0, g.y1, g.value)
+    ]
+    layer = g.layer
+    for k, (s, t, v) in enumerate(zip(g.src, g.tgt, g.link_value)):
+        g.width[k] = v * min(ratio[s], ratio[t])
+        g.weight[k] = v * (layer[t] - layer[s])
+
+
+def _level(values: list[float]) -> list[int]:
+    """Sort keys for positions: ``values`` in whole ``1 / LEVELS_PER_PX`` steps."""
+    return [round(v * LEVELS_PER_PX) for v in values]
+
+
+def _restack(
+    g: _Graph,
+    links: list[int],
+    by_id: tuple[int, ...],
+    other_end: list[int],
+    end_y0: list[int],
+    gaps: list[float],
+    runs: list[float],
+    node_padding: float,
+    force: bool = False,
+) -> None:
+    """Sort one node's links by the other end's y0 and refresh their offsets.
 
-    Mirrors d3's ``targetTop``: walk the source's outbound links (which are
-    sorted by target y) accumulating widths until we reach this link, then back
-    off the target's already-consumed inbound widths.
+    This is what keeps ribbons from crossing unnecessarily: at every node the
+    inbound links stack in the vertical order of their sources, and outbound in
+    the order of their targets. ``by_id`` holds the same links in id order and
+    ``end_y0`` each link's other-end y0, as levelled by :func:`_level`; a
+    stable sort of ``by_id`` leaves links at the same level in id order. The
+    offsets only depend on the order, so they are left alone when the sort
+    changes nothing (unless ``force``). Parallel links share the offset of the
+    first one in the stack, as d3's walk stops at the first match.
     """
-    y = source.y0 - (len(source.source_links) - 1) * node_padding / 2.0
-    for link in source.source_links:
-        if link.target is target:
-            break
-        y += link.width + node_padding
-    for link in target.target_links:
-        if link.source is source:
-            break
-        y -= link.width
-    return y
+    ordered = sorted(by_id, key=end_y0.__getitem__)
+    if ordered == links and not force:
+        return
+    links[:] = ordered
+    width = g.width
+    gap = run = 0.0
+    if len(set(map(other_end.__getitem__, links))) == len(links):
+        for k in links:
+            gaps[k] = gap
+            runs[k] = run
+            gap += width[k] + node_padding
+            run += width[k]
+        return
+    firsts: dict[int, tuple[float, float]] = {}
+    for k in links:
+        first = firsts.setdefault(other_end[k], (gap, run))
+        gaps[k], runs[k] = first
+        gap += width[k] + node_padding
+        run += width[k]
+
+
+def _restack_all(g: _Graph, node_padding: float) -> None:
+    """Sort every node's links and compute every offset."""
+    level = _level(g.y0)
+    tgt_y0 = [level[t] for t in g.tgt]
+    src_y0 = [level[s] for s in g.src]
+    for out, ids in zip(g.out_links, g.out_ids):
+        _restack(
+            g, out, ids, g.tgt, tgt_y0, g.out_gap, g.out_run, node_padding, True
+        )
+    for inbound, ids in zip(g.in_links, g.in_ids):
+        _restack(
+            g, inbound, ids, g.src, src_y0, g.in_gap, g.in_run, node_padding, True
+        )
 
 
-def _source_top(source: SankeyNode, target: SankeyNode, node_padding: float) -> float:
-    """Ideal top for ``source`` so its ribbon to ``target`` lines up (d3 sourceTop)."""
-    y = target.y0 - (len(target.target_links) - 1) * node_padding / 2.0
-    for link in target.target_links:
-        if link.source is source:
-            break
-        y += link.width + node_padding
-    for link in source.source_links:
-        if link.target is target:
-            break
-        y -= link.width
-    return y
+def _restack_around(g: _Graph, moved: list[int], node_padding: float) -> None:
+    """Restack the link lists that are ordered by a node in ``moved``."""
+    src, tgt = g.src, g.tgt
+    # A moved node reorders its sources' outbound and its targets' inbound.
+    sources: set[int] = set()
+    targets: set[int] = set()
+    for node in moved:
+        sources.update(src[k] for k in g.in_links[node])
+        targets.update(tgt[k] for k in g.out_links[node])
+    if not sources and not targets:
+        return
+    level = _level(g.y0)
+    if sources:
+        tgt_y0 = [level[t] for t in tgt]
+        for node in sources:
+            _restack(
+                g,
+                g.out_links[node],
+                g.out_ids[node],
+                tgt,
+                tgt_y0,
+                g.out_gap,
+                g.out_run,
+                node_padding,
+            )
+    if targets:
+        src_y0 = [level[s] for s in src]
+        for node in targets:
+            _restack(
+                g,
+                g.in_links[node],
+                g.in_ids[node],
+                src,
+                src_y0,
+                g.in_gap,
+                g.in_run,
+                node_padding,
+            )
 
 
 def _resolve_collisions(
-    col: list[SankeyNode],
+    g: _Graph,
+    col: list[int],
     y0: float,
     y1: float,
     node_padding: float,
@@ -300,90 +457,91 @@ def _resolve_collisions(
     """
     if not col:
         return
-    col.sort(key=lambda nd: nd.y0)
+    top = g.y0
+    bottom = g.y1
+    if len(col) > 1:
+        col.sort()
+        col.sort(key=lambda i: round(top[i] * LEVELS_PER_PX))
 
     # Top-to-bottom: separate overlaps and lift the first node to y0 if needed.
     y = y0
-    for node in col:
-        dy = y - node.y0
+    for i in col:
+        dy = y - top[i]
         if dy > 0:
-            node.y0 += dy
-            node.y1 += dy
-        y = node.y1 + node_padding
+            top[i] += dy
+            bottom[i] += dy
+        y = bottom[i] + node_padding
 
     # Bottom-to-top: pull the stack up so the last node clears y1.
     y = y1
-    for node in reversed(col):
-        dy = node.y1 - y
+    for i in reversed(col):
+        dy = bottom[i] - y
         if dy > 0:
-            node.y0 -= dy
-            node.y1 -= dy
-        y = node.y0 - node_padding
+            top[i] -= dy
+            bottom[i] -= dy
+        y = top[i] - node_padding
 
 
 def _relax_left_to_right(
-    columns: list[list[SankeyNode]], node_padding: float, alpha: float
+    g: _Graph, columns: list[list[int]], node_padding: float, alpha: float
 ) -> None:
+    """Move each node toward the ribbons arriving from its sources.
+
+    A source's ideal top for a target is d3's ``targetTop``: the source's top,
+    less half the padding spread of its outbound stack, plus the widths stacked
+    above the link at the source, minus those stacked above it at the target.
+    """
+    src, weight, top, bottom = g.src, g.weight, g.y0, g.y1
+    out_gap, in_run = g.out_gap, g.in_run
+    spread = [(len(out) - 1) * node_padding / 2.0 for out in g.out_links]
     for col in columns:
-        for target in col:
-            if not target.target_links:
+        for t in col:
+            inbound = g.in_links[t]
+            if not inbound:
                 continue
             y = 0.0
             w = 0.0
-            for link in target.target_links:
-                weight = link.value * (target.layer - link.source.layer)
-                y += _target_top(link.source, target, node_padding) * weight
-                w += weight
+            for k in inbound:
+                s = src[k]
+                target_top = top[s] - spread[s] + out_gap[k] - in_run[k]
+                y += target_top * weight[k]
+                w += weight[k]
             if w > 0:
-                dy = (y / w - target.y0) * alpha
-                target.y0 += dy
-                target.y1 += dy
+                dy = (y / w - top[t]) * alpha
+                top[t] += dy
+                bottom[t] += dy
 
 
 def _relax_right_to_left(
-    columns: list[list[SankeyNode]], node_padding: float, alpha: float
+    g: _Graph, columns: list[list[int]], node_padding: float, alpha: float
 ) -> None:
+    """Move each node toward the ribbons leaving for its targets (d3 sourceTop)."""
+    tgt, weight, top, bottom = g.tgt, g.weight, g.y0, g.y1
+    in_gap, out_run = g.in_gap, g.out_run
+    spread = [(len(inbound) - 1) * node_padding / 2.0 for inbound in g.in_links]
     for col in reversed(columns):
-        for source in col:
-            if not source.source_links:
+        for s in col:
+            out = g.out_links[s]
+            if not out:
                 continue
             y = 0.0
             w = 0.0
-            for link in source.source_links:
-                weight = link.value * (link.target.layer - source.layer)
-                y += _source_top(source, link.target, node_padding) * weight
-                w += weight
+            for k in out:
+                t = tgt[k]
+                source_top = top[t] - spread[t] + in_gap[k] - out_run[k]
+                y += source_top * weight[k]
+                w += weight[k]
             if w > 0:
-                dy = (y / w - source.y0) * alpha
-                source.y0 += dy
-                source.y1 += dy
-
+                dy = (y / w - top[s]) * alpha
+                top[s] += dy
+                bottom[s] += dy
 
-def _reorder_links(nodes: list[SankeyNode]) -> None:
-    """Sort each node's links by the y-position of the node at the other end.
 
-    This is what keeps ribbons from crossing unnecessarily: at every node the
-    inbound links stack in the vertical order of their sources, and outbound in
-    the order of their targets.
-    """
-    for node in nodes:
-        node.source_links.sort(key=lambda link: link.target.y0)
-        node.target_links.sort(key=lambda link: link.source.y0)
-
-
-def _compute_link_breadths(nodes: list[SankeyNode]) -> None:
-    """Assign each link its width and its y0/y1 centres, stacked at each node."""
-    for node in nodes:
-        # Stack outbound links down the source node's right edge.
-        y = node.y0
-        for link in node.source_links:
-            link.y0 = y + link.width / 2.0
-            y += link.width
-        # Stack inbound links down the target node's left edge.
-        y = node.y0
-        for link in node.target_links:
-            link.y1 = y + link.width / 2.0
-            y += link.width
+def _moved_since(g: _Graph, before: list[float]) -> tuple[list[int], float]:
+    """Nodes whose top changed since ``before``, and the largest move."""
+    moved = [i for i, (a, b) in enumerate(zip(before, g.y0)) if a != b]
+    shift = max((abs(g.y0[i] - before[i]) for i in moved), default=0.0)
+    return moved, shift
 
 
 def compute_layout(
@@ -398,6 +556,7 @@ def compute_layout(
     node_padding: float = DEFAULT_NODE_PADDING,
     iterations: int = DEFAULT_ITERATIONS,
     alignment: str = "justify",
+    tolerance: float = DEFAULT_TOLERANCE,
 ) -> SankeyLayout:
     """Lay out a Sankey diagram inside the rectangle (x0, y0)-(x1, y1).
 
@@ -407,8 +566,10 @@ def compute_layout(
         x0, y0, x1, y1: Drawing rectangle in pixels.
         node_width: Node rectangle width in pixels.
         node_padding: Minimum vertical gap between nodes in a column.
-        iterations: Relaxation passes (d3 default 6).
+        iterations: Maximum relaxation passes (d3 default 6).
         alignment: One of ``justify`` / ``left`` / ``right`` / ``center``.
+        tolerance: Stop relaxing once no node moves further than this many
+            pixels in a pass. ``0`` runs every pass, as d3 does.
 
     Returns:
         A :class:`SankeyLayout` with positioned nodes and links.
@@ -422,70 +583,128 @@ def compute_layout(
             f"Unknown Sankey alignment {alignment!r}; choose one of {list(ALIGNMENTS)}."
         )
 
-    nodes, links = _build_graph(node_names, raw_links)
-    _compute_node_values(nodes)
-    n_cols = _compute_node_depths(nodes)
-    _compute_node_heights(nodes)
-    n_used = _assign_layers(nodes, n_cols, alignment)
+    g = _build_graph(node_names, raw_links)
+    _compute_node_values(g)
+    order = _compute_node_depths(g)
+    n_cols = max(g.depth) + 1
+    _compute_node_heights(g, order)
+    n_used = _assign_layers(g, n_cols, alignment)
 
     # Horizontal positions: spread columns evenly across the frame.
     if n_used > 1:
         kx = (x1 - x0 - node_width) / (n_used - 1)
     else:
         kx = 0.0
-    for node in nodes:
-        node.x0 = x0 + node.layer * kx
-        node.x1 = node.x0 + node_width
-
-    columns = _columns(nodes, n_used)
-    _initialize_breadths(columns, y0, y1, node_padding)
+    g.x0 = [x0 + layer * kx for layer in g.layer]
 
-    # First link-width estimate so target/source-top can stack ribbons.
-    for link in links:
-        link.width = 0.0
-    _set_link_widths(columns, node_padding)
-    _reorder_links(nodes)
+    # Columns in deterministic vertical order: by original index.
+    columns: list[list[int]] = [[] for _ in range(n_used)]
+    for i, layer in enumerate(g.layer):
+        columns[layer].append(i)
+    _initialize_breadths(g, columns, y0, y1, node_padding)
+    _set_link_widths(g)
+    _restack_all(g, node_padding)
 
     # Iterative relaxation (alternating directions), d3-style alpha decay.
     for i in range(iterations):
         alpha = 0.99**i
-        _relax_right_to_left(columns, node_padding, alpha)
+        start = list(g.y0)
+        _relax_right_to_left(g, columns, node_padding, alpha)
         for col in columns:
-            _resolve_collisions(col, y0, y1, node_padding)
-        _reorder_links(nodes)
-        _set_link_widths(columns, node_padding)
+            _resolve_collisions(g, col, y0, y1, node_padding)
+        moved, _ = _moved_since(g, start)
+        _restack_around(g, moved, node_padding)
 
-        _relax_left_to_right(columns, node_padding, alpha)
+        half = list(g.y0)
+        _relax_left_to_right(g, columns, node_padding, alpha)
         for col in columns:
-            _resolve_collisions(col, y0, y1, node_padding)
-        _reorder_links(nodes)
-        _set_link_widths(columns, node_padding)
-
-    _compute_link_breadths(nodes)
-    return SankeyLayout(nodes=nodes, links=links)
+            _resolve_collisions(g, col, y0, y1, node_padding)
+        moved, _ = _moved_since(g, half)
+        _restack_around(g, moved, node_padding)
 
+        if _moved_since(g, start)[1] < tolerance:
+            break
 
-def _node_ratio(node: SankeyNode) -> float:
-    """Pixels of height per unit of flow value for this node."""
-    if node.value <= 0:
-        return 0.0
-    return (node.y1 - node.y0) / node.value
-
+    return _to_layout(g, node_names, node_width)
 
-def _set_link_widths(columns: list[list[SankeyNode]], node_padding: float) -> None:
-    """Scale every link width to the tighter of its two endpoints' ratios.
 
-    Each node's height encodes ``value * ky``, so a link of value ``v`` at a
-    node of value ``V`` and pixel height ``H`` would be ``v / V * H`` wide.
-    A link is shared by two nodes whose ratios may differ; taking the smaller
-    keeps stacked link widths from overflowing either node, preserving the
-    flow-conservation invariant (per-node stacked widths sum to node height
-    when the node's own ratio is the binding one).
+@functools.lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def cached_layout(
+    node_names: tuple[str, ...],
+    raw_links: tuple[tuple[int, int, float], ...],
+    *,
+    x0: float,
+    y0: float,
+    x1: float,
+    y1: float,
+    node_width: float = DEFAULT_NODE_WIDTH,
+    node_padding: float = DEFAULT_NODE_PADDING,
+    iterations: int = DEFAULT_ITERATIONS,
+    alignment: str = "justify",
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> SankeyLayout:
+    """:func:`compute_layout`, memoized on everything the layout depends on.
+
+    Takes the same arguments, with the node names and link triples as tuples
+    so they can key the cache. Charts that differ only in colours, title text
+    or theme (light and dark exports of one flow, say) get the same layout
+    object back instead of re-running the relaxation. The result is shared
+    between callers, so treat it as read-only. ``cached_layout.cache_clear()``
+    empties the cache.
     """
-    for col in columns:
-        for node in col:
-            ratio = _node_ratio(node)
-            for link in node.source_links:
-                src_ratio = ratio
-                tgt_ratio = _node_ratio(link.target)
-                link.width = link.value * min(src_ratio, tgt_ratio)
+    return compute_layout(
+        list(node_names),
+        list(raw_links),
+        x0=x0,
+        y0=y0,
+        x1=x1,
+        y1=y1,
+        node_width=node_width,
+        node_padding=node_padding,
+        iterations=iterations,
+        alignment=alignment,
+        tolerance=tolerance,
+    )
+
+
+def _to_layout(g: _Graph, node_names: list[str], node_width: float) -> SankeyLayout:
+    """Build the public node/link objects, stacking each node's ribbons."""
+    nodes = [
+        SankeyNode(
+            index=i,
+            name=name,
+            value=g.value[i],
+            depth=g.depth[i],
+            height=g.height[i],
+            layer=g.layer[i],
+            x0=g.x0[i],
+            x1=g.x0[i] + node_width,
+            y0=g.y0[i],
+            y1=g.y1[i],
+        )
+        for i, name in enumerate(node_names)
+    ]
+    links = [
+        SankeyLink(
+            source=nodes[s],
+            target=nodes[t],
+            value=v,
+            index=k,
+            width=g.width[k],
+        )
+        for k, (s, t, v) in enumerate(zip(g.src, g.tgt, g.link_value))
+    ]
+    for node in nodes:
+        node.source_links = [links[k] for k in g.out_links[node.index]]
+        node.target_links = [links[k] for k in g.in_links[node.index]]
+        # Stack outbound links down the source node's right edge.
+        y = node.y0
+        for link in node.source_links:
+            link.y0 = y + link.width / 2.0
+            y += link.width
+        # Stack inbound links down the target node's left edge.
+        y = node.y0
+        for link in node.target_links:
+            link.y1 = y + link.width / 2.0
+            y += link.width
+    return SankeyLayout(nodes=nodes, links=links)
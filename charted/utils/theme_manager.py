@@ -4,11 +4,17 @@ Extracted from Chart class to reduce coupling and improve testability.
 This module encapsulates all theme loading and merging logic.
 """
 
-from typing import TYPE_CHECKING
+import functools
+from collections.abc import Hashable, Mapping, Sequence
+from dataclasses import replace
+from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
     from charted.themes.core import Theme
 
+# Distinct resolved themes kept by the interning caches.
+THEME_CACHE_SIZE = 256
+
 
 class ThemeManager:
     """Handles theme loading, merging, and chart-type overrides.
@@ -16,6 +22,11 @@ class ThemeManager:
     Replaces theme loading logic scattered in Chart.__init__ with a
     focused component that manages theme configuration.
 
+    Resolved themes are interned: asking again for the same theme (preset or
+    registered name, dict, or the same ``Theme`` object) with the same
+    chart-type override and colours returns the same shared, immutable
+    ``Theme`` instead of composing and validating a new one.
+
     Attributes:
         None (stateless utility class)
 
@@ -28,6 +39,7 @@ class ThemeManager:
     def load_theme(
         theme: "Theme | str | dict[str, object] | None",
         chart_type: str | None = None,
+        colors: Sequence[str] | None = None,
     ) -> "Theme":
         """Load base theme and apply chart-type overrides.
 
@@ -35,6 +47,7 @@ class ThemeManager:
             theme: Base theme to start with (Theme object, preset name string,
                    dict of properties, or None).
             chart_type: Chart type for applying overrides (e.g., 'bar', 'line').
+            colors: Optional palette replacing the resolved theme's colours.
 
         Returns:
             Merged theme configuration with chart-type overrides applied.
@@ -51,33 +64,159 @@ class ThemeManager:
         from charted.config import get_chart_theme, load_config
         from charted.themes.core import Theme
 
-        # Resolve theme to Theme object
         if isinstance(theme, str):
-            # Treat as preset name or registered theme name
+            # Preset or registered name. Both resolve to a shared instance, so
+            # the caches below key on that object and re-registering a name
+            # never serves a stale theme.
+            name: str = theme
             try:
-                base_theme = Theme.from_preset(theme)
+                theme = Theme.from_preset(name)
             except ValueError:
-                from charted.themes.registry import get_theme
-
-                base_theme = get_theme(theme)
-        elif theme is None:
-            base_theme = Theme()
-        elif isinstance(theme, dict):
-            # Backward compatibility: convert dict to Theme
-            base_theme = _dict_to_theme(theme)
-        else:
-            base_theme = theme
+                from charted.themes.registry import _registered_themes, get_theme
 
-        # Apply chart-type overrides if available
+                theme = _registered_themes.get(name) or get_theme(name)
+
+        chart_override = None
         if chart_type:
-            config = load_config()
-            chart_override = get_chart_theme(config, chart_type)
-            if chart_override:
-                override_theme = _dict_to_theme(chart_override)
-                # Merge: chart override takes precedence over base theme
-                base_theme = base_theme.compose(override_theme)
-
-        return base_theme
+            chart_override = get_chart_theme(load_config(), chart_type)
+        if isinstance(theme, Theme) and not chart_override and not colors:
+            return theme
+        try:
+            key = (_freeze(theme), _freeze(chart_override), _freeze(colors or None))
+        except TypeError:
+            # An unhashable value somewhere in the input: resolve uncached.
+            return _resolve(theme, chart_override, colors)
+        return _resolve_interned(*key)
+
+    @staticmethod
+    def apply_overrides(theme: "Theme", overrides: Mapping[str, object]) -> "Theme":
+        """``theme.compose(Theme(**overrides))``, interned like :meth:`load_theme`.
+
+        Args:
+            theme: Theme to layer the overrides onto.
+            overrides: Theme field values, as passed to ``Chart.style()``.
+
+        Returns:
+            The composed theme, shared with earlier identical requests.
+        """
+        try:
+            frozen = _freeze(dict(overrides))
+        except TypeError:
+            return _compose(theme, overrides)
+        return _compose_interned(_Same(theme), frozen)
+
+
+class _Same:
+    """Cache-key wrapper that matches a ``Theme`` by identity, not equality.
+
+    Equal themes can still differ in ways equality ignores (``16`` vs ``16.0``
+    font sizes, which fields were explicitly set), so the interning caches key
+    a caller's own ``Theme`` objects by identity. Holding the reference keeps
+    the id from being reused while the entry lives.
+    """
+
+    __slots__ = ("theme",)
+
+    def __init__(self, theme: "Theme") -> None:
+        self.theme = theme
+
+    def __hash__(self) -> int:
+        return id(self.theme)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Same) and other.theme is self.theme
+
+
+# A frozen theme input: a ``_Same`` or nested (type, value) tuples standing in
+# for dicts, lists and scalars.
+_Frozen = Hashable
+
+
+def _freeze(value: object) -> _Frozen:
+    """A hashable stand-in for a theme input; raises TypeError if impossible.
+
+    Scalars are tagged with their type so ``12`` and ``12.0`` (which render
+    differently) never share an entry.
+    """
+    from charted.themes.core import Theme
+
+    if isinstance(value, Theme):
+        return _Same(value)
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze(v) for v in value))
+    hash(value)
+    return (type(value), value)
+
+
+def _thaw(value: _Frozen) -> object:
+    """Rebuild the input that :func:`_freeze` froze."""
+    if isinstance(value, _Same):
+        return value.theme
+    kind, payload = cast("tuple[type, object]", value)
+    if kind is dict:
+        items = cast("tuple[tuple[str, _Frozen], ...]", payload)
+        return {k: _thaw(v) for k, v in items}
+    if kind is list:
+        return [_thaw(v) for v in cast("tuple[_Frozen, ...]", payload)]
+    return payload
+
+
+@functools.lru_cache(maxsize=THEME_CACHE_SIZE)
+def _resolve_interned(
+    theme: _Frozen, chart_override: _Frozen, colors: _Frozen
+) -> "Theme":
+    return _resolve(
+        cast("Theme | dict[str, object] | None", _thaw(theme)),
+        cast("dict[str, object] | None", _thaw(chart_override)),
+        cast("list[str] | None", _thaw(colors)),
+    )
+
+
+@functools.lru_cache(maxsize=THEME_CACHE_SIZE)
+def _compose_interned(theme: _Same, overrides: _Frozen) -> "Theme":
+    return _compose(theme.theme, cast("dict[str, object]", _thaw(overrides)))
+
+
+def _resolve(
+    theme: "Theme | dict[str, object] | None",
+    chart_override: dict[str, object] | None,
+    colors: Sequence[str] | None,
+) -> "Theme":
+    """Build the theme :meth:`ThemeManager.load_theme` returns, uncached."""
+    from charted.themes.core import Theme
+
+    # Resolve theme to Theme object
+    if theme is None:
+        base_theme = Theme()
+    elif isinstance(theme, dict):
+        # Backward compatibility: convert dict to Theme
+        base_theme = _dict_to_theme(theme)
+    else:
+        base_theme = theme
+
+    # Apply chart-type overrides if available
+    if chart_override:
+        override_theme = _dict_to_theme(chart_override)
+        # Merge: chart override takes precedence over base theme
+        base_theme = base_theme.compose(override_theme)
+
+    # Apply color shorthand: override theme colors if provided
+    if colors:
+        base_theme = replace(base_theme, colors=list(colors))
+
+    return base_theme
+
+
+def _compose(theme: "Theme", overrides: Mapping[str, object]) -> "Theme":
+    """Compose ``overrides`` onto ``theme``, uncached."""
+    from charted.themes.core import Theme
+
+    # Theme's runtime ``__init__`` takes arbitrary keyword overrides (it
+    # replaces the dataclass-synthesised one), so the heterogeneous override
+    # mapping is splatted in directly.
+    return theme.compose(Theme(**overrides))  # type: ignore[arg-type]
 
 
 def _dict_to_theme(data: dict[str, object]) -> "Theme":
@@ -118,11 +118,13 @@ class CharMetrics(TypedDict):
     """Width and height of a single glyph at a given font size.
 
     The generator (:func:`charted.fonts.utils.create_font_definition`) writes
-    integer pixel metrics from tkinter, so every definition file holds ints.
+    pixel metrics from tkinter. Older definition files hold ints, newer ones
+    fractional advances, and some mix both; loaders keep whichever type the
+    file stored.
     """
 
-    width: int
-    height: int
+    width: float
+    height: float
 
 
 # A loaded font-definition JSON file (``charted/fonts/definitions/*.json``).
@@ -0,0 +1,161 @@
+"""Array-at-a-time projection and stacking for chart construction.
+
+``Chart.__init__`` used to project every value with a scalar
+``Axis.reproject`` call, which re-derives the plot size (and so the whole
+padding/layout chain) per point. These helpers take the axis constants once
+and map a whole series. When NumPy is importable the maths runs on float64
+arrays; otherwise an equivalent pure-Python loop is used. Both perform the
+same IEEE operations in the same order as the scalar path, so coordinates
+are bit-identical whichever engine runs.
+
+NumPy stays optional: it is never a dependency of the core library. Set the
+``CHARTED_NO_NUMPY`` environment variable to force the pure-Python path.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Sequence
+from typing import cast
+
+from charted.utils.types import Vector, Vector2D
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - exercised only without numpy
+    HAS_NUMPY = False
+
+# Below this many values NumPy's per-call overhead outweighs the loop it saves.
+NUMPY_MIN_SIZE = 256
+
+
+def numpy_enabled() -> bool:
+    """True when the NumPy engine is importable and not disabled."""
+    return HAS_NUMPY and not os.environ.get("CHARTED_NO_NUMPY")
+
+
+def _use_numpy(size: int) -> bool:
+    return size >= NUMPY_MIN_SIZE and numpy_enabled()
+
+
+def project_linear(
+    values: Sequence[float],
+    min_value: float,
+    max_value: float,
+    length: float,
+    stacked: bool = False,
+    mirror_negative: bool = False,
+) -> Vector:
+    """Map ``values`` onto ``[0, length]`` like ``Axis._reproject``.
+
+    Args:
+        values: Data values.
+        min_value: Axis domain minimum.
+        max_value: Axis domain maximum.
+        length: Pixel extent of the axis.
+        stacked: Project as a stacked magnitude (``value / range``) rather
+            than an offset from ``min_value``.
+        mirror_negative: Project ``abs(value)`` and negate the pixel result
+            for negative values, as stacked bars and columns do.
+    """
+    value_range = max_value - min_value
+    if value_range == 0:
+        return [0.0] * len(values)
+
+    if _use_numpy(len(values)):
+        data = np.asarray(values, dtype=np.float64)
+        source = np.abs(data) if mirror_negative else data
+        if stacked:
+            projected = source / value_range * length
+        else:
+            projected = (source - min_value) / value_range * length
+        if mirror_negative:
+            projected = np.where(data < 0, -projected, projected)
+        return cast("Vector", projected.tolist())
+
+    out: Vector = []
+    append = out.append
+    for value in values:
+        magnitude = abs(value) if mirror_negative else value
+        if stacked:
+            pixel = magnitude / value_range * length
+        else:
+            pixel = (magnitude - min_value) / value_range * length
+        if mirror_negative and value < 0:
+            pixel = -pixel
+        append(pixel)
+    return out
+
+
+def project_log(
+    values: Sequence[float], min_value: float, max_value: float, length: float
+) -> Vector:
+    """Map strictly positive ``values`` onto ``[0, length]`` like ``LogScale``.
+
+    Raises:
+        ValueError: If any value is not positive (same as ``LogScale``).
+    """
+    log_min = math.log10(min_value)
+    log_max = math.log10(max_value)
+    for value in values:
+        if value <= 0:
+            raise ValueError(
+                f"LogScale cannot map non-positive value {value}; "
+                f"all data must be > 0 for a log scale."
+            )
+    log_range = log_max - log_min
+    if log_range == 0:
+        return [0.0] * len(values)
+
+    # math.log10 rather than np.log10: NumPy's SIMD log can differ in the last
+    # ulp, and the scalar path is what every other coordinate is checked
+    # against.
+    logs = list(map(math.log10, values))
+    if _use_numpy(len(values)):
+        projected = (np.asarray(logs, dtype=np.float64) - log_min) / log_range * length
+        return cast("Vector", projected.tolist())
+    return [(value - log_min) / log_range * length for value in logs]
+
+
+def stack_offsets(rows: Vector2D) -> Vector2D:
+    """Cumulative stacking offsets for equal-length series.
+
+    Positive values stack upward from the running positive total and negative
+    values downward from the running negative total, column by column, in
+    series order. Matches the per-element loop ``Chart.__init__`` used.
+    """
+    if not rows:
+        return []
+    count = max(len(row) for row in rows)
+
+    if _use_numpy(count * len(rows)) and all(len(row) == count for row in rows):
+        data = np.asarray(rows, dtype=np.float64)
+        positive = np.where(data >= 0, data, 0.0)
+        negative = np.where(data < 0, data, 0.0)
+        pos_offsets = np.zeros_like(data)
+        neg_offsets = np.zeros_like(data)
+        # Exclusive running totals; cumsum adds sequentially, like the loop.
+        pos_offsets[1:] = np.cumsum(positive, axis=0)[:-1]
+        neg_offsets[1:] = np.cumsum(negative, axis=0)[:-1]
+        offsets = np.where(data >= 0, pos_offsets, np.where(data < 0, neg_offsets, 0.0))
+        return cast("Vector2D", offsets.tolist())
+
+    positive_totals = [0.0] * count
+    negative_totals = [0.0] * count
+    result: Vector2D = []
+    for row in rows:
+        row_offsets: Vector = []
+        for i, value in enumerate(row):
+            current = 0.0
+            if value >= 0:
+                current = positive_totals[i]
+                positive_totals[i] += value
+            elif value < 0:
+                current = negative_totals[i]
+                negative_totals[i] -= abs(value)
+            row_offsets.append(current)
+        result.append(row_offsets)
+    return result
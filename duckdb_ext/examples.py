@@ -171,6 +171,15 @@ def main():
     """).fetchone()
     print(f"  SQL UDF SVG:     {len(result[0])} bytes")
 
+    # One chart per group from list aggregates
+    rows = con.execute("""
+        SELECT right(quarter, 4) AS year,
+               charted_svg(list(quarter), list(revenue), title := 'Revenue ' || year)
+        FROM sales GROUP BY year ORDER BY year
+    """).fetchall()
+    for year, svg in rows:
+        print(f"  SQL list {year}:   {len(svg)} bytes")
+
     # --- Validate outputs ---
     print("\n=== Validation ===\n")
     svg_files = sorted(output_dir.glob("*.svg"))
@@ -1,7 +1,8 @@
 -- DuckDB + Charted Extension: SQL UDF Examples
 --
--- These examples use charted_from_arrays() and charted_svg_from_arrays()
--- which are registered as SQL UDFs. They accept JSON-encoded arrays.
+-- charted_svg() / charted_save() take LIST arguments built with list(), so a
+-- GROUP BY query renders one chart per group. charted_from_arrays() and
+-- charted_svg_from_arrays() accept JSON-encoded arrays instead.
 --
 -- For the simpler query-based workflow, use the Python API directly:
 --   from charted.duckdb_ext.extension import charted_query
@@ -53,3 +54,20 @@ SELECT charted_from_arrays(
     '2024 Profit Distribution',
     '/tmp/sql_pie.svg'
 );
+
+-- One SVG per year from list aggregates (no JSON round trip)
+SELECT
+    right(quarter, 4) AS year,
+    charted_svg(list(quarter), list(revenue), title := 'Revenue ' || year) AS svg
+FROM sales
+GROUP BY year
+ORDER BY year;
+
+-- Multi-series from lists, written to disk
+SELECT charted_save_series(
+    list(quarter),
+    [list(revenue), list(costs)],
+    '/tmp/sql_list_column.svg',
+    chart_type := 'column',
+    title := 'Revenue & Costs'
+) FROM sales;
@@ -5,10 +5,12 @@ Registers Python UDFs that let users generate SVG charts directly from SQL.
 Two usage patterns:
 
 1. Python-driven (recommended): Use charted_query() helper which handles
-   query execution and chart generation in one call.
+   query execution and chart generation in one call, or
+   charted_query_grouped() for one chart per group from a single query.
 
-2. SQL-driven: Use charted_from_columns() UDF which takes pre-extracted
-   column data as arrays.
+2. SQL-driven: Use the charted_svg() / charted_save() SQL functions, which
+   take LIST arguments built with list() aggregates, so one query can render
+   a chart per group.
 
 Usage:
     import duckdb
@@ -21,16 +23,21 @@ Usage:
     charted_query(con, 'SELECT quarter, revenue FROM sales',
                   chart_type='bar', title='Sales', output='/tmp/chart.svg')
 
-    # Or from SQL using array aggregation:
-    SELECT charted_from_arrays(
-        list(quarter), list(revenue), 'bar', 'Sales', '/tmp/chart.svg'
-    ) FROM sales;
+    # Or from SQL using list aggregation, one chart per region:
+    SELECT region, charted_svg(list(quarter), list(revenue), title := 'Sales')
+    FROM sales GROUP BY region;
 """
 
 from __future__ import annotations
 
+import importlib.util
 import inspect
 import json
+import os
+import re
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from types import ModuleType
 from typing import TYPE_CHECKING, Optional
@@ -116,6 +123,115 @@ def _extract_chart_data_from_result(columns, rows):
     return labels, data, series_names
 
 
+# Chart types whose constructors take NumPy arrays as-is (zero-copy views, see
+# charted.utils.buffers); the others are given plain lists.
+_ARRAY_CHART_TYPES = {"bar", "column", "line", "scatter", "area", "histogram"}
+
+
+def _extract_chart_data_from_columns(columns, arrays, timezone=None):
+    """Columnar counterpart of ``_extract_chart_data_from_result``.
+
+    Takes the ``fetchnumpy()`` mapping of column name to array. Numeric
+    columns become float64 arrays (a view, for DOUBLE columns) with NULLs
+    filled as 0.0, matching the row path; the first other column becomes the
+    labels. ``timezone`` is the session time zone, used to label
+    TIMESTAMPTZ columns the way ``fetchall()`` does (UTC when omitted).
+    """
+    import numpy as np
+
+    names = [c[0] for c in columns]
+    if not len(arrays[names[0]]):
+        raise ValueError("Query returned no rows")
+
+    label_col_idx = None
+    numeric_col_indices = []
+    for i, name in enumerate(names):
+        if arrays[name].dtype.kind in "iuf":
+            numeric_col_indices.append(i)
+        elif label_col_idx is None:
+            label_col_idx = i
+
+    if not numeric_col_indices:
+        raise ValueError(
+            f"Query must return at least one numeric column. Got columns: {names}"
+        )
+
+    labels = None
+    if label_col_idx is not None:
+        column = arrays[names[label_col_idx]]
+        if column.dtype.kind == "M":
+            labels = _temporal_labels(
+                column, str(columns[label_col_idx][1]), timezone
+            )
+        else:
+            labels = [str(v) for v in column.tolist()]
+
+    data = []
+    series_names = []
+    for idx in numeric_col_indices:
+        column = arrays[names[idx]]
+        if isinstance(column, np.ma.MaskedArray):
+            series = column.astype(np.float64).filled(0.0)
+        else:
+            series = np.asarray(column, dtype=np.float64)
+        data.append(series)
+        series_names.append(names[idx])
+
+    return labels, data, series_names
+
+
+def _temporal_labels(column, type_name, timezone):
+    """Label strings for a datetime64 column, as ``fetchall()`` renders them.
+
+    fetchnumpy() widens DATE to datetime64, keeps TIMESTAMP_NS at nanosecond
+    resolution (whose ``tolist()`` is epoch integers) and returns TIMESTAMPTZ
+    as naive UTC. Going through microsecond datetimes restores the row path's
+    ``str(date)`` / ``str(datetime)`` forms; NULL and NaT stay ``"None"``.
+    """
+    from datetime import timezone as dt_timezone
+
+    values = column.astype("datetime64[us]").tolist()
+    if type_name == "DATE":
+        values = [v.date() if v is not None else v for v in values]
+    elif type_name == "TIMESTAMP WITH TIME ZONE":
+        from zoneinfo import ZoneInfo
+
+        zone = ZoneInfo(timezone) if timezone else dt_timezone.utc
+        values = [
+            v.replace(tzinfo=dt_timezone.utc).astimezone(zone)
+            if v is not None
+            else v
+            for v in values
+        ]
+    return [str(v) for v in values]
+
+
+def _fetch_chart_data(con, query):
+    """Run ``query`` and extract ``(labels, data, series_names)``.
+
+    Fetches column-wise with ``fetchnumpy()`` so large results skip the
+    per-row tuple round trip. Without NumPy, or when column names repeat
+    (the column mapping would drop one), falls back to ``fetchall()``.
+    """
+    result = con.execute(query)
+    columns = result.description
+    names = [c[0] for c in columns]
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        numpy_available = False
+    else:
+        numpy_available = True
+    if not numpy_available or len(set(names)) != len(names):
+        return _extract_chart_data_from_result(columns, result.fetchall())
+    arrays = result.fetchnumpy()
+    timezone = None
+    if any(str(c[1]) == "TIMESTAMP WITH TIME ZONE" for c in columns):
+        # Asked only after the fetch: executing on ``con`` ends ``result``.
+        timezone = con.execute("SELECT current_setting('TimeZone')").fetchone()[0]
+    return _extract_chart_data_from_columns(columns, arrays, timezone)
+
+
 def _build_chart(
     chart_type: str,
     labels,
@@ -135,12 +251,18 @@ def _build_chart(
     # Special handling for chart types with different data expectations
     chart_type_lower = chart_type.lower()
 
+    if chart_type_lower not in _ARRAY_CHART_TYPES:
+        data = [s.tolist() if hasattr(s, "tolist") else s for s in data]
+
     # Histogram expects a flat list of raw values
     if chart_type_lower == "histogram":
-        # Concatenate all numeric series into one flat list
-        chart_data = []
-        for series in data:
-            chart_data.extend(series)
+        if len(data) == 1:
+            chart_data = data[0]
+        else:
+            # Concatenate all numeric series into one flat list
+            chart_data = []
+            for series in data:
+                chart_data.extend(series)
         series_names_arg = None
     # BoxPlot expects Vector2D: each inner list is one distribution
     elif chart_type_lower == "box":
@@ -251,11 +373,7 @@ def charted_query(
         >>> charted_query(con, 'SELECT name, value FROM data', title='My Chart')
         '/tmp/chart.svg'
     """
-    result = con.execute(query)
-    columns = result.description
-    rows = result.fetchall()
-
-    labels, data, series_names = _extract_chart_data_from_result(columns, rows)
+    labels, data, series_names = _fetch_chart_data(con, query)
     chart = _build_chart(
         chart_type, labels, data, series_names, title, width, height, theme
     )
@@ -278,83 +396,402 @@ def charted_svg(
 
     Same as charted_query but returns the SVG content instead of saving to disk.
     """
-    result = con.execute(query)
-    columns = result.description
-    rows = result.fetchall()
-
-    labels, data, series_names = _extract_chart_data_from_result(columns, rows)
+    labels, data, series_names = _fetch_chart_data(con, query)
     chart = _build_chart(
         chart_type, labels, data, series_names, title, width, height, theme
     )
     return chart.to_svg()
 
 
+# Rows fetched per fetchmany() call while streaming grouped results.
+GROUP_FETCH_SIZE = 10_000
+
+# Prefix of the temporary table charted_query_grouped() stages results in.
+_STAGED_TABLE_PREFIX = "__charted_grouped_"
+
+
+def charted_query_grouped(
+    con: duckdb.DuckDBPyConnection,
+    query: str,
+    group_by: str,
+    chart_type: str = "bar",
+    title: str = None,
+    output_dir: str = None,
+    table: str = None,
+    width: float = None,
+    height: float = None,
+    theme: str = None,
+    jobs: Optional[int] = 1,
+):
+    """Render one chart per group of a SQL query's result.
+
+    The query runs once. Its result is streamed ordered by ``group_by``
+    (rows keep the query's order within a group), and a chart is built from
+    each group's rows as soon as the group is complete, using the same
+    label/series heuristic as charted_query(). The group column itself is
+    not charted.
+
+    Args:
+        con: DuckDB connection with the data.
+        query: SQL query returning the group column, labels and numeric columns.
+        group_by: Name of the column to partition by.
+        chart_type: Chart type, as for charted_query().
+        title: Chart title; ``{group}`` is replaced by the group value.
+        output_dir: Directory to write ``<group>.svg`` files to.
+        table: Name of a table to (re)create with ``("group", svg)`` rows.
+        width: Chart width in pixels.
+        height: Chart height in pixels.
+        theme: Theme name.
+        jobs: Worker processes rendering charts in parallel; ``None`` uses
+            the CPU count. With 1 (the default) charts render in-process.
+
+    Returns:
+        The SVG file paths in group order when writing to ``output_dir``, or
+        the table name when writing to ``table``.
+
+    Raises:
+        ValueError: If ``group_by`` is not a column of the query's result, or
+            the output options are inconsistent.
+
+    Example:
+        >>> charted_query_grouped(
+        ...     con,
+        ...     'SELECT customer, month, spend FROM orders ORDER BY month',
+        ...     group_by='customer', chart_type='line',
+        ...     title='Spend: {group}', output_dir='/tmp/customers')
+    """
+    if (output_dir is None) == (table is None):
+        raise ValueError("Specify exactly one of output_dir or table")
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs < 1:
+        raise ValueError("jobs must be at least 1")
+
+    # Stage the result once. CREATE TABLE AS keeps the query's row order
+    # (DuckDB's preserve_insertion_order), so ``rowid`` orders rows within a
+    # group explicitly; a window ``row_number() OVER ()`` has no guaranteed
+    # order.
+    staged = _quote_identifier(f"{_STAGED_TABLE_PREFIX}{uuid.uuid4().hex}")
+    con.execute(f"CREATE TEMP TABLE {staged} AS {query}\n")
+    try:
+        columns = con.execute(f"SELECT * FROM {staged} LIMIT 0").description
+        names = [c[0] for c in columns]
+        if group_by not in names:
+            raise ValueError(
+                f"group_by column {group_by!r} is not in the query result. "
+                f"Columns: {names}"
+            )
+        result = con.execute(
+            f"SELECT * FROM {staged} ORDER BY {_quote_identifier(group_by)}, rowid"
+        )
+        return _write_groups(
+            con,
+            result,
+            columns,
+            names.index(group_by),
+            chart_type=chart_type,
+            title=title,
+            output_dir=output_dir,
+            table=table,
+            width=width,
+            height=height,
+            theme=theme,
+            jobs=jobs,
+        )
+    finally:
+        con.execute(f"DROP TABLE IF EXISTS {staged}")
+
+
+def _write_groups(
+    con,
+    result,
+    columns,
+    group_idx: int,
+    *,
+    chart_type,
+    title,
+    output_dir,
+    table,
+    width,
+    height,
+    theme,
+    jobs: int,
+):
+    """Render the groups of an ordered ``result`` for charted_query_grouped()."""
+    keep = [i for i in range(len(columns)) if i != group_idx]
+    chart_columns = [columns[i] for i in keep]
+
+    def tasks():
+        for key, rows in _iter_groups(result, group_idx):
+            rows = [tuple(row[i] for i in keep) for row in rows]
+            labels, data, series_names = _extract_chart_data_from_result(
+                chart_columns, rows
+            )
+            group_title = title.replace("{group}", str(key)) if title else None
+            yield key, (
+                chart_type,
+                labels,
+                data,
+                series_names,
+                group_title,
+                width,
+                height,
+                theme,
+            )
+
+    if output_dir is not None:
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        used = set()
+        paths = []
+        for key, svg in _render_groups(tasks(), jobs):
+            path = out / _group_filename(key, used)
+            path.write_text(svg, encoding="utf-8")
+            paths.append(str(path))
+        return paths
+
+    # Written through a second connection: executing on ``con`` would end
+    # the result being streamed.
+    writer = con.cursor()
+    group_type = columns[group_idx][1]
+    writer.execute(
+        f'CREATE OR REPLACE TABLE {_quote_identifier(table)} ("group" {group_type}, '
+        "svg VARCHAR)"
+    )
+    insert = f"INSERT INTO {_quote_identifier(table)} VALUES (?, ?)"
+    batch = []
+    for row in _render_groups(tasks(), jobs):
+        batch.append(row)
+        if len(batch) >= 1000:
+            writer.executemany(insert, batch)
+            batch = []
+    if batch:
+        writer.executemany(insert, batch)
+    writer.close()
+    return table
+
+
+def _iter_groups(result, group_idx: int):
+    """Yield ``(key, rows)`` for consecutive runs of equal group keys."""
+    key = None
+    rows = []
+    while True:
+        chunk = result.fetchmany(GROUP_FETCH_SIZE)
+        if not chunk:
+            break
+        for row in chunk:
+            if rows and row[group_idx] != key:
+                yield key, rows
+                rows = []
+            key = row[group_idx]
+            rows.append(row)
+    if rows:
+        yield key, rows
+
+
+def _render_group(args) -> str:
+    return _build_chart(*args).to_svg()
+
+
+def _render_groups(tasks, jobs: int):
+    """Yield ``(key, svg)`` for each ``(key, chart args)`` task, in order.
+
+    With several jobs, at most a few tasks per worker are in flight, so a
+    long result is never held in memory whole.
+    """
+    if jobs == 1:
+        for key, args in tasks:
+            yield key, _render_group(args)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for key, args in tasks:
+            pending.append((key, executor.submit(_render_group, args)))
+            if len(pending) >= jobs * 4:
+                key, future = pending.popleft()
+                yield key, future.result()
+        while pending:
+            key, future = pending.popleft()
+            yield key, future.result()
+
+
+def _group_filename(key, used: set) -> str:
+    """A unique, filesystem-safe ``.svg`` name for a group key."""
+    stem = re.sub(r"[^\w.-]+", "_", str(key)).strip("._") or "group"
+    name = f"{stem}.svg"
+    n = 2
+    while name in used:
+        name = f"{stem}-{n}.svg"
+        n += 1
+    used.add(name)
+    return name
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
 # =============================================================================
 # SQL UDFs: work with pre-aggregated array data passed from SQL
 # =============================================================================
 
 
-def _charted_from_arrays_impl(
-    labels_json: str, data_json: str, chart_type: str, title: str, output: str
-) -> str:
-    """UDF implementation: takes JSON-encoded labels and data arrays."""
-    labels = json.loads(labels_json) if labels_json else None
-    data_raw = json.loads(data_json)
-
-    # data_raw is either a single list or list-of-lists
-    if data_raw and isinstance(data_raw[0], list):
-        data = data_raw
-        series_names = [f"series_{i + 1}" for i in range(len(data))]
-    else:
-        data = [data_raw]
+def _build_series_chart(labels, data, chart_type, title):
+    """Build a chart from UDF arguments: optional labels and a list of series."""
+    if len(data) == 1:
         series_names = ["value"]
+    else:
+        series_names = [f"series_{i + 1}" for i in range(len(data))]
+    return _build_chart(
+        chart_type if chart_type else "bar",
+        labels,
+        data,
+        series_names,
+        title if title else None,
+    )
 
-    ct = chart_type if chart_type else "bar"
-    t = title if title else None
-    o = output if output else "/tmp/chart.svg"
 
-    chart = _build_chart(ct, labels, data, series_names, t)
+def _save_chart(chart, output: str) -> str:
+    o = output if output else "/tmp/chart.svg"
     Path(o).parent.mkdir(parents=True, exist_ok=True)
     chart.save(o)
     return o
 
 
+def _parse_json_arrays(labels_json: str, data_json: str):
+    labels = json.loads(labels_json) if labels_json else None
+    data_raw = json.loads(data_json)
+    # data_raw is either a single list or list-of-lists
+    if data_raw and isinstance(data_raw[0], list):
+        return labels, data_raw
+    return labels, [data_raw]
+
+
+def _charted_from_arrays_impl(
+    labels_json: str, data_json: str, chart_type: str, title: str, output: str
+) -> str:
+    """UDF implementation: takes JSON-encoded labels and data arrays."""
+    labels, data = _parse_json_arrays(labels_json, data_json)
+    chart = _build_series_chart(labels, data, chart_type, title)
+    return _save_chart(chart, output)
+
+
 def _charted_svg_from_arrays_impl(
     labels_json: str, data_json: str, chart_type: str, title: str
 ) -> str:
     """UDF implementation: returns SVG string from JSON-encoded arrays."""
-    labels = json.loads(labels_json) if labels_json else None
-    data_raw = json.loads(data_json)
+    labels, data = _parse_json_arrays(labels_json, data_json)
+    return _build_series_chart(labels, data, chart_type, title).to_svg()
 
-    if data_raw and isinstance(data_raw[0], list):
-        data = data_raw
-        series_names = [f"series_{i + 1}" for i in range(len(data))]
-    else:
-        data = [data_raw]
-        series_names = ["value"]
 
-    ct = chart_type if chart_type else "bar"
-    t = title if title else None
+def _list_arguments(labels, series):
+    """Normalize LIST arguments: NULL elements chart as 0, like query results.
+
+    A NULL series (rather than a NULL inside one) makes the result NULL.
+    """
+    if labels is not None:
+        labels = [str(v) for v in labels]
+    data = [[0.0 if v is None else v for v in s] for s in series]
+    return labels, data
+
+
+def _charted_svg_lists_impl(labels, series, chart_type, title):
+    """UDF implementation: SVG string from VARCHAR[] labels and DOUBLE[][] series.
+
+    Called once per row, with the lists already converted to Python lists.
+    """
+    if series is None or None in series:
+        return None
+    labels, data = _list_arguments(labels, series)
+    return _build_series_chart(labels, data, chart_type, title).to_svg()
+
+
+def _charted_save_lists_impl(labels, series, chart_type, title, output):
+    """UDF implementation: write the chart for list arguments, return the path."""
+    if series is None or None in series:
+        return None
+    labels, data = _list_arguments(labels, series)
+    chart = _build_series_chart(labels, data, chart_type, title)
+    return _save_chart(chart, output)
 
-    chart = _build_chart(ct, labels, data, series_names, t)
-    return chart.to_svg()
+
+def _charted_svg_arrow_impl(labels, series, chart_type, title):
+    """Vectorized UDF implementation over Arrow arrays.
+
+    DuckDB calls this once per data chunk (up to 2048 rows, e.g. one per
+    GROUP BY group) instead of once per row. Each series reaches the chart
+    as a float64 NumPy view of the Arrow buffer rather than a Python list.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    label_rows = labels.to_pylist()
+    chart_types = chart_type.to_pylist()
+    titles = title.to_pylist()
+
+    svgs = []
+    for i, row in enumerate(series):
+        if not row.is_valid or not all(s.is_valid for s in row.values):
+            svgs.append(None)
+            continue
+        data = [pc.fill_null(s.values, 0.0).to_numpy() for s in row.values]
+        row_labels = label_rows[i]
+        if row_labels is not None:
+            row_labels = [str(v) for v in row_labels]
+        chart = _build_series_chart(row_labels, data, chart_types[i], titles[i])
+        svgs.append(chart.to_svg())
+    return pa.array(svgs, type=pa.string())
+
+
+# SQL macros giving the list-typed UDFs optional arguments and a single-series
+# form; DuckDB UDFs themselves have a fixed arity and cannot be overloaded.
+_SQL_MACROS = (
+    """CREATE OR REPLACE TEMP MACRO charted_svg(
+        labels, "values", chart_type := 'bar', title := NULL
+    ) AS charted_svg_lists(labels, ["values"], chart_type, title)""",
+    """CREATE OR REPLACE TEMP MACRO charted_svg_series(
+        labels, series, chart_type := 'bar', title := NULL
+    ) AS charted_svg_lists(labels, series, chart_type, title)""",
+    """CREATE OR REPLACE TEMP MACRO charted_save(
+        labels, "values", output, chart_type := 'bar', title := NULL
+    ) AS charted_save_lists(labels, ["values"], chart_type, title, output)""",
+    """CREATE OR REPLACE TEMP MACRO charted_save_series(
+        labels, series, output, chart_type := 'bar', title := NULL
+    ) AS charted_save_lists(labels, series, chart_type, title, output)""",
+)
+
+
+def _has_pyarrow() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
 
 
 def register(con: duckdb.DuckDBPyConnection) -> None:
     """Register all charted SQL functions with a DuckDB connection.
 
     Registers:
+    - charted_svg(labels VARCHAR[], values DOUBLE[], chart_type := 'bar',
+      title := NULL) → SVG string
+    - charted_svg_series(labels VARCHAR[], series DOUBLE[][], ...) → SVG string
+    - charted_save(labels, values, output, chart_type := 'bar', title := NULL)
+      → path
+    - charted_save_series(labels, series, output, ...) → path
     - charted_from_arrays(labels_json, data_json, chart_type, title, output) → path
     - charted_svg_from_arrays(labels_json, data_json, chart_type, title) → SVG string
 
-    These accept JSON-encoded arrays which can be built in SQL using
-    to_json(list(...)) or cast(list_value(...) as json).
+    The list-typed functions take list() aggregates directly, so
+    ``SELECT k, charted_svg(list(x), list(y)) FROM t GROUP BY k`` renders one
+    chart per group. When pyarrow is installed, the SVG functions run as a
+    vectorized Arrow UDF: one Python call per batch of groups instead of one
+    per row. NULL values chart as 0. The JSON-string functions are kept for
+    existing queries.
 
     For the simpler query-based workflow, use the Python functions:
     charted_query() and charted_svg() directly.
     """
     duckdb = _require_duckdb()
     VARCHAR = duckdb.sqltype("VARCHAR")
+    LABELS = duckdb.list_type(VARCHAR)
+    SERIES = duckdb.list_type(duckdb.list_type(duckdb.sqltype("DOUBLE")))
 
     con.create_function(
         "charted_from_arrays",
@@ -372,6 +809,31 @@ def register(con: duckdb.DuckDBPyConnection) -> None:
         side_effects=True,
     )
 
+    if _has_pyarrow():
+        svg_impl, udf_type = _charted_svg_arrow_impl, "arrow"
+    else:
+        svg_impl, udf_type = _charted_svg_lists_impl, "native"
+    con.create_function(
+        "charted_svg_lists",
+        svg_impl,
+        [LABELS, SERIES, VARCHAR, VARCHAR],
+        VARCHAR,
+        type=udf_type,
+        null_handling="special",
+    )
+
+    con.create_function(
+        "charted_save_lists",
+        _charted_save_lists_impl,
+        [LABELS, SERIES, VARCHAR, VARCHAR, VARCHAR],
+        VARCHAR,
+        null_handling="special",
+        side_effects=True,
+    )
+
+    for macro in _SQL_MACROS:
+        con.execute(macro)
+
 
 def load(db_path: str = ":memory:") -> duckdb.DuckDBPyConnection:
     """Create a DuckDB connection with charted functions pre-registered.
@@ -8,11 +8,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import duckdb
+import pytest
 
 from duckdb_ext.extension import (
     CHART_TYPES,
+    _build_chart,
+    _charted_svg_lists_impl,
+    _extract_chart_data_from_columns,
     _extract_chart_data_from_result,
+    _fetch_chart_data,
     charted_query,
+    charted_query_grouped,
     charted_svg,
     load,
     register,
@@ -131,6 +137,71 @@ def test_no_labels_column():
     assert len(data) == 2
 
 
+def test_columnar_fetch_matches_row_path():
+    """fetchnumpy() extraction renders the same charts as fetchall()."""
+    con = setup_con()
+    con.execute("ALTER TABLE test_data ADD COLUMN n INTEGER")
+    con.execute("UPDATE test_data SET n = 7 WHERE label <> 'Y'")
+    cases = [
+        ("bar", "SELECT label, a, b, n FROM test_data ORDER BY label"),
+        ("line", "SELECT label, a, b, n FROM test_data ORDER BY label"),
+        ("pie", "SELECT label, a FROM test_data ORDER BY label"),
+    ]
+    for chart_type, query in cases:
+        result = con.execute(query)
+        rows = result.fetchall()
+        columns = result.description
+        arrays = con.execute(query).fetchnumpy()
+        by_row = _extract_chart_data_from_result(columns, rows)
+        by_column = _extract_chart_data_from_columns(columns, arrays)
+        assert by_column[0] == by_row[0]
+        assert [list(s) for s in by_column[1]] == by_row[1]
+        assert (
+            _build_chart(chart_type, *by_column).html
+            == _build_chart(chart_type, *by_row).html
+        )
+
+
+def test_columnar_fetch_keeps_date_labels():
+    con = load()
+    labels, data, _ = _fetch_chart_data(
+        con, "SELECT DATE '2024-03-01' AS d, 1.0::DOUBLE AS v"
+    )
+    assert labels == ["2024-03-01"]
+
+
+def test_columnar_fetch_keeps_timestamp_labels():
+    con = load()
+    for type_name in ("TIMESTAMP", "TIMESTAMP_NS", "TIMESTAMP_MS", "TIMESTAMP_S"):
+        query = (
+            f"SELECT x::{type_name} AS t, 1.0::DOUBLE AS v FROM (VALUES "
+            "('2024-03-01 12:30:00'), (NULL)) AS r(x)"
+        )
+        labels, _, _ = _fetch_chart_data(con, query)
+        result = con.execute(query)
+        by_row = _extract_chart_data_from_result(result.description, result.fetchall())
+        assert labels == by_row[0] == ["2024-03-01 12:30:00", "None"], type_name
+
+
+def test_columnar_fetch_keeps_timestamptz_labels():
+    pytest.importorskip("pytz")  # DuckDB needs it to fetch TIMESTAMPTZ
+    con = load()
+    con.execute("SET TimeZone = 'America/New_York'")
+    labels, _, _ = _fetch_chart_data(
+        con, "SELECT TIMESTAMPTZ '2024-03-01 12:30:00+00' AS t, 1.0::DOUBLE AS v"
+    )
+    assert labels == ["2024-03-01 07:30:00-05:00"]
+
+
+def test_fetch_duplicate_column_names_falls_back():
+    con = setup_con()
+    labels, data, series_names = _fetch_chart_data(
+        con, "SELECT label, a, a FROM test_data ORDER BY label"
+    )
+    assert series_names == ["a", "a"]
+    assert data[0] == data[1] == [10.0, 20.0, 30.0]
+
+
 def test_sql_udf_from_arrays():
     """The SQL UDF should work with JSON-encoded arrays."""
     con = load()
@@ -168,6 +239,147 @@ def test_sql_udf_multi_series():
         Path(result[0]).unlink()
 
 
+def test_sql_list_udf_per_group():
+    """charted_svg(list(x), list(y)) renders one chart per GROUP BY group."""
+    con = setup_con()
+    rows = con.execute("""
+        SELECT label, charted_svg(list(label), list(a), title := label)
+        FROM test_data GROUP BY label ORDER BY label
+    """).fetchall()
+    assert [r[0] for r in rows] == ["X", "Y", "Z"]
+    for label, svg in rows:
+        assert "<svg" in svg and f">{label}<" in svg
+
+
+def test_sql_list_udf_matches_python():
+    """The registered UDF (Arrow or native) renders like the Python impl."""
+    con = setup_con()
+    svg = con.execute("""
+        SELECT charted_svg_series(
+            list(label ORDER BY label),
+            [list(a ORDER BY label), list(b ORDER BY label)],
+            chart_type := 'line'
+        ) FROM test_data
+    """).fetchone()[0]
+    expected = _charted_svg_lists_impl(
+        ["X", "Y", "Z"], [[10.0, 20.0, 30.0], [5.0, 15.0, 25.0]], "line", None
+    )
+    assert svg == expected
+
+
+def test_sql_list_udf_nulls():
+    con = load()
+    null_value = con.execute("SELECT charted_svg(['a', 'b'], [1, NULL])").fetchone()
+    zero_value = con.execute("SELECT charted_svg(['a', 'b'], [1, 0])").fetchone()
+    assert null_value == zero_value
+    assert con.execute("SELECT charted_svg(['a'], NULL)").fetchone() == (None,)
+
+
+def test_sql_list_udf_save():
+    con = load()
+    with tempfile.NamedTemporaryFile(suffix=".svg", delete=False) as f:
+        result = con.execute(f"""
+            SELECT charted_save(
+                ['Mon', 'Tue'], [3, 4], '{f.name}', chart_type := 'pie'
+            )
+        """).fetchone()
+        assert "<svg" in Path(result[0]).read_text()
+        Path(result[0]).unlink()
+
+
+def setup_grouped_con():
+    con = load()
+    con.execute("""
+        CREATE TABLE orders AS
+        SELECT 'c/' || (range % 3) AS customer, 'm' || (range // 3) AS month,
+               (range * 7 % 11)::DOUBLE AS spend
+        FROM range(12)
+    """)
+    return con
+
+
+def test_grouped_query_to_directory():
+    con = setup_grouped_con()
+    with tempfile.TemporaryDirectory() as d:
+        paths = charted_query_grouped(
+            con,
+            "SELECT customer, month, spend FROM orders ORDER BY month DESC",
+            group_by="customer",
+            chart_type="line",
+            title="Spend {group}",
+            output_dir=d,
+        )
+        assert [Path(p).name for p in paths] == ["c_0.svg", "c_1.svg", "c_2.svg"]
+        expected = charted_svg(
+            con,
+            "SELECT month, spend FROM orders WHERE customer = 'c/1' "
+            "ORDER BY month DESC",
+            chart_type="line",
+            title="Spend c/1",
+        )
+        assert Path(paths[1]).read_text() == expected
+
+
+def test_grouped_query_to_table_parallel():
+    con = setup_grouped_con()
+    query = "SELECT customer, month, spend FROM orders"
+    table = charted_query_grouped(con, query, group_by="customer", table="charts")
+    serial = con.execute('SELECT "group", svg FROM charts').fetchall()
+    charted_query_grouped(con, query, group_by="customer", table="charts", jobs=2)
+    parallel = con.execute('SELECT "group", svg FROM charts').fetchall()
+    assert table == "charts"
+    assert [g for g, _ in serial] == ["c/0", "c/1", "c/2"]
+    assert parallel == serial
+
+
+def test_grouped_query_keeps_query_order_within_groups():
+    con = load()
+    con.execute("SET threads = 4")
+    con.execute("""
+        CREATE TABLE points AS
+        SELECT 'g' || (range % 3) AS g, 'p' || range AS label,
+               hash(range) % 1000 AS v
+        FROM range(3000)
+    """)
+    query = "SELECT g, label, v::DOUBLE AS v FROM points ORDER BY hash(label)"
+    with tempfile.TemporaryDirectory() as d:
+        paths = charted_query_grouped(con, query, group_by="g", output_dir=d)
+        for group, path in zip(("g0", "g1", "g2"), paths):
+            expected = charted_svg(
+                con,
+                f"SELECT label, v::DOUBLE AS v FROM points WHERE g = '{group}' "
+                "ORDER BY hash(label)",
+            )
+            assert Path(path).read_text() == expected
+
+
+def test_grouped_query_unknown_group_column():
+    con = setup_grouped_con()
+    with tempfile.TemporaryDirectory() as d:
+        try:
+            charted_query_grouped(
+                con, "SELECT * FROM orders", group_by="region", output_dir=d
+            )
+        except ValueError as e:
+            assert "'region'" in str(e) and "customer" in str(e)
+        else:
+            raise AssertionError("expected ValueError")
+    # The staged result is dropped even when the call fails.
+    assert not con.execute(
+        "SELECT * FROM duckdb_tables() WHERE table_name LIKE '__charted_grouped_%'"
+    ).fetchall()
+
+
+def test_grouped_query_requires_one_output():
+    con = setup_grouped_con()
+    try:
+        charted_query_grouped(con, "SELECT * FROM orders", group_by="customer")
+    except ValueError as e:
+        assert "exactly one" in str(e)
+    else:
+        raise AssertionError("expected ValueError")
+
+
 if __name__ == "__main__":
     print("Running charted DuckDB extension tests...\n")
 
@@ -178,8 +390,21 @@ if __name__ == "__main__":
         test_charted_svg_returns_string,
         test_extract_data_from_result,
         test_no_labels_column,
+        test_columnar_fetch_matches_row_path,
+        test_columnar_fetch_keeps_date_labels,
+        test_columnar_fetch_keeps_timestamp_labels,
+        test_fetch_duplicate_column_names_falls_back,
         test_sql_udf_from_arrays,
         test_sql_udf_multi_series,
+        test_sql_list_udf_per_group,
+        test_sql_list_udf_matches_python,
+        test_sql_list_udf_nulls,
+        test_sql_list_udf_save,
+        test_grouped_query_to_directory,
+        test_grouped_query_to_table_parallel,
+        test_grouped_query_keeps_query_order_within_groups,
+        test_grouped_query_unknown_group_column,
+        test_grouped_query_requires_one_output,
     ]
 
     passed = 0
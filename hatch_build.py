@@ -0,0 +1,45 @@
+"""Hatch build hook: compile font definitions into the binary mmap format.
+
+The JSON definitions under ``charted/fonts/definitions`` are the committed
+source of truth. At wheel build time each one is converted with
+:func:`charted.fonts.compiled.compile_definitions` and the resulting
+``<family>.bin`` files are injected next to the JSON, so installed copies load
+fonts through ``mmap`` without parsing JSON. Source checkouts keep working from
+the JSON alone.
+"""
+
+import importlib.util
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+DEFINITIONS = Path("charted") / "fonts" / "definitions"
+
+
+def _load_compiled_module(root: Path):
+    # Load the converter by path so the build does not import the whole
+    # ``charted`` package (and its chart modules) into the build backend;
+    # compiled.py imports nothing from ``charted`` at runtime.
+    spec = importlib.util.spec_from_file_location(
+        "_charted_font_compiler", root / "charted" / "fonts" / "compiled.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class CustomBuildHook(BuildHookInterface):
+    def initialize(self, version, build_data):
+        if self.target_name != "wheel":
+            return
+        root = Path(self.root)
+        compiled = _load_compiled_module(root)
+        self._output = tempfile.TemporaryDirectory(prefix="charted-fonts-")
+        for path in compiled.compile_definitions(root / DEFINITIONS, self._output.name):
+            build_data["force_include"][str(path)] = str(DEFINITIONS / path.name)
+
+    def finalize(self, version, build_data, artifact_path):
+        output = getattr(self, "_output", None)
+        if output is not None:
+            output.cleanup()
@@ -0,0 +1,133 @@
+"""In-memory LRU cache of rendered tool results for the MCP server.
+
+Agents often repeat a tool call with identical arguments (a retried turn, a
+re-render after an edit elsewhere). Rendering, and PNG rasterization in
+particular, costs far more than hashing the arguments, so results are kept
+in a least-recently-used cache bounded by their total size.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+CACHE_BYTES_ENV = "CHARTED_MCP_CACHE_BYTES"
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def make_key(tool: str, arguments: dict[str, Any]) -> str | None:
+    """Canonical hash of a tool call, or None if it cannot be cached.
+
+    Arguments are serialized as JSON with sorted keys, so the same call
+    always hashes the same whatever order its arguments arrived in. Values
+    that are not JSON (only possible when the handlers are called from
+    Python) make the call uncacheable.
+    """
+    try:
+        payload = json.dumps([tool, arguments], sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """Thread-safe LRU cache of string results bounded by total size.
+
+    Sizes are string lengths, which equal bytes for the ASCII SVG, HTML and
+    base64 output the tools produce. A result larger than the whole budget
+    is returned but not stored.
+
+    Args:
+        max_bytes: Size budget; 0 disables caching.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key: str | None, compute: Callable[[], str]) -> str:
+        """Return the cached result for ``key``, computing it on a miss.
+
+        ``key=None`` bypasses the cache (and the counters) entirely.
+        """
+        if key is None or self.max_bytes <= 0:
+            return compute()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        # Rendered outside the lock so other calls are not serialized behind
+        # it; two identical concurrent misses both render, which is harmless.
+        value = compute()
+        self._store(key, value)
+        return value
+
+    def _store(self, key: str, value: str) -> None:
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = value
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Counters and current usage, as returned by the cache_stats tool."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def cache_bytes_from_env() -> int:
+    """The cache budget from ``CHARTED_MCP_CACHE_BYTES`` (default 64 MiB).
+
+    ``0`` stores nothing, turning the cache off.
+
+    Raises:
+        ValueError: If the variable is not a whole number of bytes, or is
+            negative.
+    """
+    raw = os.environ.get(CACHE_BYTES_ENV)
+    if raw is None:
+        return DEFAULT_CACHE_BYTES
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(
+            f"{CACHE_BYTES_ENV} must be a whole number of bytes, got {raw!r}"
+        ) from None
+    if value < 0:
+        raise ValueError(f"{CACHE_BYTES_ENV} must be at least 0")
+    return value
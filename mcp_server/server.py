@@ -1,18 +1,31 @@
 """MCP server for the charted SVG chart library.
 
 Exposes charted's chart generation as MCP tools that any AI agent can use.
+
+Chart rendering runs in a bounded thread pool so a slow chart (a large CSV,
+PNG rasterization) does not block the stdio event loop and the other tool
+calls waiting on it. Two environment variables tune it:
+
+- ``CHARTED_MCP_MAX_WORKERS``: charts rendered at once (default 4).
+- ``CHARTED_MCP_TIMEOUT``: seconds a call may wait and run before it fails
+  with a timeout error (default 60; 0 disables the limit).
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import ImageContent, TextContent, Tool
 
 from mcp_server.tools import (
+    handle_cache_stats,
     handle_chart_from_csv,
     handle_create_chart,
     handle_list_chart_types,
@@ -21,6 +34,58 @@ from mcp_server.tools import (
 
 app = Server("charted-mcp")
 
+MAX_WORKERS_ENV = "CHARTED_MCP_MAX_WORKERS"
+TIMEOUT_ENV = "CHARTED_MCP_TIMEOUT"
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_TIMEOUT = 60.0
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _max_workers() -> int:
+    value = int(os.environ.get(MAX_WORKERS_ENV, DEFAULT_MAX_WORKERS))
+    if value < 1:
+        raise ValueError(f"{MAX_WORKERS_ENV} must be at least 1")
+    return value
+
+
+def _timeout() -> float | None:
+    value = float(os.environ.get(TIMEOUT_ENV, DEFAULT_TIMEOUT))
+    return value if value > 0 else None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """The shared rendering pool, created on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=_max_workers(), thread_name_prefix="charted-mcp"
+        )
+    return _executor
+
+
+def _shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def _run_handler(handler: Callable[..., Any], **kwargs: Any) -> Any:
+    """Run a blocking tool handler in the pool, bounded by the timeout.
+
+    A call still queued when it times out is cancelled and never runs. One
+    already rendering cannot be interrupted; it finishes in the background
+    and its result is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_get_executor(), partial(handler, **kwargs))
+    timeout = _timeout()
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"chart rendering timed out after {timeout:g}s") from None
+
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
@@ -183,6 +248,21 @@ async def list_tools() -> list[Tool]:
                 "required": [],
             },
         ),
+        Tool(
+            name="cache_stats",
+            description=(
+                "Return the chart result cache's counters: hits, misses, "
+                "evictions, the number of cached results and their total size "
+                "in bytes against the budget. Repeated create_chart or "
+                "chart_from_csv calls with identical arguments are served from "
+                "this cache without re-rendering."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": [],
+            },
+        ),
         Tool(
             name="chart_from_csv",
             description=(
@@ -279,6 +359,25 @@ async def list_tools() -> list[Tool]:
                             "chart content in the response."
                         ),
                     },
+                    "max_rows": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": (
+                            "Chart at most this many data rows. Set it for "
+                            "large CSV input: a chart cannot show more points "
+                            "than it has pixels, and parsing stops early."
+                        ),
+                    },
+                    "sample": {
+                        "type": "string",
+                        "enum": ["head", "uniform"],
+                        "default": "head",
+                        "description": (
+                            "How max_rows selects rows: 'head' keeps the first "
+                            "rows (fastest), 'uniform' keeps evenly spaced rows "
+                            "across the whole CSV to preserve its overall shape."
+                        ),
+                    },
                 },
                 "required": ["csv_data"],
             },
@@ -305,7 +404,8 @@ async def call_tool(
     try:
         if name == "create_chart":
             output_format = arguments.get("output_format", "svg")
-            result = handle_create_chart(
+            result = await _run_handler(
+                handle_create_chart,
                 chart_type=arguments["chart_type"],
                 data=arguments["data"],
                 labels=arguments.get("labels"),
@@ -330,9 +430,14 @@ async def call_tool(
             result = handle_list_themes()
             return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
+        elif name == "cache_stats":
+            result = handle_cache_stats()
+            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
         elif name == "chart_from_csv":
             output_format = arguments.get("output_format", "svg")
-            result = handle_chart_from_csv(
+            result = await _run_handler(
+                handle_chart_from_csv,
                 csv_data=arguments["csv_data"],
                 chart_type=arguments.get("chart_type", "auto"),
                 x_column=arguments.get("x_column"),
@@ -342,6 +447,8 @@ async def call_tool(
                 output_format=output_format,
                 save_path=arguments.get("save_path"),
                 scale=int(arguments.get("scale", 2)),
+                max_rows=arguments.get("max_rows"),
+                sample=arguments.get("sample", "head"),
             )
             if output_format == "png":
                 return [_png_data_url_to_image(result)]
@@ -358,12 +465,15 @@ async def call_tool(
 
 async def _run():
     """Run the MCP server over stdio."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options(),
+            )
+    finally:
+        _shutdown_executor()
 
 
 def run():
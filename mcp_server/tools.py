@@ -1,7 +1,9 @@
 """Tool implementations for the charted MCP server.
 
 Each function handles one MCP tool call and returns the result
-in a format suitable for the MCP response.
+in a format suitable for the MCP response. Chart results are memoized in
+``RESULT_CACHE`` (see :mod:`mcp_server.cache`), so repeating a call with the
+same arguments returns without rendering again.
 """
 
 from __future__ import annotations
@@ -9,10 +11,16 @@ from __future__ import annotations
 import csv
 import inspect
 import io
+import math
+from collections.abc import Iterator, Sequence
+from itertools import islice, zip_longest
 from typing import Any
 
 import charted
 from charted.themes.core import NAMED_PALETTES, Theme
+from mcp_server.cache import ResultCache, cache_bytes_from_env, make_key
+
+RESULT_CACHE = ResultCache(cache_bytes_from_env())
 
 CHART_TYPE_MAP = {
     "bar": "BarChart",
@@ -84,6 +92,41 @@ def handle_create_chart(
     Raises:
         ValueError: If chart_type is invalid or data is empty.
     """
+    arguments = {
+        "chart_type": chart_type,
+        "data": data,
+        "labels": labels,
+        "title": title,
+        "series_names": series_names,
+        "width": width,
+        "height": height,
+        "theme": theme,
+        "output_format": output_format,
+        "sizes": sizes,
+        "scale": scale,
+    }
+    # A save_path is a side effect the cache cannot replay.
+    key = None if save_path else make_key("create_chart", arguments)
+    return RESULT_CACHE.get_or_compute(
+        key, lambda: _create_chart(**arguments, save_path=save_path)
+    )
+
+
+def _create_chart(
+    chart_type: str,
+    data: Any,
+    labels: list[str] | None,
+    title: str | None,
+    series_names: list[str] | None,
+    width: float | None,
+    height: float | None,
+    theme: str | dict | None,
+    output_format: str,
+    save_path: str | None,
+    sizes: list[float] | None,
+    scale: int,
+) -> str:
+    """Render a chart for handle_create_chart, bypassing the cache."""
     # Build kwargs for the chart constructor
     kwargs: dict[str, Any] = {}
     if title is not None:
@@ -174,6 +217,16 @@ def handle_list_chart_types() -> list[dict[str, str]]:
     ]
 
 
+def handle_cache_stats() -> dict[str, int]:
+    """Return the result cache's hit/miss counters and size.
+
+    Returns:
+        Dict with 'hits', 'misses', 'evictions', 'entries', 'bytes' and
+        'max_bytes' keys.
+    """
+    return RESULT_CACHE.stats()
+
+
 def handle_list_themes() -> dict[str, Any]:
     """Return available theme presets and palettes.
 
@@ -206,6 +259,8 @@ def handle_chart_from_csv(
     output_format: str = "svg",
     save_path: str | None = None,
     scale: int = 2,
+    max_rows: int | None = None,
+    sample: str = "head",
 ) -> str:
     """Generate a chart from CSV text data.
 
@@ -221,6 +276,10 @@ def handle_chart_from_csv(
         theme: Theme preset or config dict.
         output_format: Output format.
         save_path: Optional save path.
+        max_rows: Chart at most this many data rows.
+        sample: How ``max_rows`` picks rows: "head" (the first rows; the
+            rest of the text is never parsed) or "uniform" (evenly spaced
+            rows across the whole file).
 
     Returns:
         Chart content as string.
@@ -231,58 +290,150 @@ def handle_chart_from_csv(
     if not csv_data or not csv_data.strip():
         raise ValueError("CSV data is empty.")
 
-    reader = csv.DictReader(io.StringIO(csv_data.strip()))
-    fieldnames = reader.fieldnames
-    if not fieldnames or len(fieldnames) < 2:
-        raise ValueError("CSV must have a header row with at least two columns.")
-
-    rows = list(reader)
-    if not rows:
-        raise ValueError("CSV has no data rows.")
-
-    # Determine which columns are numeric
-    numeric_cols = []
-    for col in fieldnames:
-        try:
-            [float(row[col]) for row in rows]
-            numeric_cols.append(col)
-        except (ValueError, TypeError):
-            pass
-
-    # Determine x_column (labels)
+    arguments = {
+        "csv_data": csv_data,
+        "chart_type": chart_type,
+        "x_column": x_column,
+        "y_columns": y_columns,
+        "title": title,
+        "theme": theme,
+        "output_format": output_format,
+        "scale": scale,
+        "max_rows": max_rows,
+        "sample": sample,
+    }
+    key = None if save_path else make_key("chart_from_csv", arguments)
+    return RESULT_CACHE.get_or_compute(
+        key, lambda: _chart_from_csv(**arguments, save_path=save_path)
+    )
+
+
+def _chart_from_csv(
+    csv_data: str,
+    chart_type: str,
+    x_column: str | None,
+    y_columns: list[str] | None,
+    title: str | None,
+    theme: str | dict | None,
+    output_format: str,
+    save_path: str | None,
+    scale: int,
+    max_rows: int | None,
+    sample: str,
+) -> str:
+    """Parse and render for handle_chart_from_csv, bypassing the cache."""
+    table = _CsvColumns(csv_data, max_rows, sample)
+
+    # Determine x_column (labels): the first non-numeric column
     if x_column is None:
-        # First non-numeric column
-        non_numeric = [c for c in fieldnames if c not in numeric_cols]
-        if non_numeric:
-            x_column = non_numeric[0]
-        else:
-            x_column = None
+        x_column = next((c for c in table.fieldnames if table.numbers(c) is None), None)
+    elif x_column not in table.fieldnames:
+        raise ValueError(f"Column {x_column!r} not found in CSV header.")
 
-    # Determine y_columns
+    # Determine y_columns: every numeric column except x_column
     if y_columns is None:
-        y_columns = [c for c in numeric_cols if c != x_column]
+        y_columns = [
+            c
+            for c in table.fieldnames
+            if c != x_column and table.numbers(c) is not None
+        ]
 
     if not y_columns:
         raise ValueError("No numeric columns found for chart data.")
 
-    # Extract data
-    labels = [row[x_column] for row in rows] if x_column else None
+    series = []
+    for col in y_columns:
+        if col not in table.fieldnames:
+            raise ValueError(f"Column {col!r} not found in CSV header.")
+        values = table.numbers(col)
+        if values is None:
+            raise ValueError(f"Column {col!r} contains non-numeric values.")
+        series.append(values)
+
+    labels = list(table.cells(x_column)) if x_column else None
     data: list[float] | list[list[float]]
-    if len(y_columns) == 1:
-        data = [float(row[y_columns[0]]) for row in rows]
-    else:
-        data = [[float(row[col]) for row in rows] for col in y_columns]
+    data = series[0] if len(series) == 1 else series
 
     series_names = y_columns if len(y_columns) > 1 else None
 
-    return handle_create_chart(
+    return _create_chart(
         chart_type=chart_type,
         data=data,
         labels=labels,
         title=title,
         series_names=series_names,
+        width=None,
+        height=None,
         theme=theme,
         output_format=output_format,
         save_path=save_path,
+        sizes=None,
         scale=scale,
     )
+
+
+CSV_SAMPLE_MODES = ("head", "uniform")
+
+
+class _CsvColumns:
+    """CSV text parsed once into columns.
+
+    The C tokenizer reads the rows and ``zip`` transposes them, so no Python
+    code runs per cell. A column is converted to floats only when first
+    asked for, by one ``map(float, ...)`` that stops at its first
+    non-numeric cell.
+    """
+
+    def __init__(self, csv_data: str, max_rows: int | None, sample: str) -> None:
+        reader = csv.reader(io.StringIO(csv_data.strip()))
+        header = next(reader, None)
+        if not header or len(header) < 2:
+            raise ValueError("CSV must have a header row with at least two columns.")
+
+        # filter() drops blank lines, which csv.DictReader skipped too.
+        rows = _sample_rows(filter(None, reader), csv_data, max_rows, sample)
+        columns: list[Sequence[str]] = list(zip_longest(*rows, fillvalue=""))
+        if not columns:
+            raise ValueError("CSV has no data rows.")
+        count = len(columns[0])
+        # Cells past the header are dropped; missing cells read as "".
+        columns = columns[: len(header)]
+        columns += [("",) * count] * (len(header) - len(columns))
+
+        # Like csv.DictReader, a repeated column name refers to the last one.
+        self._index = {name: i for i, name in enumerate(header)}
+        self.fieldnames = list(dict.fromkeys(header))
+        self._columns = columns
+        self._numbers: dict[str, list[float] | None] = {}
+
+    def cells(self, name: str) -> Sequence[str]:
+        return self._columns[self._index[name]]
+
+    def numbers(self, name: str) -> list[float] | None:
+        """The column as floats, or None if any cell is not a number."""
+        if name not in self._numbers:
+            try:
+                self._numbers[name] = list(map(float, self.cells(name)))
+            except ValueError:
+                self._numbers[name] = None
+        return self._numbers[name]
+
+
+def _sample_rows(
+    rows: Iterator[list[str]], csv_data: str, max_rows: int | None, sample: str
+) -> Iterator[list[str]]:
+    """Limit ``rows`` to ``max_rows`` according to the ``sample`` mode."""
+    if sample not in CSV_SAMPLE_MODES:
+        raise ValueError(
+            f"Invalid sample: {sample!r}. Must be one of: {list(CSV_SAMPLE_MODES)}."
+        )
+    if max_rows is None:
+        return rows
+    if max_rows < 1:
+        raise ValueError("max_rows must be at least 1.")
+    if sample == "head":
+        return islice(rows, max_rows)
+    # Line count bounds the row count; quoted newlines only make the stride
+    # (and so the sample) slightly sparser.
+    step = max(1, math.ceil(csv_data.strip().count("\n") / max_rows))
+    return islice(rows, 0, None, step)
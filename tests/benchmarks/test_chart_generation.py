@@ -232,3 +232,69 @@ def test_multi_series_chart_generation(benchmark):
 
     chart = benchmark(generate)
     _ = chart.html
+
+
+LIVE_LABELS = [f"Sensor {i}" for i in range(50)]
+LIVE_DATA = [float(i % 17) for i in range(50)]
+
+
+@pytest.mark.benchmark(group="live-update")
+def test_live_update_rebuild(benchmark):
+    """Benchmark redrawing a changed value by constructing a new chart."""
+    from charted import ColumnChart
+
+    data = list(LIVE_DATA)
+
+    def rebuild():
+        data[7] += 1
+        return ColumnChart(data=data, labels=LIVE_LABELS, title="Live").html
+
+    assert benchmark(rebuild)
+
+
+@pytest.mark.benchmark(group="live-update")
+def test_live_update_in_place(benchmark):
+    """Benchmark redrawing a changed value with Chart.update_data()."""
+    from charted import ColumnChart
+
+    data = list(LIVE_DATA)
+    chart = ColumnChart(data=data, labels=LIVE_LABELS, title="Live")
+
+    def update():
+        data[7] += 1
+        return chart.update_data(y_data=data).html
+
+    assert benchmark(update)
+
+
+def _sankey_flows(n_links):
+    """A seeded six-column flow graph with about ten links per node."""
+    import random
+
+    rng = random.Random(0)
+    n_nodes = max(6, n_links // 10)
+    columns = [list(range(k, n_nodes, 6)) for k in range(6)]
+    links = []
+    while len(links) < n_links:
+        a = rng.randrange(5)
+        b = rng.randrange(a + 1, 6)
+        links.append(
+            (rng.choice(columns[a]), rng.choice(columns[b]), rng.uniform(1, 100))
+        )
+    return [f"Node {i}" for i in range(n_nodes)], links
+
+
+@pytest.mark.benchmark(group="sankey-layout")
+@pytest.mark.parametrize("n_links", [100, 1_000, 10_000])
+def test_sankey_layout(benchmark, n_links):
+    """Benchmark laying out a Sankey flow graph of 100 to 10k links."""
+    from charted.utils.sankey_layout import compute_layout
+
+    nodes, links = _sankey_flows(n_links)
+
+    def layout():
+        return compute_layout(
+            nodes, links, x0=40, y0=20, x1=1960, y1=4980, iterations=32
+        )
+
+    assert len(benchmark(layout).links) == n_links
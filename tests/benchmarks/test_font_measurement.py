@@ -0,0 +1,92 @@
+"""Benchmarks for text measurement against font definitions.
+
+Compares the historical path (parse the definition JSON, then probe a
+string-keyed dict per character) with the shared compiled metric tables that
+``Font.measure`` now uses. Labels are unique per call so neither path can be
+served from ``calculate_text_dimensions``'s LRU cache.
+
+Run with: uv run pytest tests/benchmarks/test_font_measurement.py --benchmark-only
+"""
+
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from charted.utils.defaults import BASE_DEFINITIONS_DIR, DEFAULT_FONT
+
+_counter = itertools.count()
+
+
+def _label() -> str:
+    return f"Region {next(_counter)} revenue"
+
+
+@pytest.mark.benchmark(group="font-measure")
+def test_measure_legacy_json_per_call(benchmark):
+    """Baseline: parse the JSON definition and probe str keys per label."""
+    font_path = Path(BASE_DEFINITIONS_DIR) / f"{DEFAULT_FONT}.json"
+
+    def measure():
+        with open(font_path) as f:
+            definitions = json.load(f)["12"]
+        width = 0
+        for char in _label():
+            if str(ord(char)) in definitions:
+                width += definitions[str(ord(char))]["width"]
+            else:
+                width += 5
+        return width
+
+    assert benchmark(measure) > 0
+
+
+@pytest.mark.benchmark(group="font-measure")
+def test_measure_compiled_tables(benchmark):
+    """Font construction plus measurement against the shared registry."""
+    from charted.fonts.wrapper import Font
+
+    def measure():
+        return Font(family=DEFAULT_FONT, size=12).measure(_label())[0]
+
+    assert benchmark(measure) > 0
+
+
+@pytest.mark.benchmark(group="font-measure")
+def test_calculate_text_dimensions_unique_labels(benchmark):
+    """End-to-end measurement of labels that always miss the LRU cache."""
+    from charted.utils.helpers import calculate_text_dimensions
+
+    def measure():
+        return calculate_text_dimensions(_label()).width
+
+    assert benchmark(measure) > 0
+
+
+@pytest.mark.benchmark(group="font-load")
+def test_load_definition_json(benchmark):
+    """Cold load of one family from its JSON definition."""
+    from charted.fonts.metrics import _load_family
+
+    family = benchmark(_load_family, DEFAULT_FONT, BASE_DEFINITIONS_DIR)
+    assert family.compile("12") is not None
+
+
+@pytest.mark.benchmark(group="font-load")
+def test_load_definition_compiled(benchmark, tmp_path):
+    """Cold load of one family from the mmap'd binary definition."""
+    import shutil
+
+    from charted.fonts.compiled import compile_definitions
+    from charted.fonts.metrics import _load_family
+
+    shutil.copy(Path(BASE_DEFINITIONS_DIR) / f"{DEFAULT_FONT}.json", tmp_path)
+    compile_definitions(tmp_path)
+
+    def load():
+        family = _load_family(DEFAULT_FONT, str(tmp_path))
+        family.compile("12")
+        return family
+
+    assert benchmark(load).compile("12") is not None
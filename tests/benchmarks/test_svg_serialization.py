@@ -0,0 +1,60 @@
+"""Benchmarks for serializing a large element tree.
+
+A 50k-point ``ScatterChart`` is built once per module; the benchmarks time
+only ``.html``. ``first_render`` drops every cached attribute string before
+each round, so it measures a cold serialization; ``rerender`` measures the
+cached path taken by repeat renders (``to_svg`` then ``save``, tooltips, the
+MCP server returning both SVG and a description).
+
+Run with: uv run pytest tests/benchmarks/test_svg_serialization.py --benchmark-only
+"""
+
+import random
+
+import pytest
+
+from charted.html.element import Element
+
+POINTS = 50_000
+
+
+@pytest.fixture(scope="module")
+def scatter():
+    from charted import ScatterChart
+
+    rng = random.Random(7)
+    x = [rng.uniform(0, 100) for _ in range(POINTS)]
+    y = [rng.uniform(0, 100) for _ in range(POINTS)]
+    return ScatterChart(x_data=x, y_data=y)
+
+
+def _walk(element):
+    stack = [element]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(child for child in node.children if isinstance(child, Element))
+
+
+def _drop_attribute_caches(chart):
+    for node in _walk(chart):
+        node.kwargs.rendered = None
+
+
+@pytest.mark.benchmark(group="svg-serialization")
+def test_scatter_50k_first_render(benchmark, scatter):
+    """Serialize with every attribute string rebuilt from the kwargs."""
+    svg = benchmark.pedantic(
+        lambda: scatter.html,
+        setup=lambda: _drop_attribute_caches(scatter),
+        rounds=5,
+    )
+    assert svg.count("<circle") >= POINTS
+
+
+@pytest.mark.benchmark(group="svg-serialization")
+def test_scatter_50k_rerender(benchmark, scatter):
+    """Serialize again once the attribute strings are cached."""
+    _ = scatter.html
+    svg = benchmark(lambda: scatter.html)
+    assert svg.count("<circle") >= POINTS
@@ -176,3 +176,21 @@ class TestBarCategoryLabelWrapping:
             or "".join(measured.lines).replace(" ", "")
             == "Supercalifragilisticexpialidocious"
         )
+
+
+class TestBarChartCompactMarks:
+    """``compact_marks`` merges per-bar paths that share a fill."""
+
+    COLORS = ["#111111", "#222222", "#333333"]
+
+    def test_single_series_batched_by_fill(self):
+        data = list(range(1, 31))
+        plain = BarChart(data=data, colors=self.COLORS)
+        compact = BarChart(data=data, colors=self.COLORS, compact_marks=True)
+        fills = [f'fill="{c}"' for c in self.COLORS]
+        assert [plain.html.count(f) for f in fills] == [10, 10, 10]
+        assert [compact.html.count(f) for f in fills] == [1, 1, 1]
+
+    def test_multi_series_unchanged(self):
+        data = [[1, 2, 3], [4, 5, 6]]
+        assert BarChart(data=data).html == BarChart(data=data, compact_marks=True).html
@@ -141,3 +141,26 @@ class TestColumnLongCategoryLabels:
                 abs_x = gx + tx + shift
                 assert abs_x >= -0.5, f"label anchor {abs_x} off the left edge"
                 assert abs_x <= width + 0.5
+
+
+class TestColumnChartCompactMarks:
+    """``compact_marks`` merges per-bar paths that share a fill."""
+
+    COLORS = ["#111111", "#222222", "#333333"]
+
+    def test_single_series_batched_by_fill(self):
+        data = list(range(1, 31))
+        plain = ColumnChart(data=data, colors=self.COLORS, y_stacked=False)
+        compact = ColumnChart(
+            data=data, colors=self.COLORS, y_stacked=False, compact_marks=True
+        )
+        fills = [f'fill="{c}"' for c in self.COLORS]
+        assert [plain.html.count(f) for f in fills] == [10, 10, 10]
+        assert [compact.html.count(f) for f in fills] == [1, 1, 1]
+
+    def test_multi_series_unchanged(self):
+        data = [[1, 2, 3], [4, 5, 6]]
+        assert (
+            ColumnChart(data=data, y_stacked=False).html
+            == ColumnChart(data=data, y_stacked=False, compact_marks=True).html
+        )
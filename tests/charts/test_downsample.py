@@ -0,0 +1,137 @@
+"""Tests for level-of-detail downsampling on LineChart and AreaChart.
+
+Covers the ``downsample=`` option ("lttb" and "minmax") and the index
+selection helpers in ``charted.utils.downsample``.
+"""
+
+import math
+
+import pytest
+
+from charted.charts.area import AreaChart
+from charted.charts.line import LineChart
+from charted.utils.downsample import (
+    downsample_chart_data,
+    downsample_indices,
+    lttb_indices,
+    minmax_indices,
+)
+from charted.utils.exceptions import InvalidDataError
+
+
+def _wave(n: int) -> list[float]:
+    return [math.sin(i / 50) * 100 for i in range(n)]
+
+
+class TestSelection:
+    def test_lttb_keeps_threshold_points_and_endpoints(self):
+        ys = _wave(10_000)
+        xs = [float(i) for i in range(len(ys))]
+        kept = lttb_indices(xs, ys, 200)
+        assert len(kept) == 200
+        assert kept[0] == 0 and kept[-1] == len(ys) - 1
+        assert kept == sorted(set(kept))
+
+    def test_lttb_keeps_isolated_spike(self):
+        ys = [0.0] * 5000
+        ys[2345] = 1000.0
+        xs = [float(i) for i in range(len(ys))]
+        assert 2345 in lttb_indices(xs, ys, 100)
+
+    def test_minmax_keeps_every_bucket_extreme(self):
+        ys = _wave(10_000)
+        ys[777] = 500.0
+        ys[4242] = -500.0
+        kept = minmax_indices([], ys, 100)
+        assert len(kept) <= 100
+        assert 777 in kept and 4242 in kept
+        assert kept[0] == 0 and kept[-1] == len(ys) - 1
+
+    def test_short_series_untouched(self):
+        assert lttb_indices([0, 1, 2], [1, 2, 3], 10) == [0, 1, 2]
+        assert minmax_indices([0, 1, 2], [1, 2, 3], 10) == [0, 1, 2]
+        assert downsample_indices("lttb", [1, 2, 3], None, 10) is None
+
+    def test_multi_series_share_indices(self):
+        a = [0.0] * 1000
+        b = [0.0] * 1000
+        a[100] = 5.0
+        b[900] = 5.0
+        keep = downsample_indices("minmax", [a, b], None, 20)
+        assert 100 in keep and 900 in keep
+
+    def test_missing_x_becomes_kept_indices(self):
+        data, x_data, labels, keep = downsample_chart_data(
+            "lttb", 10, _wave(100), None, [str(i) for i in range(100)]
+        )
+        assert len(data) == len(x_data) == len(labels) == 10
+        assert x_data == [float(i) for i in keep]
+        assert labels == [str(i) for i in keep]
+
+
+class TestCharts:
+    def test_line_reduced_to_threshold(self):
+        chart = LineChart(data=_wave(20_000), downsample="lttb")
+        assert len(chart.y_values[0]) == int(chart.width)
+
+    def test_line_minmax_custom_threshold(self):
+        chart = LineChart(
+            data=[_wave(5000), _wave(5000)[::-1]],
+            downsample="minmax",
+            downsample_threshold=50,
+        )
+        assert len(chart.y_values) == 2
+        assert len(chart.y_values[0]) == len(chart.y_values[1]) <= 100
+
+    def test_line_keeps_x_data_and_data_labels_aligned(self):
+        n = 1000
+        chart = LineChart(
+            data=_wave(n),
+            x_data=[i * 2 for i in range(n)],
+            data_labels=[f"p{i}" for i in range(n)],
+            downsample="lttb",
+            downsample_threshold=30,
+        )
+        assert len(chart.x_values[0]) == 30
+        assert len(chart._data_labels) == 30
+
+    def test_output_size_independent_of_input_length(self):
+        small = LineChart(data=_wave(10_000), downsample="lttb").html
+        large = LineChart(data=_wave(100_000), downsample="lttb").html
+        assert len(large) < len(small) * 1.2
+
+    def test_area_stacked_downsample(self):
+        chart = AreaChart(data=[_wave(4000), _wave(4000)], downsample="minmax")
+        assert len(chart.y_values[0]) == len(chart.y_values[1]) <= int(chart.width)
+        assert "<path" in chart.html
+
+    def test_default_is_unchanged(self):
+        data = _wave(600)
+        assert LineChart(data=data).html == LineChart(data=data, downsample=None).html
+
+    def test_within_threshold_is_unchanged(self):
+        data = _wave(100)
+        assert LineChart(data=data).html == LineChart(data=data, downsample="lttb").html
+
+    @pytest.mark.parametrize("cls", [LineChart, AreaChart])
+    def test_unknown_method_rejected(self, cls):
+        with pytest.raises(ValueError, match="Unknown downsample"):
+            cls(data=[1, 2, 3], downsample="average")
+
+    def test_threshold_too_small_rejected(self):
+        with pytest.raises(ValueError, match="downsample_threshold"):
+            LineChart(data=[1, 2, 3], downsample="lttb", downsample_threshold=2)
+
+    @pytest.mark.parametrize("cls", [LineChart, AreaChart])
+    @pytest.mark.parametrize("method", ["lttb", "minmax"])
+    def test_invalid_values_raise_invalid_data_error(self, cls, method):
+        data = _wave(2000)
+        data[700] = None
+        with pytest.raises(InvalidDataError, match="Invalid data value"):
+            cls(data=data, downsample=method)
+
+    def test_invalid_x_values_raise_invalid_data_error(self):
+        x_data = [float(i) for i in range(2000)]
+        x_data[5] = float("nan")
+        with pytest.raises(InvalidDataError, match="NaN"):
+            LineChart(data=_wave(2000), x_data=x_data, downsample="lttb")
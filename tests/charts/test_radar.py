@@ -245,3 +245,23 @@ class TestRadarRadialLabels:
         )
         html = chart.html
         assert theme.resolved_grid_color.lower() in html.lower()
+
+    def test_every_ring_keeps_its_badge_on_small_charts(self):
+        """Crowded rings still each get a label badge; none are dropped."""
+        chart = RadarChart(
+            data=[3, 4, 5, 2, 6],
+            labels=["A", "B", "C", "D", "E"],
+            width=300,
+            height=300,
+            grid_levels=8,
+        )
+        html = chart.html
+        without = RadarChart(
+            data=[3, 4, 5, 2, 6],
+            labels=["A", "B", "C", "D", "E"],
+            width=300,
+            height=300,
+            grid_levels=8,
+            show_radial_labels=False,
+        ).html
+        assert html.count("<rect") - without.count("<rect") == 8
@@ -0,0 +1,109 @@
+"""Tests for RenderPlan and the cached layout it builds on."""
+
+import random
+
+import pytest
+
+from charted import BarChart, ColumnChart, LineChart, RenderPlan, ScatterChart
+from charted.utils import helpers
+from charted.utils.layout_engine import LayoutEngine
+from charted.utils.theme_manager import ThemeManager
+from charted.utils.types import MeasuredText
+
+LONG_LABELS = [f"Regional operations centre number {i}" for i in range(12)]
+
+
+def _rows(seed, series=2, n=12):
+    rng = random.Random(seed)
+    return [[rng.uniform(-20, 120) for _ in range(n)] for _ in range(series)]
+
+
+class TestRenderPlan:
+    @pytest.mark.parametrize(
+        "chart_class, options",
+        [
+            (LineChart, {"labels": LONG_LABELS, "theme": "dark", "title": "Live"}),
+            (ColumnChart, {"labels": LONG_LABELS, "width": 400, "height": 300}),
+            (BarChart, {"labels": LONG_LABELS, "category_label_max_width": 90}),
+        ],
+    )
+    def test_renders_match_direct_construction(self, chart_class, options):
+        plan = RenderPlan(chart_class, **options)
+        for seed in range(3):
+            data = _rows(seed)
+            assert (
+                plan.render(data=data).html
+                == chart_class(data=data, **options).html
+            )
+        assert plan.renders == 3
+
+    def test_scatter_values(self):
+        plan = RenderPlan(ScatterChart, title="Points", width=500)
+        x, y = _rows(4)
+        assert (
+            plan.render(x_data=x, y_data=y).html
+            == ScatterChart(x_data=x, y_data=y, title="Points", width=500).html
+        )
+
+    def test_theme_resolved_once(self, monkeypatch):
+        calls = []
+        load_theme = ThemeManager.load_theme
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return load_theme(*args, **kwargs)
+
+        monkeypatch.setattr(ThemeManager, "load_theme", counting)
+        plan = RenderPlan(LineChart, theme="dark", colors=["#123456"])
+        charts = [plan.render(data=row) for row in _rows(1, series=3)]
+
+        assert len(calls) == 1
+        assert all(chart.theme is charts[0].theme for chart in charts)
+        assert charts[0].theme.colors == ["#123456"]
+
+    def test_bounded_labels_reused(self, monkeypatch):
+        calls = []
+        wrap = helpers.wrap_text_to_width
+
+        def counting(text, cap):
+            calls.append(text)
+            return wrap(text, cap)
+
+        monkeypatch.setattr(helpers, "wrap_text_to_width", counting)
+        plan = RenderPlan(BarChart, labels=LONG_LABELS, category_label_max_width=90)
+        for seed in range(3):
+            plan.render(data=_rows(seed, series=1)[0])
+
+        assert len(calls) == len(LONG_LABELS)
+        plan.clear()
+        plan.render(data=_rows(0, series=1)[0])
+        assert len(calls) == 2 * len(LONG_LABELS)
+
+    def test_fixed_option_rejected(self):
+        plan = RenderPlan(LineChart, labels=["a", "b"], width=300)
+        with pytest.raises(ValueError, match="labels, width"):
+            plan.render(data=[1, 2], width=400, labels=["c", "d"])
+
+
+class TestLayoutEngineCache:
+    def _layout(self):
+        return LayoutEngine(
+            width=600,
+            height=400,
+            h_padding=0.05,
+            v_padding=0.05,
+            x_labels=[MeasuredText("Jan", 20, 12)],
+            y_labels=[MeasuredText("100", 18, 12)],
+        )
+
+    def test_derived_values_cached(self):
+        layout = self._layout()
+        assert layout.bottom_padding is layout.bottom_padding
+        assert "bottom_padding" in vars(layout)
+
+    def test_assigning_input_invalidates(self):
+        layout = self._layout()
+        before = (layout.left_padding, layout.plot_width)
+        layout.y_labels = [MeasuredText("1,000,000", 60, 12)]
+        assert layout.left_padding == before[0] + 42
+        assert layout.plot_width == before[1] - 42
@@ -14,7 +14,7 @@ import pytest
 
 from charted import SankeyChart
 from charted.utils.exceptions import ChartedError
-from charted.utils.sankey_layout import compute_layout
+from charted.utils.sankey_layout import LEVELS_PER_PX, compute_layout
 
 # --- shared fixtures -------------------------------------------------------
 
@@ -125,6 +125,316 @@ class TestLayoutInvariants:
             assert len(lay.nodes) == 3
 
 
+# --- layout: engine --------------------------------------------------------
+
+
+def _layered_graph(n_links, n_layers=6, seed=0):
+    """A random layered DAG with about ten links per node."""
+    import random
+
+    rng = random.Random(seed)
+    n_nodes = max(n_layers, n_links // 10)
+    layer_of = [i * n_layers // n_nodes for i in range(n_nodes)]
+    by_layer = [
+        [i for i in range(n_nodes) if layer_of[i] == k] for k in range(n_layers)
+    ]
+    links = []
+    while len(links) < n_links:
+        a = rng.randrange(n_layers - 1)
+        b = rng.randrange(a + 1, n_layers)
+        links.append(
+            (rng.choice(by_layer[a]), rng.choice(by_layer[b]), rng.uniform(1, 100))
+        )
+    return [f"n{i}" for i in range(n_nodes)], links
+
+
+def _random_dag(rng):
+    """A small random DAG, with parallel links and repeated values."""
+    n = rng.randint(2, 9)
+    links = []
+    for _ in range(rng.randint(1, 14)):
+        s, t = sorted(rng.sample(range(n), 2))
+        links.append((s, t, rng.choice([1, 2, 5, 7, 0.5, rng.uniform(0, 20)])))
+    return [f"n{i}" for i in range(n)], links
+
+
+def _reference_relaxation(links, layers, *, y0, y1, padding, iterations):
+    """Node tops and link attachment points from a direct d3-sankey relaxation.
+
+    Every link list and column is re-sorted on every pass and every d3
+    targetTop / sourceTop walk is done in full, with the engine's ordering
+    rule: position levelled to ``1 / LEVELS_PER_PX`` px, then id.
+    """
+    n = len(layers)
+    src = [s for s, _, _ in links]
+    tgt = [t for _, t, _ in links]
+    out = [[k for k in range(len(links)) if src[k] == i] for i in range(n)]
+    inb = [[k for k in range(len(links)) if tgt[k] == i] for i in range(n)]
+    value = [
+        max(sum(links[k][2] for k in out[i]), sum(links[k][2] for k in inb[i]))
+        for i in range(n)
+    ]
+    columns = [[i for i in range(n) if layers[i] == c] for c in range(max(layers) + 1)]
+    ky = min(
+        (
+            (y1 - y0 - (len(col) - 1) * padding) / sum(value[i] for i in col)
+            for col in columns
+            if col and sum(value[i] for i in col) > 0
+        ),
+        default=1.0,
+    )
+    ky = ky if ky > 0 else 1.0
+    top, bottom = [0.0] * n, [0.0] * n
+    for col in filter(None, columns):
+        y = y0
+        for i in col:
+            top[i], bottom[i] = y, y + value[i] * ky
+            y = bottom[i] + padding
+        shift = max(0.0, (y1 - y0 - (bottom[col[-1]] - top[col[0]])) / 2)
+        for i in col:
+            top[i] += shift
+            bottom[i] += shift
+    ratio = [(b - t) / v if v > 0 else 0.0 for t, b, v in zip(top, bottom, value)]
+    width = [v * min(ratio[s], ratio[t]) for s, t, v in links]
+    weight = [v * (layers[t] - layers[s]) for s, t, v in links]
+
+    def level(i):
+        return round(top[i] * LEVELS_PER_PX)
+
+    def reorder():
+        for i in range(n):
+            out[i].sort(key=lambda k: (level(tgt[k]), k))
+            inb[i].sort(key=lambda k: (level(src[k]), k))
+
+    def target_top(s, t):
+        y = top[s] - (len(out[s]) - 1) * padding / 2
+        for k in out[s]:
+            if tgt[k] == t:
+                break
+            y += width[k] + padding
+        for k in inb[t]:
+            if src[k] == s:
+                break
+            y -= width[k]
+        return y
+
+    def source_top(s, t):
+        y = top[t] - (len(inb[t]) - 1) * padding / 2
+        for k in inb[t]:
+            if src[k] == s:
+                break
+            y += width[k] + padding
+        for k in out[s]:
+            if tgt[k] == t:
+                break
+            y -= width[k]
+        return y
+
+    def relax(alpha, from_sources):
+        for col in columns if from_sources else columns[::-1]:
+            for i in col:
+                stack = inb[i] if from_sources else out[i]
+                y = w = 0.0
+                for k in stack:
+                    if from_sources:
+                        y += target_top(src[k], i) * weight[k]
+                    else:
+                        y += source_top(i, tgt[k]) * weight[k]
+                    w += weight[k]
+                if w > 0:
+                    dy = (y / w - top[i]) * alpha
+                    top[i] += dy
+                    bottom[i] += dy
+
+    def resolve():
+        for col in columns:
+            col.sort(key=lambda i: (level(i), i))
+            y = y0
+            for i in col:
+                dy = max(0.0, y - top[i])
+                top[i] += dy
+                bottom[i] += dy
+                y = bottom[i] + padding
+            y = y1
+            for i in reversed(col):
+                dy = max(0.0, bottom[i] - y)
+                top[i] -= dy
+                bottom[i] -= dy
+                y = top[i] - padding
+
+    reorder()
+    for p in range(iterations):
+        for from_sources in (False, True):
+            relax(0.99**p, from_sources)
+            resolve()
+            reorder()
+
+    link_y0, link_y1 = [0.0] * len(links), [0.0] * len(links)
+    for i in range(n):
+        for stack, attach in ((out[i], link_y0), (inb[i], link_y1)):
+            y = top[i]
+            for k in stack:
+                attach[k] = y + width[k] / 2
+                y += width[k]
+    return top, link_y0, link_y1
+
+
+class TestLayoutEngine:
+    def test_depth_and_height_are_longest_paths(self):
+        # A->B->C->D plus a shortcut A->D: D sits three columns from A.
+        nodes = ["A", "B", "C", "D"]
+        links = [(0, 1, 1.0), (1, 2, 1.0), (2, 3, 1.0), (0, 3, 1.0)]
+        lay = _layout(nodes, links)
+        assert [nd.depth for nd in lay.nodes] == [0, 1, 2, 3]
+        assert [nd.height for nd in lay.nodes] == [3, 2, 1, 0]
+
+    def test_parallel_links_stack_without_gaps(self):
+        lay = _layout(["A", "B"], [(0, 1, 2.0), (0, 1, 3.0)])
+        first, second = lay.links
+        assert math.isclose(second.y0 - first.y0, (first.width + second.width) / 2)
+        a = lay.nodes[0]
+        assert math.isclose(first.width + second.width, a.y1 - a.y0)
+
+    def test_relaxation_stops_once_converged(self, monkeypatch):
+        import charted.utils.sankey_layout as sankey_layout
+
+        passes = []
+        relax = sankey_layout._relax_left_to_right
+
+        def counting(*args):
+            passes.append(1)
+            relax(*args)
+
+        monkeypatch.setattr(sankey_layout, "_relax_left_to_right", counting)
+        _layout(SIMPLE_NODES, SIMPLE_LINKS, iterations=50)
+        assert 0 < len(passes) < 50
+        passes.clear()
+        _layout(SIMPLE_NODES, SIMPLE_LINKS, iterations=50, tolerance=0.0)
+        assert len(passes) == 50
+
+    def test_large_graph_invariants(self):
+        nodes, links = _layered_graph(3000)
+        lay = _layout(nodes, links, y1=2980.0, iterations=32)
+        cols: dict[int, list] = {}
+        for nd in lay.nodes:
+            assert 20.0 - 1e-6 <= nd.y0 and nd.y1 <= 2980.0 + 1e-6
+            cols.setdefault(nd.layer, []).append(nd)
+            # Ribbons never overflow the node they stack on.
+            for stack in (nd.source_links, nd.target_links):
+                assert sum(link.width for link in stack) <= nd.y1 - nd.y0 + 1e-6
+        for col in cols.values():
+            col.sort(key=lambda nd: nd.y0)
+            for upper, lower in zip(col, col[1:]):
+                assert lower.y0 >= upper.y1 - 1e-6
+
+    def test_matches_reference_relaxation(self):
+        import random
+
+        rng = random.Random(0)
+        for _ in range(300):
+            nodes, links = _random_dag(rng)
+            alignment = rng.choice(["justify", "left", "right", "center"])
+            lay = _layout(
+                nodes,
+                links,
+                x0=0.0,
+                y0=0.0,
+                x1=600.0,
+                y1=400.0,
+                alignment=alignment,
+                tolerance=0.0,
+            )
+            top, link_y0, link_y1 = _reference_relaxation(
+                links,
+                [nd.layer for nd in lay.nodes],
+                y0=0.0,
+                y1=400.0,
+                padding=8.0,
+                iterations=6,
+            )
+            assert [nd.y0 for nd in lay.nodes] == pytest.approx(top, abs=1e-6)
+            assert [link.y0 for link in lay.links] == pytest.approx(link_y0, abs=1e-6)
+            assert [link.y1 for link in lay.links] == pytest.approx(link_y1, abs=1e-6)
+
+    def test_level_nodes_order_by_id(self):
+        # n1, n2 and n3 all settle at the top; float rounding in how their
+        # positions were summed must not decide which ribbon stacks first.
+        links = [(0, 3, 7), (1, 2, 1), (2, 3, 7), (2, 4, 7), (3, 4, 5)]
+        lay = _layout(
+            [f"n{i}" for i in range(5)],
+            links,
+            x0=0.0,
+            y0=0.0,
+            x1=600.0,
+            y1=400.0,
+            tolerance=0.0,
+        )
+        assert [nd.y0 for nd in lay.nodes] == pytest.approx(
+            [200.0, 0.0, 0.0, 0.0, 400.0 / 7], abs=1e-6
+        )
+
+    def test_chart_forwards_tolerance(self, monkeypatch):
+        import charted.utils.sankey_layout as sankey_layout
+
+        seen = {}
+        layout = sankey_layout.compute_layout
+
+        def spy(*args, **kwargs):
+            seen.update(kwargs)
+            return layout(*args, **kwargs)
+
+        monkeypatch.setattr(sankey_layout, "compute_layout", spy)
+        sankey_layout.cached_layout.cache_clear()
+        SankeyChart(nodes=["A", "B"], links=[("A", "B", 1)], tolerance=0.5)
+        assert seen["tolerance"] == 0.5
+
+
+class TestLayoutCache:
+    @pytest.fixture
+    def layout_calls(self, monkeypatch):
+        import charted.utils.sankey_layout as sankey_layout
+
+        calls = []
+        layout = sankey_layout.compute_layout
+
+        def counting(*args, **kwargs):
+            calls.append(kwargs)
+            return layout(*args, **kwargs)
+
+        monkeypatch.setattr(sankey_layout, "compute_layout", counting)
+        sankey_layout.cached_layout.cache_clear()
+        yield calls
+        sankey_layout.cached_layout.cache_clear()
+
+    def test_themed_variants_share_the_layout(self, layout_calls):
+        kw = dict(nodes=["A", "B", "C"], links=[("A", "B", 4), ("B", "C", 4)])
+        light = SankeyChart(**kw, theme="light").to_svg()
+        dark = SankeyChart(**kw, theme="dark").to_svg()
+        assert len(layout_calls) == 1
+        assert light != dark
+
+    def test_geometry_changes_miss_the_cache(self, layout_calls):
+        kw = dict(nodes=["A", "B"], links=[("A", "B", 1)])
+        SankeyChart(**kw)
+        SankeyChart(**kw, node_padding=12)
+        SankeyChart(**kw, alignment="left")
+        SankeyChart(**kw, width=600)
+        SankeyChart(nodes=["A", "B"], links=[("A", "B", 2)])
+        assert len(layout_calls) == 5
+
+    def test_cached_layout_matches_compute_layout(self):
+        from charted.utils.sankey_layout import cached_layout
+
+        frame = dict(x0=40.0, y0=20.0, x1=760.0, y1=480.0)
+        cached = cached_layout(tuple(SIMPLE_NODES), tuple(SIMPLE_LINKS), **frame)
+        fresh = _layout(SIMPLE_NODES, SIMPLE_LINKS, **frame)
+        assert [(nd.y0, nd.y1) for nd in cached.nodes] == [
+            (nd.y0, nd.y1) for nd in fresh.nodes
+        ]
+        again = cached_layout(tuple(SIMPLE_NODES), tuple(SIMPLE_LINKS), **frame)
+        assert again is cached
+
+
 # --- public API ------------------------------------------------------------
 
 
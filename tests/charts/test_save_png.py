@@ -1,5 +1,6 @@
 """Tests for Chart.save() with PNG output via extension detection."""
 
+import io
 from unittest.mock import patch
 
 import pytest
@@ -35,6 +36,33 @@ class TestSaveSVG:
         chart.save(str(path))
         assert path.exists()
 
+    def test_save_svg_matches_to_svg(self, chart, tmp_path):
+        path = tmp_path / "chart.svg"
+        chart.save(str(path))
+        assert path.read_text() == chart.to_svg()
+
+    def test_save_svg_embed_fonts_matches_to_svg(self, chart, tmp_path):
+        path = tmp_path / "chart.svg"
+        chart.save(str(path), embed_fonts=True)
+        assert path.read_text() == chart.to_svg(embed_fonts=True)
+
+
+class TestWriteSVG:
+    """``write_svg`` streams the same document ``to_svg`` returns."""
+
+    def test_text_sink(self, chart):
+        buffer = io.StringIO()
+        chart.write_svg(buffer)
+        assert buffer.getvalue() == chart.html
+
+    def test_binary_sink(self, chart):
+        buffer = io.BytesIO()
+        chart.write_svg(buffer, embed_fonts=True)
+        assert buffer.getvalue().decode("utf-8") == chart.to_svg(embed_fonts=True)
+
+    def test_iter_svg_chunks_joins_to_to_svg(self, chart):
+        assert "".join(chart.iter_svg_chunks()) == chart.to_svg()
+
 
 class TestSavePNG:
     """Tests for PNG output via cairosvg."""
@@ -187,3 +187,49 @@ class TestScatterQuadrantLabelPlacement:
         assert f'fill="{bg}"' in chart.html
         # Rounded corners and partial opacity are present on the plate.
         assert "rx=" in chart.html
+
+
+class TestScatterCompactMarks:
+    """``compact_marks`` batches a series' markers into one path."""
+
+    X = [[0, 1, 2, 3], [0, 1, 2, 3]]
+    Y = [[10, 20, 30, 40], [15, 25, 35, 45]]
+
+    def test_one_path_per_series(self):
+        chart = ScatterChart(x_data=self.X, y_data=self.Y, compact_marks=True)
+        html = chart.html
+        assert "<circle" not in html
+        assert html.count("a4 4 0 1 0 8 0") == 8
+        series_groups = chart.representation.children[0].children
+        assert [len(g.children) for g in series_groups] == [1, 1]
+
+    def test_default_keeps_one_element_per_point(self):
+        chart = ScatterChart(x_data=self.X, y_data=self.Y)
+        assert chart.html.count("<circle") == 8
+
+    def test_point_styles_split_batches(self):
+        chart = ScatterChart(
+            x_data=[0, 1, 2],
+            y_data=[1, 2, 3],
+            point_styles=[[None, {"fill": "#ff0000"}, {"marker_shape": "square"}]],
+            compact_marks=True,
+        )
+        series = chart.representation.children[0].children[0]
+        paths = [child.kwargs for child in series.children]
+        assert len(paths) == 3
+        assert paths[1]["fill"] == "#ff0000"
+        assert "h8v8h-8Z" in paths[2]["d"]
+
+    def test_shapes_match_element_markers(self):
+        chart = ScatterChart(
+            x_data=[0, 1], y_data=[1, 2], shape_cycle=["star"], compact_marks=True
+        )
+        element = chart._marker_element("star", 10, 20, 4, "#000")
+        assert chart._marker_subpath("star", 10, 20, 4) == element.kwargs["d"]
+        assert chart._marker_subpath("none", 10, 20, 4) is None
+
+    def test_tooltipped_points_keep_their_title(self):
+        chart = ScatterChart(x_data=[0, 1, 2], y_data=[1, 2, 3], compact_marks=True)
+        html = chart.to_html(tooltips=True)
+        assert html.count("<title>") >= 3
+        assert html.count("<circle") == 3
@@ -391,6 +391,120 @@ class TestDataLabelCollisionAvoidance:
         assert before > 0
         assert after < before
 
+    @staticmethod
+    def _all_pairs_deoverlap(placed, iterations=60):
+        """The exhaustive O(n^2) relaxation the grid-backed pass replaces."""
+
+        def overlap(a_cx, a_cy, a_w, a_h, b_cx, b_cy, b_w, b_h, pad=2.0):
+            ox = (a_w + b_w) / 2 + pad - abs(a_cx - b_cx)
+            oy = (a_h + b_h) / 2 + pad - abs(a_cy - b_cy)
+            return (ox, oy) if ox > 0 and oy > 0 else None
+
+        for _ in range(iterations):
+            moved = False
+            for i, a in enumerate(placed):
+                for b in placed[i + 1 :]:
+                    a_box = (a["cx"], a["cy"], a["w"], a["h"])
+                    res = overlap(*a_box, b["cx"], b["cy"], b["w"], b["h"])
+                    if res is None:
+                        continue
+                    ox, oy = res
+                    moved = True
+                    if ox < oy:
+                        sign = 1 if a["cx"] >= b["cx"] else -1
+                        a["cx"] += sign * (ox / 2 + 0.1)
+                        b["cx"] -= sign * (ox / 2 + 0.1)
+                    else:
+                        sign = 1 if a["cy"] >= b["cy"] else -1
+                        a["cy"] += sign * (oy / 2 + 0.1)
+                        b["cy"] -= sign * (oy / 2 + 0.1)
+                for b in placed:
+                    m = b["marker"] * 2
+                    res = overlap(
+                        a["cx"], a["cy"], a["w"], a["h"], b["px"], b["py"], m, m
+                    )
+                    if res is None:
+                        continue
+                    ox, oy = res
+                    moved = True
+                    if ox < oy:
+                        a["cx"] += (1 if a["cx"] >= b["px"] else -1) * (ox + 0.1)
+                    else:
+                        a["cy"] += (1 if a["cy"] >= b["py"] else -1) * (oy + 0.1)
+            for a in placed:
+                a["cx"] += (a["px"] - a["cx"]) * 0.01
+                a["cy"] += (a["py"] - a["cy"]) * 0.01
+            if not moved:
+                break
+
+    @staticmethod
+    def _random_boxes(n, seed, span):
+        import random
+
+        rng = random.Random(seed)
+        boxes = []
+        for k in range(n):
+            px, py = rng.uniform(0, span), rng.uniform(0, span * 0.6)
+            w, h, marker = rng.uniform(10, 60), 10.0, rng.choice([3.0, 4.0, 6.0])
+            off = marker + h * 0.5
+            boxes.append(
+                {
+                    "text": str(k),
+                    "px": px,
+                    "py": py,
+                    "cx": px + off + w / 2,
+                    "cy": py + off + h / 2,
+                    "w": w,
+                    "h": h,
+                    "marker": marker,
+                }
+            )
+        return boxes
+
+    @pytest.mark.parametrize("n, span", [(5, 30), (30, 200), (80, 400)])
+    def test_grid_pass_matches_all_pairs(self, n, span):
+        """Testing only nearby boxes gives exactly the exhaustive placements."""
+        import copy
+
+        for seed in range(10):
+            expected = self._random_boxes(n, seed, span)
+            actual = copy.deepcopy(expected)
+            self._all_pairs_deoverlap(expected)
+            ScatterChart._deoverlap_labels(actual)
+            assert actual == expected
+
+    def test_iteration_budget(self):
+        """The pass stops after the configured number of iterations."""
+        import copy
+
+        expected = self._random_boxes(40, 1, 100)
+        actual = copy.deepcopy(expected)
+        self._all_pairs_deoverlap(expected, iterations=2)
+        ScatterChart._deoverlap_labels(actual, iterations=2)
+        assert actual == expected
+
+    def test_time_budget_stops_after_one_pass(self):
+        """An exhausted time budget ends the pass after its first iteration."""
+        import copy
+
+        expected = self._random_boxes(40, 1, 100)
+        actual = copy.deepcopy(expected)
+        self._all_pairs_deoverlap(expected, iterations=1)
+        ScatterChart._deoverlap_labels(actual, time_budget=0.0)
+        assert actual == expected
+
+    def test_budget_options_reach_the_pass(self):
+        """ScatterChart forwards its budget options to the de-overlap pass."""
+        kwargs = dict(
+            x_data=[0, 0.01, 0.02, 0.0],
+            y_data=[0, 0.01, 0.0, 0.02],
+            data_labels=["Alpha", "Bravo", "Charlie", "Delta"],
+            avoid_label_collisions=True,
+        )
+        full = ScatterChart(**kwargs).html
+        assert ScatterChart(label_collision_iterations=60, **kwargs).html == full
+        assert ScatterChart(label_collision_iterations=1, **kwargs).html != full
+
     def test_no_labels_returns_none(self):
         """With no data labels the override produces no label group."""
         chart = ScatterChart(
@@ -0,0 +1,108 @@
+"""Tests for Chart.update_data()."""
+
+import random
+
+import pytest
+
+from charted import (
+    AreaChart,
+    BarChart,
+    ColumnChart,
+    LineChart,
+    PieChart,
+    ScatterChart,
+)
+from charted.utils.exceptions import LabelMismatchError, ValidationError
+from charted.utils.theme_manager import ThemeManager
+
+LABELS = [f"Regional operations centre number {i}" for i in range(12)]
+
+
+def _values(seed, n=12):
+    rng = random.Random(seed)
+    return [rng.uniform(-20, 120) for _ in range(n)]
+
+
+class TestUpdateData:
+    @pytest.mark.parametrize(
+        "chart_class, options",
+        [
+            (LineChart, {"labels": LABELS, "title": "Live", "theme": "dark"}),
+            (AreaChart, {"labels": LABELS}),
+            (ColumnChart, {"labels": LABELS, "height": 300}),
+        ],
+    )
+    def test_matches_new_chart(self, chart_class, options):
+        chart = chart_class(data=[_values(0), _values(1)], **options)
+        for seed in range(2, 5):
+            data = [_values(seed), _values(seed + 10)]
+            chart.update_data(y_data=data)
+            assert chart.html == chart_class(data=data, **options).html
+
+    def test_bar_values_are_x_data(self):
+        options = {"labels": LABELS, "category_label_max_width": 90}
+        chart = BarChart(data=_values(0), **options)
+        data = _values(1)
+        chart.update_data(x_data=data)
+        assert chart.html == BarChart(data=data, **options).html
+        with pytest.raises(ValidationError, match="x_data"):
+            chart.update_data(y_data=data)
+
+    def test_scatter_keeps_omitted_axis(self):
+        x, y = _values(0, 30), _values(1, 30)
+        chart = ScatterChart(x_data=x, y_data=y, title="Points")
+        new_y = _values(2, 30)
+        chart.update_data(y_data=new_y)
+        assert chart.html == ScatterChart(x_data=x, y_data=new_y, title="Points").html
+
+    def test_default_labels_follow_length(self):
+        chart = LineChart(data=_values(0, 5))
+        data = _values(1, 9)
+        assert chart.update_data(y_data=data).html == LineChart(data=data).html
+
+    def test_theme_not_reloaded(self, monkeypatch):
+        chart = LineChart(data=_values(0), labels=LABELS, theme="dark")
+        theme = chart.theme
+        monkeypatch.setattr(ThemeManager, "load_theme", None)
+        chart.update_data(y_data=_values(1))
+        assert chart.theme is theme
+
+    def test_label_mismatch_leaves_chart_unchanged(self):
+        chart = LineChart(data=_values(0), labels=LABELS)
+        before = chart.html
+        with pytest.raises(LabelMismatchError):
+            chart.update_data(y_data=_values(1, 5))
+        assert chart.html == before
+
+    @pytest.mark.parametrize(
+        "build",
+        [
+            lambda: PieChart(data=[1, 2], labels=["a", "b"]),
+            lambda: LineChart(
+                data=_values(0, 50), downsample="lttb", downsample_threshold=10
+            ),
+        ],
+    )
+    def test_unsupported_charts(self, build):
+        with pytest.raises(ValidationError, match="construct a new chart"):
+            build().update_data(y_data=[1, 2])
+
+    def test_layout_rejection_leaves_chart_unchanged(self):
+        chart = LineChart(data=[1, 10, 100], labels=["a", "b", "c"], y_scale="log")
+        before = chart.html
+        with pytest.raises(ValueError):
+            chart.update_data(y_data=[1, -1, 2])
+        assert chart.y_data == [[1, 10, 100]]
+        assert chart.html == before
+        chart.update_data(y_data=[2, 20, 200])
+        assert chart.html == LineChart(
+            data=[2, 20, 200], labels=["a", "b", "c"], y_scale="log"
+        ).html
+
+    def test_rejected_default_labels_are_restored(self):
+        chart = LineChart(data=[1, 10, 100], y_scale="log")
+        before = chart.html
+        with pytest.raises(ValueError):
+            chart.update_data(y_data=[1, -1, 2, 5])
+        assert chart.html == before
+        assert [label.text for label in chart.data_model.x_labels] == ["0", "1", "2"]
@@ -340,3 +340,148 @@ class TestBatchCommand:
             assert (
                 "error" in captured.err.lower() or "completed" in captured.out.lower()
             )
+
+
+class TestParallelBatch:
+    """Test ``--jobs`` / ``--chunksize`` process-pool rendering."""
+
+    def _run(self, input_dir, output_dir, capsys, **options):
+        import argparse
+
+        args = argparse.Namespace(
+            input_dir=str(input_dir),
+            output_dir=str(output_dir),
+            chart_type=None,
+            **options,
+        )
+        with pytest.raises(SystemExit) as exc_info:
+            batch_command(args)
+        assert exc_info.value.code == 1
+        return capsys.readouterr()
+
+    def test_parallel_matches_serial(self, tmp_path, capsys):
+        """Report, ordering and SVGs are identical to a serial run."""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for i in range(12):
+            (input_dir / f"bar_{i:02d}.csv").write_text(
+                f"label,value\nA,{i + 1}\nB,{2 * i + 3}\n"
+            )
+        (input_dir / "line_empty.csv").write_text("x\n")
+
+        serial = self._run(input_dir, tmp_path / "serial", capsys, jobs=1)
+        parallel = self._run(
+            input_dir, tmp_path / "parallel", capsys, jobs=3, chunksize=2
+        )
+
+        assert parallel.out == serial.out
+        assert parallel.err == serial.err
+        assert "Completed: 12 succeeded, 1 failed" in parallel.out
+        for svg in (tmp_path / "serial").iterdir():
+            assert (tmp_path / "parallel" / svg.name).read_text() == svg.read_text()
+
+    def test_binary_inputs_found(self, tmp_path, capsys):
+        """.npy and .npz files are picked up alongside CSV and JSON."""
+        np = pytest.importorskip("numpy")
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        np.save(input_dir / "line_a.npy", np.arange(5.0))
+        np.savez(input_dir / "bar_b.npz", x=np.ones(3), y=np.arange(3.0))
+        (input_dir / "line_empty.csv").write_text("x\n")
+
+        captured = self._run(input_dir, tmp_path / "out", capsys, jobs=1)
+
+        assert "Completed: 2 succeeded, 1 failed" in captured.out
+        assert (tmp_path / "out" / "line_a.svg").exists()
+        assert (tmp_path / "out" / "bar_b.svg").exists()
+
+    def test_invalid_jobs_rejected(self, tmp_path, capsys):
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        (input_dir / "bar.csv").write_text("label,value\nA,1\n")
+        captured = self._run(input_dir, tmp_path / "out", capsys, jobs=0)
+        assert "--jobs" in captured.err
+
+
+class TestIncrementalBatch:
+    """Test the manifest that skips unchanged inputs."""
+
+    def _run(self, input_dir, output_dir, capsys, **options):
+        import argparse
+
+        args = argparse.Namespace(
+            input_dir=str(input_dir),
+            output_dir=str(output_dir),
+            chart_type=None,
+            **options,
+        )
+        batch_command(args)
+        return capsys.readouterr().out
+
+    @pytest.fixture
+    def dirs(self, tmp_path):
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for name in ("bar_a", "bar_b", "line_c"):
+            (input_dir / f"{name}.csv").write_text("label,value\nA,1\nB,2\n")
+        return input_dir, tmp_path / "output"
+
+    def test_second_run_skips_everything(self, dirs, capsys):
+        self._run(*dirs, capsys)
+        out = self._run(*dirs, capsys)
+        assert "Created" not in out
+        assert "Completed: 0 succeeded, 0 failed, 3 unchanged" in out
+
+    def test_changed_input_rerendered(self, dirs, capsys):
+        input_dir, output_dir = dirs
+        self._run(*dirs, capsys)
+        (input_dir / "bar_b.csv").write_text("label,value\nA,1\nB,3\n")
+        out = self._run(*dirs, capsys)
+        assert "Created: bar_b.svg" in out
+        assert "1 succeeded, 0 failed, 2 unchanged" in out
+
+    def test_missing_output_rerendered(self, dirs, capsys):
+        input_dir, output_dir = dirs
+        self._run(*dirs, capsys)
+        (output_dir / "line_c.svg").unlink()
+        out = self._run(*dirs, capsys)
+        assert "Created: line_c.svg" in out
+        assert (output_dir / "line_c.svg").exists()
+
+    def test_force_and_version_change_rerender(self, dirs, capsys, monkeypatch):
+        self._run(*dirs, capsys)
+        assert "3 succeeded" in self._run(*dirs, capsys, force=True)
+        monkeypatch.setattr("charted.__version__", "0.0.0-test")
+        assert "3 succeeded" in self._run(*dirs, capsys)
+
+    def test_corrupt_manifest_ignored(self, dirs, capsys):
+        from charted.cli.batch import MANIFEST_NAME
+
+        input_dir, output_dir = dirs
+        self._run(*dirs, capsys)
+        (output_dir / MANIFEST_NAME).write_text("{not json")
+        assert "3 succeeded" in self._run(*dirs, capsys)
+
+    @pytest.mark.parametrize("streamed", [True, False])
+    def test_cache_key_streams_input(self, tmp_path, monkeypatch, streamed):
+        """Inputs are hashed in chunks rather than read into memory whole."""
+        import hashlib
+        import sys
+
+        from charted.cli import batch
+
+        data = tmp_path / "big.csv"
+        data.write_bytes(b"label,value\n" + b"a,1\n" * 100_000)
+        expected = batch._cache_key(data, "bar", "s")
+
+        def fail(self):
+            raise AssertionError("read_bytes() loads the whole file")
+
+        monkeypatch.setattr(Path, "read_bytes", fail)
+        monkeypatch.setattr(batch, "HASH_CHUNK_SIZE", 4096)
+        if not streamed:
+            monkeypatch.setattr(sys, "version_info", (3, 10))
+        content = hashlib.sha256(b"label,value\n" + b"a,1\n" * 100_000).hexdigest()
+
+        assert batch._file_digest(data) == content
+        assert batch._cache_key(data, "bar", "s") == expected
@@ -106,6 +106,27 @@ class TestLoadData:
             result = load_data(str(data_file))
             assert result == {"data": []}
 
+    def test_load_npz_series(self, tmp_path):
+        """Each numeric array in an .npz becomes a named series."""
+        np = pytest.importorskip("numpy")
+        data_file = tmp_path / "metrics.npz"
+        np.savez(data_file, cpu=np.array([1.0, 2.0]), mem=np.array([3.0, 4.0]))
+
+        result = load_data(str(data_file))
+
+        assert [row.tolist() for row in result["data"]] == [[1.0, 2.0], [3.0, 4.0]]
+        assert result["series_names"] == ["cpu", "mem"]
+        assert "labels" not in result
+
+    def test_load_npy_without_numeric_data(self, tmp_path):
+        """A .npy of an unsupported dtype reports the dtype."""
+        np = pytest.importorskip("numpy")
+        data_file = tmp_path / "names.npy"
+        np.save(data_file, np.array(["a", "b"]))
+
+        with pytest.raises(ValueError, match="Unsupported dtype"):
+            load_data(str(data_file))
+
 
 class TestParseCSV:
     """Test CSV parsing function."""
@@ -310,6 +331,25 @@ class TestCreateCommand:
 
             assert output_file.exists()
 
+    def test_create_with_npy_data(self, tmp_path):
+        """A .npy file renders like the same values from CSV."""
+        np = pytest.importorskip("numpy")
+        np.save(tmp_path / "data.npy", np.array([10.0, 20.0, 30.0]))
+        (tmp_path / "data.csv").write_text("label,value\n0,10\n1,20\n2,30")
+
+        for name in ("data.npy", "data.csv"):
+            create_command(
+                _ns(
+                    chart_type="line",
+                    output=str(tmp_path / f"{name}.svg"),
+                    data=str(tmp_path / name),
+                )
+            )
+
+        assert (tmp_path / "data.npy.svg").read_text() == (
+            tmp_path / "data.csv.svg"
+        ).read_text()
+
     def test_create_creates_parent_directories(self):
         """Test that create command creates parent directories."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,207 @@
+"""Tests for the binary precompiled font definition format."""
+
+import json
+import os
+import shutil
+import warnings
+from pathlib import Path
+
+import pytest
+
+from charted.fonts.compiled import (
+    CompiledDefinition,
+    CompiledFontError,
+    compile_definitions,
+    compiled_path,
+    encode_definition,
+    source_digest,
+)
+from charted.fonts.metrics import registry
+from charted.fonts.wrapper import Font
+from charted.utils.defaults import BASE_DEFINITIONS_DIR
+
+
+@pytest.fixture
+def definitions_dir(tmp_path):
+    """A private copy of the shipped JSON definitions."""
+    for name in ("DejaVu Sans.json", "Arial.json"):
+        shutil.copy(Path(BASE_DEFINITIONS_DIR) / name, tmp_path / name)
+    yield tmp_path
+    registry.clear()
+
+
+class TestEncodeDefinition:
+    def test_round_trip_preserves_values_and_types(self, tmp_path):
+        source = {
+            "12": {
+                "97": {"width": 7, "height": 14},
+                "98": {"width": 6.5, "height": 14.0},
+            },
+            "8": {"65": {"width": 5, "height": 9}},
+        }
+        path = tmp_path / "Test.bin"
+        path.write_bytes(encode_definition(source))
+
+        loaded = CompiledDefinition(path).to_definition()
+
+        assert loaded == source
+        assert type(loaded["12"]["97"]["width"]) is int
+        assert type(loaded["12"]["98"]["height"]) is float
+
+    def test_accepts_generator_int_keys(self, tmp_path):
+        path = tmp_path / "Test.bin"
+        path.write_bytes(encode_definition({10: {65: {"width": 6, "height": 11}}}))
+
+        assert CompiledDefinition(path).to_definition() == {
+            "10": {"65": {"width": 6, "height": 11}}
+        }
+
+    def test_mixed_and_sparse_glyphs_round_trip(self, tmp_path):
+        """Codepoints past the dense range and mixed int/float columns survive."""
+        source = {
+            "12": {
+                "65": {"width": 7, "height": 14},
+                "66": {"width": 6.5, "height": 14},
+                "10003": {"width": 11, "height": 13.5},
+            }
+        }
+        path = tmp_path / "Test.bin"
+        path.write_bytes(encode_definition(source))
+
+        compiled = CompiledDefinition(path)
+        table = compiled.table("12")
+
+        assert compiled.to_definition() == source
+        assert table.mixed
+        assert table.lookup(10003) == (11, 13.5)
+        assert table.lookup(10004) is None
+        assert table.lookup(67) is None
+
+    def test_records_source_digest(self, tmp_path):
+        data = b'{"12": {"65": {"width": 6, "height": 11}}}'
+        path = tmp_path / "Test.bin"
+        path.write_bytes(encode_definition(json.loads(data), source_digest(data)))
+
+        compiled = CompiledDefinition(path)
+
+        assert compiled.matches(data)
+        assert not compiled.matches(data + b" ")
+
+    def test_missing_size_has_no_table(self, tmp_path):
+        path = tmp_path / "Test.bin"
+        path.write_bytes(encode_definition({"12": {"65": {"width": 6, "height": 11}}}))
+
+        compiled = CompiledDefinition(path)
+        assert compiled.sizes() == ["12"]
+        assert compiled.table("14") is None
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "Test.bin"
+        path.write_bytes(b"not a compiled font at all")
+
+        with pytest.raises(CompiledFontError):
+            CompiledDefinition(path)
+
+    def test_is_much_smaller_than_json(self):
+        source = Path(BASE_DEFINITIONS_DIR) / "DejaVu Sans.json"
+        with open(source) as f:
+            encoded = encode_definition(json.load(f))
+        assert len(encoded) < source.stat().st_size / 2
+
+
+class TestCompiledLoading:
+    def test_compile_definitions_writes_one_file_per_family(self, definitions_dir):
+        written = compile_definitions(definitions_dir)
+
+        assert sorted(p.name for p in written) == ["Arial.bin", "DejaVu Sans.bin"]
+
+    def test_font_prefers_compiled_file(self, definitions_dir):
+        compile_definitions(definitions_dir)
+
+        Font(family="Arial", definitions_dir=str(definitions_dir))
+        source = registry.family("Arial", str(definitions_dir)).source
+
+        assert isinstance(source, CompiledDefinition)
+
+    def test_measurements_match_json(self, definitions_dir):
+        text = "Revenue (£, 2024) ✓ 世界"
+        from_json = [
+            Font(
+                family=family, size=size, definitions_dir=str(definitions_dir)
+            ).measure(text)
+            for family in ("Arial", "DejaVu Sans")
+            for size in (8, 12, 12.0, 20, 30)
+        ]
+        registry.clear()
+        compile_definitions(definitions_dir)
+        from_binary = [
+            Font(
+                family=family, size=size, definitions_dir=str(definitions_dir)
+            ).measure(text)
+            for family in ("Arial", "DejaVu Sans")
+            for size in (8, 12, 12.0, 20, 30)
+        ]
+
+        assert from_binary == from_json
+        assert [tuple(map(type, m)) for m in from_binary] == [
+            tuple(map(type, m)) for m in from_json
+        ]
+
+    def test_stale_compiled_file_is_ignored(self, definitions_dir):
+        compile_definitions(definitions_dir)
+        json_path = definitions_dir / "Arial.json"
+        definition = json.loads(json_path.read_text())
+        definition["12"]["97"]["width"] = 99
+        json_path.write_text(json.dumps(definition))
+
+        font = Font(family="Arial", size=12, definitions_dir=str(definitions_dir))
+        source = registry.family("Arial", str(definitions_dir)).source
+
+        assert isinstance(source, dict)
+        assert font.measure("a")[0] == 99
+
+    def test_older_timestamp_does_not_make_binary_stale(self, definitions_dir):
+        """Checkouts reset mtimes; only the content decides staleness."""
+        compile_definitions(definitions_dir)
+        json_path = definitions_dir / "Arial.json"
+        binary = compiled_path(json_path)
+        older = json_path.stat().st_mtime - 60
+        os.utime(binary, (older, older))
+
+        Font(family="Arial", definitions_dir=str(definitions_dir))
+        source = registry.family("Arial", str(definitions_dir)).source
+
+        assert isinstance(source, CompiledDefinition)
+
+    def test_measures_from_mapped_tables(self, definitions_dir):
+        """Compiled metrics are views of the mapping, not per-process copies."""
+        compile_definitions(definitions_dir)
+
+        metrics = registry.metrics("Arial", 12, str(definitions_dir))
+
+        assert isinstance(metrics.widths, memoryview)
+        assert isinstance(metrics.heights, memoryview)
+
+    def test_corrupt_compiled_file_falls_back_to_json(self, definitions_dir):
+        compiled_path(definitions_dir / "Arial.json").write_bytes(b"garbage")
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            font = Font(family="Arial", definitions_dir=str(definitions_dir))
+
+        assert font.measure("abc")[0] > 0
+        assert isinstance(registry.family("Arial", str(definitions_dir)).source, dict)
+
+    def test_compiled_file_alone_is_enough(self, definitions_dir):
+        compile_definitions(definitions_dir)
+        expected = Font(family="Arial", definitions_dir=str(definitions_dir)).measure(
+            "abc"
+        )
+        registry.clear()
+        (definitions_dir / "Arial.json").unlink()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            font = Font(family="Arial", definitions_dir=str(definitions_dir))
+
+        assert font.measure("abc") == expected
@@ -155,3 +155,59 @@ class TestFont:
         width, height = font.measure("Hello 世界")
         assert width > 0
         assert height > 0
+
+
+class TestFontMetricsRegistry:
+    """Test the shared compiled metric tables behind Font."""
+
+    def test_fonts_share_compiled_tables(self):
+        """Two Font instances measure against the same compiled table."""
+        from charted.fonts.metrics import registry
+
+        Font(family="Arial", size=12).measure("abc")
+        Font(family="Arial", size=12).measure("xyz")
+        first = registry.metrics("Arial", 12, Font().definitions_dir)
+        second = registry.metrics("Arial", 12, Font().definitions_dir)
+        assert first is not None
+        assert first is second
+
+    def test_measure_matches_definition_lookup(self):
+        """Compiled lookups agree with reading the definition directly."""
+        font = Font(family="DejaVu Sans", size=12)
+        glyphs = font.definitions["12"]
+        text = "Revenue (£, 2024) — Q1/Q2 ✓"
+        width, height = font.measure(text)
+        expected_width = 0
+        expected_height = 0
+        for char in text:
+            metrics = glyphs.get(str(ord(char)))
+            if metrics is None:
+                expected_width += 5
+                expected_height = max(expected_height, 9)
+            else:
+                expected_width += metrics["width"]
+                expected_height = max(expected_height, metrics["height"])
+        assert width == expected_width
+        assert height == expected_height
+
+    def test_measure_preserves_definition_value_types(self):
+        """Int metrics stay ints so SVG coordinates format unchanged."""
+        font = Font(family="Arial", size=12)
+        width, height = font.measure("abc")
+        assert type(width) is int
+        assert type(height) is int
+
+    def test_float_size_does_not_share_int_table(self):
+        """A float size resolves its own (absent) entry, as the JSON keys do."""
+        font = Font(family="Arial", size=12)
+        assert font.measure("abc", size=12.0) != font.measure("abc", size=12)
+
+    def test_missing_font_warns_on_every_construction(self):
+        """The fallback warning is not swallowed by the shared cache."""
+        import warnings
+
+        for _ in range(2):
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                Font(family="NonExistentFont12345")
+                assert len(w) == 1
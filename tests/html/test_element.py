@@ -1,4 +1,6 @@
-from charted.html.element import Element, G, Path, Svg, Text
+import io
+
+from charted.html.element import Element, G, Path, Svg, Text, write_chunks
 
 
 class TestElement:
@@ -85,3 +87,101 @@ class TestText:
     def test_text(self):
         instance = self.cls(text="foobar")
         assert instance.html == f"<{self.tag}>foobar</{self.tag}>"
+
+
+class TestStreaming:
+    def _tree(self):
+        root = G(id="root")
+        for i in range(50):
+            group = G(id=f"g{i}")
+            group.add_children(Path(d=f"M{i} 0"), Text(text=f"label <{i}>"))
+            root.add_child(group)
+        return root
+
+    def test_iter_chunks_matches_html(self):
+        root = self._tree()
+        assert "".join(root.iter_chunks()) == root.html
+
+    def test_iter_chunks_leaf(self):
+        assert list(Path(d="M0 0").iter_chunks()) == ['<path d="M0 0"/>']
+
+    def test_write_to_text_sink(self):
+        root = self._tree()
+        buffer = io.StringIO()
+        root.write_to(buffer)
+        assert buffer.getvalue() == root.html
+
+    def test_write_to_binary_sink(self):
+        root = self._tree()
+        buffer = io.BytesIO()
+        root.write_to(buffer)
+        assert buffer.getvalue() == root.html.encode("utf-8")
+
+    def test_write_to_small_buffer_batches_writes(self):
+        root = self._tree()
+        writes = []
+
+        class Sink(io.StringIO):
+            def write(self, data):
+                writes.append(data)
+                return super().write(data)
+
+        sink = Sink()
+        root.write_to(sink, buffer_size=64)
+        assert sink.getvalue() == root.html
+        assert len(writes) > 1
+
+    def test_deep_nesting_does_not_recurse(self):
+        root = G()
+        node = root
+        for _ in range(5000):
+            child = G()
+            node.add_child(child)
+            node = child
+        node.add_child(Path(d="M0 0"))
+        markup = "".join(root.iter_chunks())
+        assert markup.startswith("<g><g>")
+        assert markup.count("</g>") == 5001
+
+    def test_write_chunks_empty(self):
+        buffer = io.StringIO()
+        write_chunks(buffer, [])
+        assert buffer.getvalue() == ""
+
+
+class TestAttributeCache:
+    def test_attributes_cached_until_kwargs_change(self):
+        element = Path(d="M0 0", fill="red")
+        first = element.attributes
+        assert element.attributes is first
+        element.kwargs["fill"] = "blue"
+        assert element.html == '<path d="M0 0" fill="blue"/>'
+        del element.kwargs["fill"]
+        assert element.html == '<path d="M0 0"/>'
+        element.kwargs.update(stroke_width="2")
+        assert element.html == '<path d="M0 0" stroke-width="2"/>'
+
+    def test_kwargs_reassignment(self):
+        element = Path(d="M0 0")
+        _ = element.html
+        element.kwargs = {"d": "M1 1"}
+        assert element.html == '<path d="M1 1"/>'
+
+    def test_nodes_are_slotted(self):
+        assert not hasattr(Path(d="M0 0"), "__dict__")
+        assert not hasattr(G(), "__dict__")
+
+    def test_subclass_default_kwargs(self):
+        class Marker(Element):
+            tag = "marker"
+            kwargs = {"orient": "auto"}
+
+        assert Marker(id="m").html == '<marker orient="auto" id="m"/>'
+        assert Marker().kwargs is not Marker().kwargs
+
+    def test_subclass_skipping_init_starts_from_defaults(self):
+        class Bare(Svg):
+            def __init__(self):
+                pass
+
+        assert Bare().html == '<svg xmlns="http://www.w3.org/2000/svg"/>'
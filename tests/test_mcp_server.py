@@ -3,9 +3,18 @@
 Tests the tool handler functions directly without MCP transport.
 """
 
+import asyncio
+import json
+import threading
+import time
+
 import pytest
 
+from mcp_server import server
+from mcp_server.cache import ResultCache, cache_bytes_from_env, make_key
 from mcp_server.tools import (
+    RESULT_CACHE,
+    handle_cache_stats,
     handle_chart_from_csv,
     handle_create_chart,
     handle_list_chart_types,
@@ -258,3 +267,191 @@ class TestChartFromCsv:
     def test_invalid_csv_raises(self):
         with pytest.raises((ValueError, Exception)):
             handle_chart_from_csv(csv_data="no-header-single-word", chart_type="bar")
+
+    def test_mixed_column_becomes_labels(self):
+        csv_data = "Code,Value\n10,1\n20,2\nX30,3\n\n"
+        expected = handle_create_chart(
+            chart_type="bar", data=[1.0, 2.0, 3.0], labels=["10", "20", "X30"]
+        )
+        assert handle_chart_from_csv(csv_data, chart_type="bar") == expected
+
+    def test_max_rows_head(self):
+        rows = "\n".join(f"r{i},{i}" for i in range(100))
+        capped = handle_chart_from_csv(f"k,v\n{rows}", chart_type="line", max_rows=10)
+        expected = handle_create_chart(
+            chart_type="line",
+            data=[float(i) for i in range(10)],
+            labels=[f"r{i}" for i in range(10)],
+        )
+        assert capped == expected
+
+    def test_max_rows_uniform(self):
+        rows = "\n".join(f"r{i},{i}" for i in range(100))
+        sampled = handle_chart_from_csv(
+            f"k,v\n{rows}", chart_type="line", max_rows=10, sample="uniform"
+        )
+        expected = handle_create_chart(
+            chart_type="line",
+            data=[float(i) for i in range(0, 100, 10)],
+            labels=[f"r{i}" for i in range(0, 100, 10)],
+        )
+        assert sampled == expected
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"max_rows": 0}, "max_rows"),
+            ({"sample": "random"}, "Invalid sample"),
+            ({"y_columns": ["Name"]}, "non-numeric"),
+            ({"x_column": "Missing"}, "not found"),
+        ],
+    )
+    def test_invalid_options_rejected(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            handle_chart_from_csv("Name,Value\nA,1\nB,2", **kwargs)
+
+
+class TestServerDispatch:
+    """call_tool runs chart handlers in the bounded pool."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_pool(self):
+        yield
+        server._shutdown_executor()
+
+    def _slow_handler(self, delay):
+        def handler(**kwargs):
+            time.sleep(delay)
+            return f"<svg>{threading.current_thread().name}</svg>"
+
+        return handler
+
+    def test_handler_runs_off_event_loop(self):
+        result = asyncio.run(
+            server.call_tool("create_chart", {"chart_type": "bar", "data": [1, 2, 3]})
+        )
+        assert "<svg" in result[0].text
+        assert server._executor is not None
+
+    def test_slow_calls_overlap(self, monkeypatch):
+        monkeypatch.setattr(server, "handle_create_chart", self._slow_handler(0.3))
+        args = {"chart_type": "bar", "data": [1]}
+
+        async def run():
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                server.call_tool("create_chart", args),
+                server.call_tool("create_chart", args),
+                server.call_tool("list_themes", {}),
+            )
+            return results, time.perf_counter() - start
+
+        results, elapsed = asyncio.run(run())
+        assert elapsed < 0.55
+        assert all("charted-mcp" in r[0].text for r in results[:2])
+
+    def test_concurrency_limit(self, monkeypatch):
+        monkeypatch.setenv(server.MAX_WORKERS_ENV, "1")
+        monkeypatch.setattr(server, "handle_create_chart", self._slow_handler(0.2))
+        args = {"chart_type": "bar", "data": [1]}
+
+        async def run():
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(server.call_tool("create_chart", args) for _ in range(3))
+            )
+            return time.perf_counter() - start
+
+        assert asyncio.run(run()) >= 0.6
+
+    def test_timeout_reported_as_error(self, monkeypatch):
+        monkeypatch.setenv(server.TIMEOUT_ENV, "0.05")
+        monkeypatch.setattr(server, "handle_chart_from_csv", self._slow_handler(0.5))
+        result = asyncio.run(server.call_tool("chart_from_csv", {"csv_data": "a\n1"}))
+        assert result[0].text == "Error: chart rendering timed out after 0.05s"
+
+    def test_invalid_worker_count(self, monkeypatch):
+        monkeypatch.setenv(server.MAX_WORKERS_ENV, "0")
+        result = asyncio.run(
+            server.call_tool("create_chart", {"chart_type": "bar", "data": [1]})
+        )
+        assert "CHARTED_MCP_MAX_WORKERS must be at least 1" in result[0].text
+
+
+class TestResultCache:
+    """Repeated tool calls are served from the LRU result cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        RESULT_CACHE.clear()
+        yield
+        RESULT_CACHE.clear()
+
+    def test_repeated_call_hits(self):
+        args = {"chart_type": "bar", "data": [3, 1, 2], "labels": ["a", "b", "c"]}
+        first = handle_create_chart(**args)
+        second = handle_create_chart(**args)
+        assert second is first
+        stats = handle_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["bytes"] == len(first)
+
+    def test_any_argument_change_misses(self):
+        handle_create_chart(chart_type="bar", data=[1, 2])
+        handle_create_chart(chart_type="bar", data=[1, 2], title="T")
+        handle_create_chart(chart_type="bar", data=[1, 2], output_format="html")
+        assert handle_cache_stats()["misses"] == 3
+
+    def test_csv_calls_cached(self):
+        csv_data = "Name,Value\nAlpha,10\nBeta,20"
+        assert handle_chart_from_csv(csv_data) == handle_chart_from_csv(csv_data)
+        assert handle_cache_stats()["hits"] == 1
+
+    def test_save_path_bypasses_cache(self, tmp_path):
+        path = tmp_path / "chart.svg"
+        for _ in range(2):
+            handle_create_chart(chart_type="bar", data=[1], save_path=str(path))
+            assert path.exists()
+            path.unlink()
+        assert handle_cache_stats()["entries"] == 0
+
+    def test_key_ignores_argument_order(self):
+        assert make_key("t", {"a": 1, "b": [1, 2]}) == make_key(
+            "t", {"b": [1, 2], "a": 1}
+        )
+        assert make_key("t", {"a": object()}) is None
+
+    def test_evicts_least_recently_used_by_size(self):
+        cache = ResultCache(max_bytes=10)
+        cache.get_or_compute("a", lambda: "aaaa")
+        cache.get_or_compute("b", lambda: "bbbb")
+        cache.get_or_compute("a", lambda: "never")
+        cache.get_or_compute("c", lambda: "cccc")
+        stats = cache.stats()
+        assert (stats["entries"], stats["bytes"], stats["evictions"]) == (2, 8, 1)
+        assert cache.get_or_compute("a", lambda: "miss") == "aaaa"
+        assert cache.get_or_compute("b", lambda: "miss") == "miss"
+
+    def test_oversized_result_not_stored(self):
+        cache = ResultCache(max_bytes=3)
+        assert cache.get_or_compute("a", lambda: "abcd") == "abcd"
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.parametrize(
+        "value, message",
+        [("lots", "must be a whole number of bytes"), ("-1", "must be at least 0")],
+    )
+    def test_invalid_cache_budget(self, monkeypatch, value, message):
+        monkeypatch.setenv("CHARTED_MCP_CACHE_BYTES", value)
+        with pytest.raises(ValueError, match=f"CHARTED_MCP_CACHE_BYTES {message}"):
+            cache_bytes_from_env()
+
+    def test_cache_budget_from_env(self, monkeypatch):
+        monkeypatch.delenv("CHARTED_MCP_CACHE_BYTES", raising=False)
+        assert cache_bytes_from_env() == 64 * 1024 * 1024
+        monkeypatch.setenv("CHARTED_MCP_CACHE_BYTES", "0")
+        assert cache_bytes_from_env() == 0
+
+    def test_cache_stats_tool(self):
+        result = asyncio.run(server.call_tool("cache_stats", {}))
+        assert json.loads(result[0].text)["max_bytes"] == RESULT_CACHE.max_bytes
@@ -341,3 +341,47 @@ class TestResolvePalette:
         """Unknown palette name raises ValueError."""
         with pytest.raises(ValueError, match="Unknown palette"):
             resolve_palette("nonexistent")
+
+
+class TestThemeSharing:
+    """Themes are immutable, so presets and derived values can be shared."""
+
+    def test_preset_is_shared(self):
+        """from_preset returns the same instance every time."""
+        assert Theme.from_preset("dark") is Theme.from_preset("dark")
+
+    def test_colors_are_read_only(self):
+        """Mutating a theme's colors in place raises instead of leaking."""
+        theme = Theme.from_preset("light")
+
+        with pytest.raises(TypeError, match="read-only"):
+            theme.colors.append("#000000")
+        with pytest.raises(TypeError, match="read-only"):
+            theme.colors[0] = "#000000"
+
+    def test_theme_is_hashable(self):
+        """Equal themes hash equally."""
+        assert hash(Theme(colors=["#a1b2c3"])) == hash(Theme(colors=["#a1b2c3"]))
+
+    def test_resolved_values_are_memoized(self):
+        """A resolved value is computed once per theme."""
+        theme = Theme(root_color="#336699")
+
+        assert theme.resolved_grid_color is theme.resolved_grid_color
+
+    def test_round_trip_after_resolving(self):
+        """Memoized values do not leak into vars()-based reconstruction."""
+        theme = Theme(title_color="#123456")
+        _ = theme.resolved_axis_title_color
+
+        assert Theme(**vars(theme)) == theme
+
+    def test_cycle_color(self):
+        """cycle_color still wraps around the palette."""
+        theme = Theme(colors=["#aaaaaa", "#bbbbbb"])
+
+        assert [theme.cycle_color(i) for i in range(3)] == [
+            "#aaaaaa",
+            "#bbbbbb",
+            "#aaaaaa",
+        ]
@@ -0,0 +1,156 @@
+"""Tests for zero-copy buffer-protocol chart data."""
+
+import array
+import json
+
+import pytest
+
+from charted.charts.bar import BarChart
+from charted.charts.column import ColumnChart
+from charted.charts.histogram import Histogram
+from charted.charts.line import LineChart
+from charted.charts.scatter import ScatterChart
+from charted.utils.buffers import SeriesView, as_chart_data, materialize
+from charted.utils.data_model import DataModel
+from charted.utils.exceptions import InvalidDataError
+
+np = pytest.importorskip("numpy")
+
+
+class TestSeriesView:
+    def test_behaves_like_list(self):
+        view = as_chart_data(array.array("d", [1.5, 2.5, 3.5]))
+        assert isinstance(view, SeriesView)
+        assert len(view) == 3
+        assert view[1] == 2.5
+        assert view[1:] == [2.5, 3.5]
+        assert list(view) == [1.5, 2.5, 3.5]
+        assert view == [1.5, 2.5, 3.5]
+        assert view.tolist() == [1.5, 2.5, 3.5]
+
+    def test_integer_buffer_yields_ints(self):
+        view = as_chart_data(memoryview(array.array("i", [1, 2, 3])))
+        assert view.tolist() == [1, 2, 3]
+        assert all(type(v) is int for v in view)
+
+    def test_numpy_array_is_not_copied(self):
+        values = np.arange(1000, dtype=np.float64)
+        model = DataModel(y_data=values)
+        assert isinstance(model.y_data[0], SeriesView)
+        assert np.shares_memory(np.asarray(model.y_data[0]), values)
+
+    def test_2d_rows_view_same_buffer(self):
+        values = np.arange(12, dtype=np.float64).reshape(3, 4)
+        rows = as_chart_data(values)
+        assert [row.tolist() for row in rows] == values.tolist()
+        assert all(np.shares_memory(np.asarray(row), values) for row in rows)
+
+    def test_list_of_arrays(self):
+        rows = as_chart_data([np.arange(3.0), np.arange(3.0) * 2])
+        assert [row.tolist() for row in rows] == [[0, 1, 2], [0, 2, 4]]
+
+    def test_non_contiguous_array_copied_once(self):
+        values = np.arange(20, dtype=np.float64)[::2]
+        assert as_chart_data(values).tolist() == values.tolist()
+
+    def test_float16_copied_to_float64(self):
+        # memoryview cannot index half floats, so they take the copy path.
+        values = np.array([1.5, 2.0, 3.25], dtype=np.float16)
+        view = as_chart_data(values)
+        assert view.tolist() == [1.5, 2.0, 3.25]
+        labels = ["a", "b", "c"]
+        assert (
+            LineChart(data=values, labels=labels).html
+            == LineChart(data=values.tolist(), labels=labels).html
+        )
+
+    def test_lists_unchanged(self):
+        data = [1, 2, 3]
+        assert as_chart_data(data) is data
+
+    def test_list_of_numpy_scalars_unchanged(self):
+        data = list(np.arange(3.0))
+        assert as_chart_data(data) is data
+
+    def test_three_dimensions_rejected(self):
+        with pytest.raises(InvalidDataError, match="two-dimensional"):
+            as_chart_data(np.zeros((2, 2, 2)))
+
+    def test_object_array_rejected(self):
+        with pytest.raises(InvalidDataError, match="expected numeric"):
+            as_chart_data(np.array(["a", "b"], dtype=object))
+
+
+class TestValidation:
+    @pytest.mark.parametrize("engine", ["numpy", "python"])
+    def test_bounds_recorded(self, monkeypatch, engine):
+        if engine == "python":
+            monkeypatch.setenv("CHARTED_NO_NUMPY", "1")
+        model = DataModel(y_data=np.array([[3.0, -1.0], [7.5, 2.0]]))
+        assert [(r.minimum, r.maximum) for r in model.y_data] == [
+            (-1.0, 3.0),
+            (2.0, 7.5),
+        ]
+
+    @pytest.mark.parametrize("engine", ["numpy", "python"])
+    @pytest.mark.parametrize(
+        "bad, message", [(float("nan"), "NaN"), (float("inf"), "Infinite")]
+    )
+    def test_non_finite_rejected(self, monkeypatch, engine, bad, message):
+        if engine == "python":
+            monkeypatch.setenv("CHARTED_NO_NUMPY", "1")
+        values = np.ones(500)
+        values[250] = bad
+        with pytest.raises(InvalidDataError, match=message):
+            DataModel(y_data=values)
+
+    def test_mismatched_rows_rejected(self):
+        with pytest.raises(InvalidDataError, match="same length"):
+            DataModel(y_data=[np.arange(3.0), np.arange(4.0)])
+
+
+class TestCharts:
+    """Buffer input renders exactly like the equivalent list input."""
+
+    def test_line(self):
+        values = np.sin(np.arange(200) / 10) * 50
+        assert LineChart(data=values).html == LineChart(data=values.tolist()).html
+
+    def test_column_stacked(self):
+        values = np.arange(1.0, 13.0).reshape(3, 4)
+        assert ColumnChart(data=values).html == ColumnChart(data=values.tolist()).html
+
+    def test_bar(self):
+        values = np.array([4.0, -2.0, 7.0])
+        labels = ["a", "b", "c"]
+        assert (
+            BarChart(data=values, labels=labels).html
+            == BarChart(data=values.tolist(), labels=labels).html
+        )
+
+    def test_scatter(self):
+        rng = np.random.default_rng(5)
+        x, y = rng.normal(size=300), rng.normal(size=300)
+        assert (
+            ScatterChart(x_data=x, y_data=y).html
+            == ScatterChart(x_data=x.tolist(), y_data=y.tolist()).html
+        )
+
+    def test_histogram(self):
+        values = np.random.default_rng(6).normal(size=2000)
+        assert Histogram(data=values).html == Histogram(data=values.tolist()).html
+
+    def test_array_array_with_downsample(self):
+        values = array.array("d", (float(i % 97) for i in range(5000)))
+        chart = LineChart(data=values, downsample="minmax", downsample_threshold=50)
+        assert len(chart.y_values[0]) <= 50
+
+    def test_config_materializes_lists(self):
+        chart = LineChart(data=np.arange(5.0))
+        cfg = chart.to_config()
+        assert cfg["y_data"] == [[0.0, 1.0, 2.0, 3.0, 4.0]]
+        json.dumps(cfg["y_data"])
+
+    def test_materialize_keeps_lists(self):
+        row = [1.0, 2.0]
+        assert materialize([row])[0] is row
@@ -1,10 +1,23 @@
 """Tests for data loading utilities."""
 
+import gzip
 import json
+import sys
+from array import array
 
 import pytest
 
-from charted import load_csv, load_data, load_json
+from charted import (
+    LineChart,
+    data_loader,
+    load_columns,
+    load_csv,
+    load_data,
+    load_json,
+    stream_csv,
+)
+from charted.data_loader import BadRow
+from charted.utils.buffers import SeriesView
 
 
 class TestLoadData:
@@ -177,3 +190,233 @@ class TestLoadJSON:
 
         assert x == ["0", "1", "2"]
         assert y == [1.0, 2.0, 3.0]
+
+
+class TestStreamCsv:
+    """Tests for the streaming, column-projecting CSV loader."""
+
+    CSV = "ts,host,latency,bytes\nt1,a,1.5,10\nt2,b,2.5,20\nt3,c,3.5,30\n"
+
+    def test_projects_requested_columns(self, tmp_path):
+        csv_file = tmp_path / "log.csv"
+        csv_file.write_text(self.CSV)
+
+        result = stream_csv(csv_file, ["latency", "bytes"], label_col="ts")
+
+        assert list(result.columns) == ["latency", "bytes"]
+        assert result.columns["latency"] == array("d", [1.5, 2.5, 3.5])
+        assert result.columns["bytes"] == array("d", [10, 20, 30])
+        assert result.labels == ["t1", "t2", "t3"]
+        assert result.rows == 3
+        assert result.bad_row_count == 0
+
+    def test_gzip_is_transparent(self, tmp_path):
+        csv_file = tmp_path / "log.csv.gz"
+        csv_file.write_bytes(gzip.compress(self.CSV.encode()))
+
+        result = stream_csv(csv_file, ["latency"])
+        x, y, _ = load_data(csv_file, x_col="host", y_col="bytes")
+
+        assert result.columns["latency"].tolist() == [1.5, 2.5, 3.5]
+        assert x == ["a", "b", "c"]
+        assert y == [10.0, 20.0, 30.0]
+
+    def test_zstd_is_transparent(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        csv_file = tmp_path / "log.tsv.zst"
+        tsv = self.CSV.replace(",", "\t").encode()
+        csv_file.write_bytes(zstandard.ZstdCompressor().compress(tsv))
+
+        assert stream_csv(csv_file, ["bytes"]).columns["bytes"].tolist() == [
+            10,
+            20,
+            30,
+        ]
+
+    def test_zstd_without_module_raises_hint(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, "compression.zstd", None)
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+        csv_file = tmp_path / "log.csv.zst"
+        csv_file.write_bytes(b"\x28\xb5\x2f\xfd" + b"\0" * 8)
+
+        with pytest.raises(ImportError, match="pip install zstandard"):
+            stream_csv(csv_file, ["latency"])
+
+    @pytest.mark.parametrize("chunk_rows", [2, 4096])
+    def test_malformed_rows_reported_and_skipped(
+        self, tmp_path, monkeypatch, chunk_rows
+    ):
+        monkeypatch.setattr(data_loader, "CHUNK_ROWS", chunk_rows)
+        csv_file = tmp_path / "log.csv"
+        csv_file.write_text("ts,latency\nt1,1\nt2\n\nt4,oops\nt5,5\nt6,6,extra\n")
+
+        result = stream_csv(csv_file, ["latency"], label_col="ts")
+
+        assert result.columns["latency"].tolist() == [1.0, 5.0, 6.0]
+        assert result.labels == ["t1", "t5", "t6"]
+        assert result.bad_rows == [
+            BadRow(2, "expected 2 fields, got 1"),
+            BadRow(4, "Invalid numeric value in column 'latency': oops"),
+        ]
+
+    def test_bad_row_report_is_capped(self, tmp_path):
+        csv_file = tmp_path / "log.csv"
+        csv_file.write_text("v\n" + "x\n" * 50 + "1\n")
+
+        result = stream_csv(csv_file, ["v"], max_bad_rows=5)
+
+        assert result.bad_row_count == 50
+        assert len(result.bad_rows) == 5
+        assert result.columns["v"].tolist() == [1.0]
+
+    def test_errors_raise(self, tmp_path):
+        csv_file = tmp_path / "log.csv"
+        csv_file.write_text("v\n1\nx\n")
+
+        with pytest.raises(ValueError, match="Row 2: Invalid numeric value"):
+            stream_csv(csv_file, ["v"], errors="raise")
+
+    def test_missing_column(self, tmp_path):
+        csv_file = tmp_path / "log.csv"
+        csv_file.write_text(self.CSV)
+
+        with pytest.raises(ValueError, match="Column 'status' not found"):
+            stream_csv(csv_file, ["status"])
+
+    def test_columns_chart_directly(self, tmp_path):
+        csv_file = tmp_path / "log.csv"
+        csv_file.write_text(self.CSV)
+        result = stream_csv(csv_file, ["latency"], label_col="ts")
+
+        chart = LineChart(data=result.columns["latency"], labels=result.labels)
+        expected = LineChart(data=[1.5, 2.5, 3.5], labels=["t1", "t2", "t3"])
+
+        assert chart.html == expected.html
+
+
+class TestBinaryFormats:
+    """Tests for memory-mapped .npy/.npz and Arrow/Parquet input."""
+
+    def test_npy_is_viewed_in_place(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        values = np.linspace(0, 1, 1000)
+        np.save(tmp_path / "signal.npy", values)
+
+        columns = load_columns(tmp_path / "signal.npy")
+
+        assert list(columns) == ["signal"]
+        assert isinstance(columns["signal"], SeriesView)
+        assert np.array_equal(np.asarray(columns["signal"]), values)
+
+    def test_npy_2d_rows_and_byte_order(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        np.save(tmp_path / "grid.npy", np.arange(6, dtype=">i4").reshape(2, 3))
+
+        columns = load_columns(tmp_path / "grid.npy")
+
+        assert {k: v.tolist() for k, v in columns.items()} == {
+            "grid_0": [0, 1, 2],
+            "grid_1": [3, 4, 5],
+        }
+
+    @pytest.mark.parametrize("save", ["savez", "savez_compressed"])
+    def test_npz_members(self, tmp_path, save):
+        np = pytest.importorskip("numpy")
+        getattr(np, save)(
+            tmp_path / "metrics.npz",
+            cpu=np.array([0.5, 0.75]),
+            hits=np.array([3, 4], dtype=np.int16),
+        )
+
+        columns = load_columns(tmp_path / "metrics.npz")
+
+        assert {k: v.tolist() for k, v in columns.items()} == {
+            "cpu": [0.5, 0.75],
+            "hits": [3, 4],
+        }
+
+    def test_npz_renders_like_lists(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        values = np.sin(np.arange(200) / 10)
+        np.savez(tmp_path / "wave.npz", y=values)
+
+        chart = LineChart(data=load_columns(tmp_path / "wave.npz")["y"])
+
+        assert chart.html == LineChart(data=values.tolist()).html
+
+    def test_load_data_single_column(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        np.save(tmp_path / "sales.npy", np.array([10.0, 20.0]))
+
+        x, y, labels = load_data(tmp_path / "sales.npy")
+
+        assert (x, y, labels) == (["0", "1"], [10.0, 20.0], ["sales"])
+
+    def test_load_data_requires_y_col_for_several(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        np.savez(tmp_path / "m.npz", a=np.ones(2), b=np.zeros(2))
+
+        with pytest.raises(ValueError, match="y_col is required"):
+            load_data(tmp_path / "m.npz")
+        with pytest.raises(ValueError, match="not found"):
+            load_data(tmp_path / "m.npz", y_col="c")
+        assert load_data(tmp_path / "m.npz", y_col="b")[1] == [0.0, 0.0]
+
+    @pytest.mark.parametrize("dtype", ["<f2", ">f2"])
+    def test_npy_float16_is_decoded(self, tmp_path, dtype):
+        np = pytest.importorskip("numpy")
+        np.save(tmp_path / "half.npy", np.array([0.5, 1.5, -2.25], dtype=dtype))
+        np.save(tmp_path / "grid.npy", np.arange(4, dtype=dtype).reshape(2, 2))
+
+        half = load_columns(tmp_path / "half.npy")
+        grid = load_columns(tmp_path / "grid.npy")
+
+        assert half["half"].tolist() == [0.5, 1.5, -2.25]
+        assert {k: v.tolist() for k, v in grid.items()} == {
+            "grid_0": [0.0, 1.0],
+            "grid_1": [2.0, 3.0],
+        }
+        assert load_data(tmp_path / "half.npy")[1] == [0.5, 1.5, -2.25]
+
+    def test_unsupported_dtype(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        np.save(tmp_path / "names.npy", np.array(["a", "b"]))
+
+        with pytest.raises(ValueError, match="Unsupported dtype"):
+            load_columns(tmp_path / "names.npy")
+
+    @pytest.mark.parametrize("shape", [(0,), (0, 3), (3, 0)])
+    def test_empty_array(self, tmp_path, shape):
+        np = pytest.importorskip("numpy")
+        np.save(tmp_path / "empty.npy", np.zeros(shape))
+
+        with pytest.raises(ValueError, match="is empty"):
+            load_columns(tmp_path / "empty.npy")
+
+    def test_not_an_npy_file(self, tmp_path):
+        path = tmp_path / "fake.npy"
+        path.write_bytes(b"label,value\n")
+
+        with pytest.raises(ValueError, match="Not a .npy file"):
+            load_columns(path)
+
+    def test_arrow_and_parquet(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        feather = pytest.importorskip("pyarrow.feather")
+        parquet = pytest.importorskip("pyarrow.parquet")
+        table = pa.table({"day": ["Mon", "Tue"], "visits": [120, 95]})
+        feather.write_feather(table, tmp_path / "t.feather")
+        parquet.write_table(table, tmp_path / "t.parquet")
+
+        for name in ("t.feather", "t.parquet"):
+            columns = load_columns(tmp_path / name)
+            assert columns["day"] == ["Mon", "Tue"]
+            assert columns["visits"].tolist() == [120, 95]
+
+    def test_arrow_requires_pyarrow(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        path = tmp_path / "t.parquet"
+        path.write_bytes(b"PAR1")
+
+        with pytest.raises(ImportError, match="pip install pyarrow"):
+            load_columns(path)
@@ -0,0 +1,59 @@
+"""Tests for the shared label placement engine."""
+
+import math
+import random
+
+from charted.utils.label_placement import (
+    LabelPlacer,
+    LabelRequest,
+    boxes_collide,
+)
+
+
+class TestBoxesCollide:
+    def test_overlap_and_touch(self):
+        assert boxes_collide((0, 0, 10, 10), (5, 5, 15, 15))
+        # Boxes sharing an edge do not collide.
+        assert not boxes_collide((0, 0, 10, 10), (10, 0, 20, 10))
+
+    def test_tolerance(self):
+        a, b = (0, 0, 10, 10), (9.5, 0, 20, 10)
+        assert boxes_collide(a, b)
+        assert not boxes_collide(a, b, tolerance=(1.0, 0.0))
+
+
+class TestLabelPlacer:
+    def test_matches_all_pairs_greedy(self):
+        rng = random.Random(3)
+        boxes = []
+        for _ in range(400):
+            x, y = rng.uniform(0, 800), rng.uniform(0, 600)
+            boxes.append((x, y, x + rng.uniform(10, 60), y + 12))
+        kept = []
+        for box in boxes:
+            if not any(boxes_collide(box, k) for k in kept):
+                kept.append(box)
+        placer = LabelPlacer()
+        placed = [box for box in boxes if placer.place(box)]
+        assert placed == kept
+        assert placer.boxes == kept
+
+    def test_bounds(self):
+        placer = LabelPlacer(bounds=(-math.inf, 0.0, math.inf, 100.0))
+        assert not placer.place((0, -1, 10, 10))
+        assert placer.place((1000, 0, 1010, 100))
+
+    def test_place_first_falls_back_through_candidates(self):
+        placer = LabelPlacer()
+        placer.add((0, 0, 10, 10))
+        assert placer.place_first([(5, 0, 15, 10), (20, 0, 30, 10)]) == 1
+        assert placer.place_first([(0, 0, 10, 10)]) is None
+        assert placer.place_first([(0, 0, 10, 10)], required=True) == 0
+
+    def test_place_all_honours_priority(self):
+        requests = [
+            LabelRequest(candidates=[(0, 0, 10, 10)]),
+            LabelRequest(candidates=[(5, 0, 15, 10)], priority=1.0),
+            LabelRequest(candidates=[(20, 0, 30, 10)]),
+        ]
+        assert LabelPlacer().place_all(requests) == [None, 0, 0]
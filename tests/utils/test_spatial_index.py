@@ -0,0 +1,47 @@
+"""Tests for the uniform-grid spatial index."""
+
+import random
+
+from charted.utils.spatial_index import GridIndex
+
+
+def _brute_force(points, x, y, reach_x, reach_y):
+    return sorted(
+        k
+        for k, (px, py) in points.items()
+        if abs(px - x) <= reach_x and abs(py - y) <= reach_y
+    )
+
+
+class TestGridIndex:
+    def test_query_is_superset_of_neighbours(self):
+        rng = random.Random(7)
+        index = GridIndex(20.0, 8.0)
+        points = {}
+        for k in range(300):
+            points[k] = (rng.uniform(-200, 200), rng.uniform(-100, 100))
+            index.insert(k, *points[k])
+        for _ in range(100):
+            x, y = rng.uniform(-200, 200), rng.uniform(-100, 100)
+            found = index.query(x, y, 25.0, 9.0)
+            assert found == sorted(found)
+            assert set(_brute_force(points, x, y, 25.0, 9.0)) <= set(found)
+            # Only the cells around the probe are visited.
+            assert len(found) < len(points) // 4
+
+    def test_move_and_remove(self):
+        index = GridIndex(10.0, 10.0)
+        index.insert(0, 5.0, 5.0)
+        index.insert(1, 5.0, 5.0)
+        index.move(0, 500.0, 500.0)
+        assert index.query(5.0, 5.0, 1.0, 1.0) == [1]
+        assert index.query(500.0, 500.0, 1.0, 1.0) == [0]
+        index.remove(1)
+        assert index.query(5.0, 5.0, 1.0, 1.0) == []
+        assert len(index) == 1
+
+    def test_wide_probe_scans_occupied_cells(self):
+        index = GridIndex(1.0, 1.0)
+        index.insert(3, 0.5, 0.5)
+        index.insert(1, 9e6, 9e6)
+        assert index.query(0.0, 0.0, 1e7, 1e7) == [1, 3]
@@ -181,3 +181,65 @@ class TestThemeManagerEdgeCases:
 
         assert original.colors == original_colors  # Unchanged
         assert theme is original  # Returns same reference
+
+
+class TestThemeInterning:
+    """Resolved themes are shared instead of rebuilt per chart."""
+
+    def test_repeat_load_returns_same_instance(self):
+        """The same request resolves once and returns the shared theme."""
+        first = ThemeManager.load_theme("dark", "bar", ["#123456", "#654321"])
+        second = ThemeManager.load_theme("dark", "bar", ["#123456", "#654321"])
+
+        assert first is second
+        assert first.colors == ["#123456", "#654321"]
+
+    def test_many_loads_construct_one_theme(self, monkeypatch):
+        """10k identical loads construct a single Theme."""
+        built = []
+        original = Theme.__post_init__
+
+        def counting_post_init(self):
+            built.append(self)
+            original(self)
+
+        ThemeManager.load_theme("light", colors=["#010203"])
+        monkeypatch.setattr(Theme, "__post_init__", counting_post_init)
+        for _ in range(10_000):
+            ThemeManager.load_theme("light", colors=["#010203"])
+            ThemeManager.load_theme({"title_color": "#102030"}, colors=["#010203"])
+
+        assert len(built) <= 2
+
+    def test_int_and_float_values_kept_apart(self):
+        """Values that compare equal but render differently are not shared."""
+        as_int = ThemeManager.load_theme({"legend_font_size": 12}, colors=["#abc"])
+        as_float = ThemeManager.load_theme({"legend_font_size": 12.0}, colors=["#abc"])
+
+        assert as_int is not as_float
+        assert isinstance(as_float.legend_font_size, float)
+
+    def test_reregistered_name_is_not_stale(self):
+        """Registering a new theme under a name replaces the interned result."""
+        from charted.themes.registry import _registered_themes, register_theme
+
+        try:
+            register_theme("interned", Theme(title_color="#111111"))
+            first = ThemeManager.load_theme("interned", colors=["#abc"])
+            register_theme("interned", Theme(title_color="#222222"))
+            second = ThemeManager.load_theme("interned", colors=["#abc"])
+        finally:
+            _registered_themes.pop("interned", None)
+
+        assert first.title_color == "#111111"
+        assert second.title_color == "#222222"
+
+    def test_apply_overrides_is_interned(self):
+        """The same overrides on the same theme compose once."""
+        base = Theme.from_preset("light")
+
+        first = ThemeManager.apply_overrides(base, {"title_color": "#333333"})
+        second = ThemeManager.apply_overrides(base, {"title_color": "#333333"})
+
+        assert first is second
+        assert first.title_color == "#333333"
@@ -0,0 +1,89 @@
+"""Tests for the array-at-a-time projection helpers.
+
+Both engines (NumPy and the pure-Python fallback) must produce exactly the
+coordinates the scalar ``Axis.reproject`` path produces.
+"""
+
+import random
+
+import pytest
+
+from charted.charts.bar import BarChart
+from charted.charts.line import LineChart
+from charted.charts.scatter import ScatterChart
+from charted.utils import vectorized
+from charted.utils.vectorized import project_linear, project_log, stack_offsets
+
+N = vectorized.NUMPY_MIN_SIZE * 4
+
+
+def _values(n: int = N, low: float = -50.0, high: float = 150.0) -> list[float]:
+    rng = random.Random(3)
+    return [rng.uniform(low, high) for _ in range(n)]
+
+
+@pytest.fixture
+def pure_python(monkeypatch):
+    monkeypatch.setenv("CHARTED_NO_NUMPY", "1")
+
+
+class TestEngines:
+    @pytest.mark.skipif(not vectorized.HAS_NUMPY, reason="numpy not installed")
+    @pytest.mark.parametrize("stacked", [False, True])
+    @pytest.mark.parametrize("mirror", [False, True])
+    def test_linear_engines_identical(self, monkeypatch, stacked, mirror):
+        values = _values()
+        fast = project_linear(values, -50, 150, 420.5, stacked, mirror)
+        monkeypatch.setenv("CHARTED_NO_NUMPY", "1")
+        assert project_linear(values, -50, 150, 420.5, stacked, mirror) == fast
+
+    @pytest.mark.skipif(not vectorized.HAS_NUMPY, reason="numpy not installed")
+    def test_log_engines_identical(self, monkeypatch):
+        values = _values(low=0.01, high=1e6)
+        fast = project_log(values, 0.01, 1e6, 300)
+        monkeypatch.setenv("CHARTED_NO_NUMPY", "1")
+        assert project_log(values, 0.01, 1e6, 300) == fast
+
+    @pytest.mark.skipif(not vectorized.HAS_NUMPY, reason="numpy not installed")
+    def test_stack_offsets_engines_identical(self, monkeypatch):
+        rows = [_values() for _ in range(4)]
+        fast = stack_offsets(rows)
+        monkeypatch.setenv("CHARTED_NO_NUMPY", "1")
+        assert stack_offsets(rows) == fast
+
+    def test_stack_offsets_ragged_rows(self):
+        assert stack_offsets([[1, -2, 3], [4, -5]]) == [[0, 0, 0], [1, -2]]
+
+    def test_zero_range_projects_to_origin(self):
+        assert project_linear([5.0] * 3, 5, 5, 100) == [0.0, 0.0, 0.0]
+
+    def test_log_rejects_non_positive(self):
+        with pytest.raises(ValueError, match="non-positive"):
+            project_log([1.0, 0.0], 1, 10, 100)
+
+
+class TestAxisParity:
+    """``reproject_many`` must match ``reproject`` value for value."""
+
+    def _check(self, chart):
+        for axis, rows in ((chart.x_axis, chart.x_data), (chart.y_axis, chart.y_data)):
+            for row in rows or []:
+                if row and isinstance(row[0], (int, float)):
+                    assert axis.reproject_many(row) == [axis.reproject(v) for v in row]
+
+    @pytest.mark.parametrize("engine", ["numpy", "python"])
+    def test_scatter(self, monkeypatch, engine):
+        if engine == "python":
+            monkeypatch.setenv("CHARTED_NO_NUMPY", "1")
+        self._check(ScatterChart(x_data=_values(), y_data=_values()))
+
+    def test_log_line(self):
+        chart = LineChart(data=_values(low=1, high=1e5), y_scale="log")
+        self._check(chart)
+
+    def test_stacked_bar(self, pure_python):
+        chart = BarChart(data=[_values(50), _values(50)])
+        self._check(chart)
+
+    def test_single_point(self):
+        self._check(ScatterChart(x_data=[3], y_data=[4]))